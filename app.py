@@ -77,6 +77,30 @@ def _cached_list_fonts():
     return list_thumbnail_fonts()
 
 
+def _promote_draft_in_session() -> bool:
+    """세션의 초안 영상을 같은 선택으로 최종 화질 렌더링해 video_path 교체. 성공 여부 반환."""
+    from modules.tarot_video_generator import promote_draft_video
+
+    meta = st.session_state.get("tarot_metadata") or {}
+    choices = meta.get("render_choices")
+    if not choices:
+        st.warning("초안 정보가 없습니다. 영상을 새로 생성해 주세요.")
+        return False
+    draft_path = Path(st.session_state.video_path)
+    final_path = draft_path.with_name(draft_path.name.replace("_draft", ""))
+    if final_path == draft_path:
+        final_path = draft_path.with_name(f"{draft_path.stem}_final{draft_path.suffix}")
+    with st.spinner("🎞️ 최종 화질로 렌더링 중... (약 1~2분)"):
+        try:
+            st.session_state.video_path = promote_draft_video(choices, str(final_path))
+        except Exception as e:
+            st.error(f"❌ 최종 렌더링 실패: {e}")
+            return False
+    meta["draft"] = False
+    st.session_state.tarot_metadata = meta
+    return True
+
+
 # 페이지 설정
 st.set_page_config(
     page_title="운세 Shorts 자동 생성기",
@@ -259,6 +283,13 @@ with tab1:
                 key="hook_duration_sec",
             )
 
+    draft_preview = st.checkbox(
+        "⚡ 초안 미리보기 (저화질, 수 초 완성)",
+        value=False,
+        help="540p·15fps로 먼저 만들어 빠르게 확인. 마음에 들면 같은 카드·배경·문구로 최종 화질 렌더링합니다.",
+        key="draft_preview",
+    )
+
     if st.button("🎬 타로 영상 생성하기", type="primary", use_container_width=True):
         from modules.tarot_video_generator import generate_tarot_video
 
@@ -275,9 +306,9 @@ with tab1:
         music_path = config.get_random_music_path()
 
         timestamp = start_time.strftime("%Y%m%d_%H%M%S")
-        output_path = config.OUTPUT_DIR / f"tarot_{timestamp}.mp4"
+        output_path = config.OUTPUT_DIR / (f"tarot_{timestamp}_draft.mp4" if draft_preview else f"tarot_{timestamp}.mp4")
 
-        with st.spinner("🎥 타로 영상 생성 중... (약 1~2분 소요)"):
+        with st.spinner("🎥 초안 영상 생성 중... (수 초)" if draft_preview else "🎥 타로 영상 생성 중... (약 1~2분 소요)"):
             try:
                 ft = random.choice(["건강운", "애정운", "금전운", "의사결정"]) if (use_minor_arcana and minor_fortune_type == "랜덤") else minor_fortune_type
                 video_path, theme_name, metadata_extra = generate_tarot_video(
@@ -290,6 +321,7 @@ with tab1:
                     major_theme=major_theme,
                     hook_duration_sec=hook_duration,
                     hook_text_override=selected_title,
+                    draft=draft_preview,
                 )
                 st.session_state.video_path = video_path
                 st.session_state.fortune_type = theme_name
@@ -303,6 +335,7 @@ with tab1:
                     "hook_duration": hook_duration,
                     "background_path": background_path,
                     "music_path": music_path,
+                    "draft": draft_preview,
                 }
                 deck_label = "마이너 56장" if use_minor_arcana else "메이저 22장"
                 n_cards = metadata_extra.get("num_cards") or getattr(config, "NUM_CARDS", 6)
@@ -393,26 +426,32 @@ with tab1:
             elif not (edited_hook and edited_hook.strip()):
                 st.warning("수정할 문구를 입력하세요.")
             else:
-                from modules.tarot_video_generator import generate_tarot_video
+                from modules.tarot_video_generator import generate_tarot_video, rerender_hook_video
 
                 imgs = list(config.IMAGES_DIR.glob("*.png")) + list(config.IMAGES_DIR.glob("*.jpg")) + list(config.IMAGES_DIR.glob("*.jpeg"))
                 bg = params.get("background_path") or (str(random.choice(imgs)) if imgs else None)
                 music = params.get("music_path") or config.get_random_music_path()
                 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-                out = config.OUTPUT_DIR / f"tarot_{ts}.mp4"
-                with st.spinner("🎥 첫 화면 문구 반영해 재생성 중... (약 1~2분)"):
+                draft = bool(card_meta.get("draft"))  # 최종 화질로 바꾼 뒤면 재생성도 최종 화질
+                out = config.OUTPUT_DIR / (f"tarot_{ts}_draft.mp4" if draft else f"tarot_{ts}.mp4")
+                with st.spinner("🎥 첫 화면 문구 반영해 재생성 중..."):
                     try:
-                        vp, tn, meta = generate_tarot_video(
-                            background_path=bg,
-                            music_path=music,
-                            output_path=str(out),
-                            time_slot_id=params.get("time_slot_id"),
-                            use_minor_arcana=params.get("use_minor_arcana", False),
-                            minor_fortune_type=params.get("minor_fortune_type"),
-                            major_theme=params.get("major_theme"),
-                            hook_duration_sec=params.get("hook_duration", 4),
-                            hook_text_override=edited_hook.strip(),
-                        )
+                        # 감성형이면 첫 화면만 다시 렌더링해 기존 영상에 이어 붙임 (카드·해석 그대로, 수 초)
+                        result = rerender_hook_video(st.session_state.video_path, edited_hook.strip(), str(out))
+                        if result is None:
+                            result = generate_tarot_video(
+                                background_path=bg,
+                                music_path=music,
+                                output_path=str(out),
+                                time_slot_id=params.get("time_slot_id"),
+                                use_minor_arcana=params.get("use_minor_arcana", False),
+                                minor_fortune_type=params.get("minor_fortune_type"),
+                                major_theme=params.get("major_theme"),
+                                hook_duration_sec=params.get("hook_duration", 4),
+                                hook_text_override=edited_hook.strip(),
+                                draft=draft,
+                            )
+                        vp, tn, meta = result
                         st.session_state.video_path = vp
                         st.session_state.fortune_type = tn
                         st.session_state.tarot_metadata = meta
@@ -447,10 +486,18 @@ with tab1:
                         st.error(f"❌ 재생성 실패: {e}")
                 st.rerun()
 
+        if card_meta.get("draft"):
+            st.info("⚡ 지금 보이는 영상은 초안(저화질)입니다. 승인하면 같은 내용으로 최종 화질 렌더링 후 업로드 탭에서 사용합니다.")
+            if st.button("🎞️ 최종 화질로 렌더링", use_container_width=True, key="btn_promote_draft"):
+                if _promote_draft_in_session():
+                    st.rerun()
+
         st.markdown("---")
         col1, col2 = st.columns(2)
         with col1:
             if st.button("✅ 마음에 들어요!", use_container_width=True):
+                if card_meta.get("draft") and not _promote_draft_in_session():
+                    st.stop()
                 st.session_state.approved = True
                 st.success("✅ 승인되었습니다! 메타데이터 탭으로 이동하세요.")
                 st.balloons()
@@ -1040,8 +1087,11 @@ with tab4:
         st.markdown("---")
         has_video = bool(st.session_state.get('video_path') and Path(st.session_state.get('video_path', '')).exists())
         has_title = bool((st.session_state.get('metadata', {}).get('title') or '').strip())
-        upload_disabled = not (has_video and has_title)
-        if upload_disabled:
+        is_draft = bool((st.session_state.get('tarot_metadata') or {}).get('draft'))
+        upload_disabled = not (has_video and has_title) or is_draft
+        if is_draft:
+            st.warning("⚠️ 초안(저화질) 영상은 업로드할 수 없습니다. 미리보기 탭에서 최종 화질로 렌더링해 주세요.")
+        elif upload_disabled:
             st.warning("⚠️ 영상과 제목이 있어야 업로드할 수 있습니다.")
         elif not st.session_state.get('selected_thumbnail'):
             st.caption("💡 썸네일 없이 업로드하면 YouTube가 영상 프레임을 자동으로 사용합니다.")
@@ -61,6 +61,17 @@ YOUTUBE_CLIENT_SECRETS = BASE_DIR / "client_secrets.json"
 VIDEO_WIDTH = 1080
 VIDEO_HEIGHT = 1920
 VIDEO_FPS = 30
+# 렌더 프로필: 같은 구도를 낮은 해상도로 (화면 배치는 1080x1920 기준 비율로 환산)
+RENDER_PROFILES = {
+    "1080p": (1080, 1920),
+    "720p": (720, 1280),   # 픽셀 수 1/2.25
+    "540p": (540, 960),    # 픽셀 수 1/4
+}
+RENDER_PROFILE = "1080p"
+# 초안 미리보기 (generate_tarot_video(draft=True)): 저해상도·저fps·ultrafast로 수 초 안에 확인 후 최종 렌더링
+DRAFT_RENDER_PROFILE = "540p"
+DRAFT_FPS = 15
+DRAFT_ENCODE_PRESET = "ultrafast"
 
 # 기존 숏츠: 6장 카드, 시간 단축 (~36초)
 NUM_CARDS = 6
@@ -70,7 +81,52 @@ VIDEO_DURATION = 36.0  # 6장 카드 버전
 # ultrafast / superfast / veryfast / faster / fast / medium / slow
 VIDEO_ENCODE_PRESET = "fast"
 VIDEO_ENCODE_THREADS = 0  # 0=자동(코어 수), 4~8 권장
-
+VIDEO_ENCODE_CRF = None   # None=x264 기본(23). 낮을수록 화질↑ 파일↑
+VIDEO_ENCODE_TUNE = None  # None 또는 "stillimage" (정지 화면이 많은 영상)
+# 인코더 프로필: scripts/autotune_encoder.py가 이 컴퓨터에서 프리셋×CRF×스레드×tune 격자를 재서 고른 설정.
+# 파일이 있으면 위 VIDEO_ENCODE_PRESET/THREADS/CRF/TUNE 대신 사용 (초안 프리셋은 그대로)
+ENCODER_PROFILE_ENABLED = True
+ENCODER_PROFILE_PATH = OUTPUT_DIR / "encoder_profile.json"
+ENCODER_AUTOTUNE_PRESETS = ("veryfast", "faster", "fast", "medium")
+ENCODER_AUTOTUNE_CRFS = (20, 23, 26)
+ENCODER_AUTOTUNE_MIN_SSIM = 0.995     # 기준 영상 대비 SSIM 하한 (미만인 설정은 후보에서 제외)
+ENCODER_AUTOTUNE_SIZE_WEIGHT = 1.0    # 점수 = 시간/최단 시간 + 가중치 × 크기/최소 크기
+VIDEO_ENCODE_JOBS = 1     # 구간별 병렬 인코딩 개수 (1=전체를 한 번에, 0=코어 수). 구간 파일은 재인코딩 없이 이어 붙임
+# 연속으로 똑같은 프레임(카드가 다 도착한 뒤, 깜빡임 정지 상태 등)은 한 장만 인코딩하고 길이를 늘림 (가변 프레임 레이트 mp4)
+VIDEO_DEDUPE_FRAMES = True
+# 인코더 백엔드: "ffmpeg" = ffmpeg에 원시 프레임 직접 전달 + 음악 동시 합성 (빠름)
+#               "moviepy" = 기존 MoviePy write_videofile (ffmpeg 실패 시 자동 폴백)
+VIDEO_ENCODER = "ffmpeg"
+FFMPEG_BINARY = os.getenv("FFMPEG_BINARY")  # 비우면 imageio-ffmpeg 내장 ffmpeg → PATH 순으로 사용
+
+# 카드 이미지 캐시 (덱·카드·크기별 리사이즈 결과를 메모리에 보관, 최대 개수)
+CARD_IMAGE_CACHE_SIZE = 128
+# 카드 뒤집기: 폭별 띠 이미지 캐시 개수, 원근(3D) 효과 사용 여부
+CARD_FLIP_CACHE_SIZE = 256
+CARD_FLIP_PERSPECTIVE = False
+# 텍스트 스프라이트 캐시 (한 번 그린 텍스트 블록 RGBA 보관, 최대 개수)
+TEXT_SPRITE_CACHE_SIZE = 256
+# 애니메이션 구간 병렬 렌더링 프로세스 수 (1=끔, 0=CPU 코어 수 전부)
+# Windows에서는 프로세스 시작 비용이 커서 짧은 영상은 오히려 느릴 수 있음
+RENDER_PROCESSES = 1
+RENDER_CHUNK_FRAMES = 4  # 작업 1개당 프레임 수 (클수록 전달 오버헤드↓, 공유 메모리 사용↑)
+# 구간 캐시: 카드와 무관한 구간(훅·모임·셔플·자리 이동·뒷면 선택·마지막 인사)을 인코딩한 파일 재사용
+SEGMENT_CACHE_ENABLED = True
+SEGMENT_CACHE_DIR = OUTPUT_DIR / "segment_cache"
+SEGMENT_CACHE_MAX_MB = 512  # 넘으면 오래 안 쓴 구간부터 삭제
+# 배경 캐시: 배경 이미지를 렌더 해상도로 리사이즈한 원시 배열(.npy)을 메모리 맵으로 재사용 (원본 mtime 바뀌면 재생성)
+BACKGROUND_CACHE_ENABLED = True
+BACKGROUND_CACHE_DIR = OUTPUT_DIR / "background_cache"
+BACKGROUND_CACHE_MAX_MB = 256  # 넘으면 오래 안 쓴 배경부터 삭제
+# 카드 아틀라스: 덱 78장+뒷면을 레이아웃 카드 크기별로 리사이즈해 파일 하나에 저장, 메모리 맵으로 읽음
+# (scripts/build_card_atlas.py로 덱·해상도별 1회 생성, 없으면 카드를 직접 디코딩)
+CARD_ATLAS_ENABLED = True
+CARD_ATLAS_DIR = OUTPUT_DIR / "card_atlas"
+CARD_ATLAS_MAX_MB = 512  # 넘으면 오래 안 쓴 아틀라스부터 삭제 (1080p 덱 하나 약 170MB)
+# 음악 분석 캐시: 배경음악 하이라이트 감지 결과(곡별 에너지 곡선)를 파일 해시+mtime별로 저장 (같은 곡은 다시 디코딩 안 함)
+MUSIC_ANALYSIS_CACHE_DIR = OUTPUT_DIR / "music_analysis"
+
+# 구간 길이(초). 구간 순서·렌더러·입력은 tarot_video_generator._build_timeline (modules/timeline.py 구간 명세)
 TAROT_SECTION_TIMES = {
     "hook": 1,               # 첫 화면 1초(문구 없음, 썸네일에만 표시) → 바로 카드 구간
     "cards_face": 3.5,       # 앞장 + 뒤집기
@@ -84,6 +140,7 @@ TAROT_SECTION_TIMES = {
     "cards_4_6": 3.5,        # 4~6번 카드 리딩 3.5초
     "segment_transition": 1.2,  # 구간 전환
     "closing": 4,            # 마지막 인사 + 구독/좋아요
+    "thumbnail_intro": 2.5,  # generate_tarot_video(thumbnail=...)일 때만: 맨 앞 썸네일 (무음, 음악은 그 뒤부터)
 }
 # 7~9번 구간 제거 (6장만 사용). 총 ~36초
 
@@ -107,18 +164,40 @@ FONT_SIZE_TITLE = 80
 FONT_SIZE_FORTUNE = 100
 
 
-def get_korean_font(size: int = 48, font_path: str | None = None) -> "ImageFont.FreeTypeFont":
-    """한글 지원 폰트 반환 (PIL ImageFont). font_path 지정 시 해당 폰트 사용."""
+# 폰트 캐시: (실제 경로, 크기)별 FreeTypeFont를 프로세스당 한 번만 파싱
+_font_cache: dict = {}
+_font_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _load_font(path: str, size: int) -> "ImageFont.FreeTypeFont":
     from PIL import ImageFont
+    key = (os.path.realpath(path), int(size))
+    font = _font_cache.get(key)
+    if font is not None:
+        _font_cache_stats["hits"] += 1
+        return font
+    font = ImageFont.truetype(key[0], key[1])  # 실패 시 예외 (캐시하지 않음)
+    _font_cache[key] = font
+    _font_cache_stats["misses"] += 1
+    return font
+
+
+def get_font_cache_stats() -> dict:
+    """폰트 캐시 통계 (hits, misses, size)"""
+    return {**_font_cache_stats, "size": len(_font_cache)}
+
+
+def get_korean_font(size: int = 48, font_path: str | None = None) -> "ImageFont.FreeTypeFont":
+    """한글 지원 폰트 반환 (PIL ImageFont). font_path 지정 시 해당 폰트 사용. 같은 (경로, 크기)는 캐시 재사용."""
     if font_path and os.path.exists(font_path):
         try:
-            return ImageFont.truetype(font_path, size)
+            return _load_font(font_path, size)
         except Exception:
             pass
     for path in FONT_FALLBACKS:
         if path and os.path.exists(path):
             try:
-                return ImageFont.truetype(path, size)
+                return _load_font(path, size)
             except Exception:
                 continue
     raise FileNotFoundError(
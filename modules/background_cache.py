@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+배경 이미지 준비 캐시 - 배경(JPG/PNG)을 렌더 해상도로 리사이즈한 RGB 원시 배열을 .npy로 저장해 두고
+np.load(mmap_mode="r")로 엽니다. 영상마다 디코딩 + LANCZOS 리사이즈를 다시 하지 않고 페이지 인만 함.
+캐시 키에 원본 mtime이 들어가 원본이 바뀌면 다시 만듦. 캐시 파일 mtime은 마지막 사용 시각이고
+BACKGROUND_CACHE_MAX_MB를 넘으면 오래 안 쓴 파일부터 삭제 (segment_cache와 같은 방식).
+size=None이면 원본 크기 그대로 (썸네일 배경), mode="RGBA"면 투명도 유지.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import config
+from modules.disk_cache import evict_lru
+
+BG_EXT = {".png", ".jpg", ".jpeg", ".webp"}
+
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def is_enabled() -> bool:
+    return bool(getattr(config, "BACKGROUND_CACHE_ENABLED", False))
+
+
+def get_cache_dir() -> Path:
+    return Path(getattr(config, "BACKGROUND_CACHE_DIR", config.OUTPUT_DIR / "background_cache"))
+
+
+def _cache_path(src: str, size: tuple[int, int] | None, mode: str, src_mtime_ns: int) -> Path:
+    spec = repr((os.path.realpath(src), tuple(size) if size else None, mode, src_mtime_ns))
+    name = hashlib.blake2b(spec.encode("utf-8"), digest_size=12).hexdigest()
+    suffix = f"{size[0]}x{size[1]}" if size else "orig"
+    return get_cache_dir() / f"{name}_{suffix}_{mode.lower()}.npy"
+
+
+def _decode(src: str, size: tuple[int, int] | None, mode: str = "RGB") -> np.ndarray:
+    img = Image.open(src).convert(mode)
+    if size:
+        img = img.resize(tuple(size), Image.Resampling.LANCZOS)
+    return np.asarray(img)
+
+
+def _save(path: Path, arr: np.ndarray) -> bool:
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(tmp, arr)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ 배경 캐시 저장 실패 (이번만 직접 디코딩): {e}")
+        tmp.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def load_background(
+    src: str | Path, size: tuple[int, int] | None = None, mode: str = "RGB",
+) -> np.ndarray | None:
+    """
+    배경 이미지 → (H, W, 3) uint8 읽기 전용 배열 (캐시 있으면 메모리 맵). size=(가로, 세로)면 LANCZOS 리사이즈.
+    mode="RGBA"면 (H, W, 4) (PNG 투명도 유지). 파일이 없으면 None. 캐시를 끄거나 저장할 수 없으면 매번 디코딩한 배열.
+    """
+    if not src or not os.path.exists(src):
+        return None
+    src = str(src)
+    if not is_enabled():
+        return _decode(src, size, mode)
+    path = _cache_path(src, size, mode, os.stat(src).st_mtime_ns)
+    try:
+        arr = np.load(path, mmap_mode="r")
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        _stats["hits"] += 1
+        return arr
+    except (OSError, ValueError):
+        pass
+    _stats["misses"] += 1
+    arr = _decode(src, size, mode)
+    if _save(path, arr):
+        evict()
+        try:
+            return np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            pass  # 예산보다 큰 파일이라 방금 지워졌으면 디코딩한 배열 그대로
+    return arr
+
+
+def evict(max_bytes: int | None = None) -> int:
+    """디스크 예산(BACKGROUND_CACHE_MAX_MB)을 넘으면 오래 안 쓴 파일부터 삭제. 삭제한 파일 수 반환."""
+    if max_bytes is None:
+        max_bytes = int(float(getattr(config, "BACKGROUND_CACHE_MAX_MB", 256)) * 1024 * 1024)
+    removed = evict_lru(get_cache_dir(), "*.npy", max_bytes)
+    _stats["evictions"] += removed
+    return removed
+
+
+def prepare_backgrounds(sizes: list[tuple[int, int]], folder: Path | None = None) -> int:
+    """폴더(기본 config.IMAGES_DIR)의 배경을 주어진 해상도들로 미리 캐시. 새로 만든 수 반환."""
+    folder = Path(folder or config.IMAGES_DIR)
+    if not folder.is_dir():
+        return 0
+    before = _stats["misses"]
+    for p in sorted(folder.iterdir()):
+        if p.is_file() and p.suffix.lower() in BG_EXT:
+            for size in sizes:
+                load_background(p, size)
+    return _stats["misses"] - before
+
+
+def get_background_cache_stats() -> dict:
+    """배경 캐시 통계 (hits, misses, evictions, files, size_mb)"""
+    cache_dir = get_cache_dir()
+    files = list(cache_dir.glob("*.npy")) if cache_dir.is_dir() else []
+    size = sum(p.stat().st_size for p in files if p.exists())
+    return {**_stats, "files": len(files), "size_mb": round(size / (1024 * 1024), 1)}
+
+
+def clear_background_cache() -> None:
+    for p in get_cache_dir().glob("*.npy"):
+        p.unlink(missing_ok=True)
+    _stats.update(hits=0, misses=0, evictions=0)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+카드 아틀라스 - 덱 하나의 카드 78장 + 뒷면(back.png)을 레이아웃이 쓰는 카드 크기별(그리드·3장 그리드·의미 화면·구간 전환)로
+미리 리사이즈해 원시 RGB 파일 하나(.atlas)에 이어 쓰고, 위치 인덱스(.json)를 따로 저장.
+렌더링·병렬 워커는 np.memmap으로 열어 페이지 캐시에서 바로 카드 픽셀을 읽음 (PNG 디코딩·리사이즈 없음).
+덱 카드 파일(이름·mtime)이나 크기 목록이 바뀌면 인덱스 서명이 달라져 다시 만들어야 함.
+만드는 것은 scripts/build_card_atlas.py (렌더링은 있으면 쓰고 없으면 카드를 직접 디코딩).
+CARD_ATLAS_MAX_MB를 넘으면 오래 안 쓴 아틀라스부터 삭제 (열 때 mtime 갱신).
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import config
+from modules.disk_cache import evict_lru
+from modules.tarot_deck import get_card_info_from_manifest
+
+# 아틀라스 형식이 바뀌면 올려서 예전 파일 무효화
+ATLAS_VERSION = 1
+
+_atlases: dict = {}   # (덱 경로, 크기 목록) → CardAtlas 또는 None(없음/오래됨)
+_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return bool(getattr(config, "CARD_ATLAS_ENABLED", False))
+
+
+def get_atlas_dir() -> Path:
+    return Path(getattr(config, "CARD_ATLAS_DIR", config.OUTPUT_DIR / "card_atlas"))
+
+
+class CardAtlas:
+    """메모리 맵 카드 아틀라스. get(카드 인덱스 또는 "back", (w, h)) → (h, w, 3) 읽기 전용 배열."""
+
+    def __init__(self, data_path: Path, index: dict):
+        self.path = data_path
+        self._entries = index["entries"]
+        self._data = np.memmap(data_path, dtype=np.uint8, mode="r", shape=(index["total"],))
+
+    def get(self, card, size: tuple[int, int]) -> np.ndarray | None:
+        offset = self._entries.get(_entry_key(card, size))
+        if offset is None:
+            return None
+        w, h = size
+        return self._data[offset: offset + w * h * 3].reshape(h, w, 3)
+
+
+def _entry_key(card, size: tuple[int, int]) -> str:
+    return f"{card}:{int(size[0])}x{int(size[1])}"
+
+
+def _deck_sources(deck_path: Path) -> list[tuple[object, Path, float]]:
+    """(카드 인덱스 또는 "back", 파일 경로, mtime) 목록"""
+    sources = []
+    for idx in range(78):
+        card = get_card_info_from_manifest(deck_path, idx)
+        if not card:
+            break
+        sources.append((idx, deck_path / card["file"], card["mtime"]))
+    back = deck_path / "back.png"
+    if back.exists():
+        sources.append(("back", back, back.stat().st_mtime))
+    return sources
+
+
+def _paths(deck_path: Path, sizes: tuple) -> tuple[Path, Path]:
+    spec = repr((os.path.realpath(deck_path), sizes))
+    name = f"{deck_path.name}_{hashlib.blake2b(spec.encode('utf-8'), digest_size=8).hexdigest()}"
+    atlas_dir = get_atlas_dir()
+    return atlas_dir / f"{name}.atlas", atlas_dir / f"{name}.json"
+
+
+def _signature(sources: list, sizes: tuple) -> str:
+    spec = repr((ATLAS_VERSION, [(k, p.name, m) for k, p, m in sources], sizes))
+    return hashlib.blake2b(spec.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _normalize_sizes(sizes) -> tuple:
+    return tuple(sorted({(int(w), int(h)) for w, h in sizes}))
+
+
+def open_card_atlas(deck_path: Path, sizes) -> CardAtlas | None:
+    """이미 만든 아틀라스 열기 (프로세스당 한 번, 이후 캐시). 없거나 덱이 바뀌었으면 None."""
+    sizes = _normalize_sizes(sizes)
+    key = (str(deck_path), sizes)
+    with _lock:
+        if key in _atlases:
+            return _atlases[key]
+    atlas = None
+    data_path, index_path = _paths(Path(deck_path), sizes)
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        if index.get("signature") == _signature(_deck_sources(Path(deck_path)), sizes):
+            atlas = CardAtlas(data_path, index)
+    except (OSError, ValueError):
+        atlas = None
+    if atlas is not None:
+        try:
+            os.utime(data_path)  # LRU 삭제용 사용 시각
+        except OSError:
+            pass
+    with _lock:
+        _atlases[key] = atlas
+    return atlas
+
+
+def build_card_atlas(deck_path: Path, sizes) -> CardAtlas | None:
+    """덱 카드 전부를 sizes 크기별로 리사이즈해 아틀라스 파일로 저장 (카드마다 디코딩 1번). 실패하면 None."""
+    deck_path = Path(deck_path)
+    sizes = _normalize_sizes(sizes)
+    sources = _deck_sources(deck_path)
+    if not sources:
+        return None
+    data_path, index_path = _paths(deck_path, sizes)
+    tmp = data_path.with_name(f"{data_path.name}.{os.getpid()}.tmp")
+    entries = {}
+    offset = 0
+    try:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            for card, path, _ in sources:
+                try:
+                    img = Image.open(path).convert("RGB")
+                except Exception:
+                    continue
+                for size in sizes:
+                    # _load_card_image와 같은 방식 (RGB 변환 → LANCZOS 리사이즈)
+                    arr = np.asarray(img.resize(size, Image.Resampling.LANCZOS), dtype=np.uint8)
+                    f.write(arr.tobytes())
+                    entries[_entry_key(card, size)] = offset
+                    offset += arr.nbytes
+        os.replace(tmp, data_path)
+        index = {"signature": _signature(sources, sizes), "total": max(1, offset), "entries": entries}
+        index_tmp = index_path.with_suffix(".json.tmp")
+        index_tmp.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(index_tmp, index_path)
+    except OSError as e:
+        print(f"⚠️ 카드 아틀라스 저장 실패 (카드를 직접 디코딩): {e}")
+        tmp.unlink(missing_ok=True)
+        return None
+    with _lock:
+        _atlases.pop((str(deck_path), sizes), None)
+    print(f"🗂️ 카드 아틀라스 생성: {deck_path.name} ({len(sources)}장 x {len(sizes)}크기, {offset / (1024 * 1024):.0f}MB)")
+    atlas = open_card_atlas(deck_path, sizes)
+    evict()
+    return atlas
+
+
+def evict(max_bytes: int | None = None) -> int:
+    """디스크 예산(CARD_ATLAS_MAX_MB)을 넘으면 오래 안 쓴 아틀라스부터 삭제 (인덱스 .json도 같이). 삭제한 수 반환."""
+    if max_bytes is None:
+        max_bytes = int(float(getattr(config, "CARD_ATLAS_MAX_MB", 512)) * 1024 * 1024)
+    atlas_dir = get_atlas_dir()
+    removed = evict_lru(atlas_dir, "*.atlas", max_bytes)
+    for index_path in atlas_dir.glob("*.json") if atlas_dir.is_dir() else []:
+        if not index_path.with_suffix(".atlas").exists():
+            index_path.unlink(missing_ok=True)
+    return removed
+
+
+def get_card_atlas(deck_path: Path, sizes, build: bool = False) -> CardAtlas | None:
+    """아틀라스 열기. 없거나 오래됐으면 build=True일 때 새로 만듦."""
+    if not is_enabled() or not deck_path:
+        return None
+    atlas = open_card_atlas(deck_path, sizes)
+    if atlas is None and build:
+        atlas = build_card_atlas(deck_path, sizes)
+    return atlas
+
+
+def clear_card_atlas_handles() -> None:
+    """열어 둔 아틀라스 핸들 비우기 (덱 파일을 교체한 경우 등 - 다음에 서명 다시 확인)"""
+    with _lock:
+        _atlases.clear()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+카드 뒤집기 엔진 - 카드가 뒤집히며 지나가는 폭(width)별 띠 이미지를 OpenCV로 한 번만 만들어 캐시.
+프레임마다 LANCZOS 리사이즈를 다시 하지 않음.
+config.CARD_FLIP_PERSPECTIVE=True면 원근 변환으로 3D처럼 보이게 (결과도 캐시되므로 프레임당 추가 비용 없음).
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+
+import config
+
+try:
+    import cv2
+except ImportError:  # opencv 미설치 시 PIL로 폴백
+    cv2 = None
+
+# 원근 효과: 뒤로 넘어가는 쪽 모서리를 최대 몇 %까지 줄일지 (폭이 0에 가까울 때 최대)
+PERSPECTIVE_DEPTH = 0.14
+
+_strip_cache: OrderedDict = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+_lock = threading.Lock()  # 구간별 병렬 인코딩 시 여러 스레드가 같은 캐시 사용
+
+
+def _card_fingerprint(card: np.ndarray) -> tuple:
+    """카드 배열 식별 키 (크기 + 전체 내용 해시). card_key를 모를 때만 (카드 한 장 수백 µs)."""
+    return card.shape, hashlib.blake2b(np.ascontiguousarray(card).data, digest_size=12).digest()
+
+
+def _resize(card: np.ndarray, width: int, height: int) -> np.ndarray:
+    if cv2 is not None:
+        return cv2.resize(card, (width, height), interpolation=cv2.INTER_AREA)
+    return np.asarray(Image.fromarray(card).resize((width, height), Image.Resampling.LANCZOS))
+
+
+def _perspective(card: np.ndarray, width: int, near_left: bool) -> np.ndarray:
+    """가로 폭 width로 눌린 카드를 사다리꼴로 변환 (먼 쪽 모서리가 짧아짐). RGBA 반환."""
+    h, w = card.shape[:2]
+    shrink = PERSPECTIVE_DEPTH * (1.0 - width / w) * h / 2
+    src = np.float32([[0, 0], [w, 0], [w, h], [0, h]])
+    if near_left:
+        dst = np.float32([[0, 0], [width, shrink], [width, h - shrink], [0, h]])
+    else:
+        dst = np.float32([[0, shrink], [width, 0], [width, h], [0, h - shrink]])
+    rgba = np.dstack([card, np.full((h, w), 255, dtype=np.uint8)])
+    m = cv2.getPerspectiveTransform(src, dst)
+    return cv2.warpPerspective(
+        rgba, m, (width, h), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0, 0)
+    )
+
+
+def flip_strip(card: np.ndarray, width: int, near_left: bool = True, card_key: tuple | None = None) -> np.ndarray:
+    """
+    카드(H, W, 3)를 가로 width로 눌린 띠 이미지로. (카드, 폭, 방향)별로 한 번만 계산하고 캐시.
+    원근 효과가 켜져 있으면 RGBA(모서리 투명), 아니면 RGB.
+    near_left: 원근 효과에서 가까운(긴) 모서리가 왼쪽인지 (뒤집기 전반부 True, 후반부 False).
+    card_key: 카드 식별 키 (예: (덱 경로, 카드 인덱스)). 없으면 배열 전체 해시.
+    """
+    h, w = card.shape[:2]
+    width = max(1, min(w, int(width)))
+    perspective = bool(getattr(config, "CARD_FLIP_PERSPECTIVE", False)) and cv2 is not None and width < w
+    ident = (card.shape, card_key) if card_key is not None else _card_fingerprint(card)
+    key = (ident, width, perspective and near_left, perspective)
+    with _lock:
+        strip = _strip_cache.get(key)
+        if strip is not None:
+            _strip_cache.move_to_end(key)
+            _stats["hits"] += 1
+            return strip
+        _stats["misses"] += 1
+    if width == w:
+        strip = np.ascontiguousarray(card)
+    elif perspective:
+        strip = _perspective(np.ascontiguousarray(card), width, near_left)
+    else:
+        strip = _resize(np.ascontiguousarray(card), width, h)
+    strip.flags.writeable = False
+    max_items = int(getattr(config, "CARD_FLIP_CACHE_SIZE", 256))
+    with _lock:
+        _strip_cache[key] = strip
+        while len(_strip_cache) > max_items:
+            _strip_cache.popitem(last=False)
+    return strip
+
+
+def get_flip_cache_stats() -> dict:
+    """띠 이미지 캐시 통계 (hits, misses, size)"""
+    return {"hits": _stats["hits"], "misses": _stats["misses"], "size": len(_strip_cache)}
+
+
+def clear_flip_cache() -> None:
+    with _lock:
+        _strip_cache.clear()
+        _stats.update(hits=0, misses=0)
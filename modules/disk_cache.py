@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+디스크 캐시 공통 - 캐시 폴더가 예산을 넘으면 오래 안 쓴 파일(mtime 순)부터 삭제 (LRU).
+구간 캐시·배경 캐시·카드 아틀라스가 같이 씀. 각 캐시는 사용할 때 파일 mtime을 갱신.
+"""
+from pathlib import Path
+
+
+def evict_lru(cache_dir: Path, pattern: str, max_bytes: int) -> int:
+    """cache_dir의 pattern 파일 합계가 max_bytes 이하가 될 때까지 오래된 것부터 삭제. 삭제한 파일 수 반환."""
+    cache_dir = Path(cache_dir)
+    if not cache_dir.is_dir():
+        return 0
+    entries = []
+    for p in cache_dir.glob(pattern):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, p in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            p.unlink()
+        except OSError:
+            # 다른 프로세스가 열고 있으면(Windows 메모리 맵 등) 다음 기회에
+            continue
+        total -= size
+        removed += 1
+    return removed
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+인코더 자동 조정 - 기준 숏츠 영상 하나를 x264 설정 격자(프리셋 × CRF × 스레드 수 × -tune stillimage)로
+다시 인코딩해 걸린 시간·파일 크기·화질(기준 영상 대비 SSIM)을 재고, 화질 하한(ENCODER_AUTOTUNE_MIN_SSIM)을
+넘는 설정 중 이 컴퓨터에 가장 좋은 것을 config.ENCODER_PROFILE_PATH(JSON)에 저장.
+시간은 디코딩한 mp4를 다시 인코딩해 잰 값 (중복 프레임 합치기가 켜져 있으면 기준 영상은 VFR).
+실제 렌더링의 원시 프레임 파이프·정지 화면 유지 인코딩과 같은 작업량은 아니므로 설정 간 비교용 근사치.
+저장된 프로필은 video_encoder가 자동으로 읽어 VIDEO_ENCODE_PRESET / VIDEO_ENCODE_THREADS 대신 씀
+(초안처럼 프리셋을 직접 넘기면 프리셋은 그대로). CPU 수가 다른 컴퓨터에서 만든 프로필은 무시.
+실행: python scripts/autotune_encoder.py
+"""
+import itertools
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import TypedDict
+
+import config
+
+# 프로필 형식이 바뀌면 올려서 예전 파일 무시
+PROFILE_VERSION = 1
+
+DEFAULT_PRESETS = ("veryfast", "faster", "fast", "medium")
+DEFAULT_CRFS = (20, 23, 26)
+DEFAULT_MIN_SSIM = 0.995
+DEFAULT_TUNES = (None, "stillimage")
+
+
+class EncoderProfile(TypedDict):
+    version: int
+    machine: dict        # {"cpu_count", "machine", "node"} - 다른 컴퓨터 프로필 구분
+    preset: str
+    crf: int | None      # None이면 x264 기본값(23)
+    tune: str | None     # None 또는 "stillimage"
+    threads: int         # 0=자동
+    seconds: float       # 기준 영상 인코딩 시간 (디코딩 시간 제외)
+    size_mb: float
+    ssim: float          # 기준 영상 대비 SSIM (1=같음)
+    reference: str       # 기준 영상 경로
+    created: str
+
+
+_cached: dict = {}   # 경로 → (mtime_ns, 프로필 또는 None)
+
+
+def is_enabled() -> bool:
+    return bool(getattr(config, "ENCODER_PROFILE_ENABLED", True))
+
+
+def get_profile_path() -> Path:
+    return Path(getattr(config, "ENCODER_PROFILE_PATH", config.OUTPUT_DIR / "encoder_profile.json"))
+
+
+def _machine() -> dict:
+    return {"cpu_count": os.cpu_count() or 1, "machine": platform.machine(), "node": platform.node()}
+
+
+def load_encoder_profile() -> EncoderProfile | None:
+    """이 컴퓨터용 저장 프로필 (없거나 끄거나 다른 컴퓨터 것이면 None). 파일이 바뀌면 다시 읽음."""
+    if not is_enabled():
+        return None
+    path = get_profile_path()
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    hit = _cached.get(str(path))
+    if hit and hit[0] == mtime:
+        return hit[1]
+    profile = None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") == PROFILE_VERSION and data.get("machine", {}).get("cpu_count") == _machine()["cpu_count"]:
+            profile = data
+    except (OSError, ValueError):
+        profile = None
+    _cached[str(path)] = (mtime, profile)
+    return profile
+
+
+def save_encoder_profile(profile: EncoderProfile) -> Path | None:
+    path = get_profile_path()
+    tmp = path.with_suffix(".json.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(profile, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ 인코더 프로필 저장 실패: {e}")
+        return None
+    _cached.pop(str(path), None)
+    return path
+
+
+def _thread_options() -> tuple[int, ...]:
+    """0(자동), 코어 절반, 코어 전부 (중복 제거)"""
+    n = os.cpu_count() or 1
+    return tuple(dict.fromkeys((0, max(1, n // 2), n)))
+
+
+def _timed_run(cmd: list[str]) -> float:
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True)
+    elapsed = time.perf_counter() - t0
+    if proc.returncode != 0:
+        err = proc.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"ffmpeg 실패: {err.strip()[-300:]}")
+    return elapsed
+
+
+def _ssim(exe: str, encoded: Path, reference: str) -> float:
+    """기준 영상 대비 SSIM (ffmpeg ssim 필터의 All 값)"""
+    proc = subprocess.run(
+        [exe, "-nostats", "-i", str(encoded), "-i", reference, "-lavfi", "[0:v][1:v]ssim", "-f", "null", "-"],
+        stdin=subprocess.DEVNULL, capture_output=True,
+    )
+    match = re.search(r"All:([0-9.]+)", proc.stderr.decode("utf-8", errors="replace"))
+    if proc.returncode != 0 or not match:
+        raise RuntimeError("SSIM 측정 실패")
+    return float(match.group(1))
+
+
+def _score(result: dict, fastest: float, smallest: float, size_weight: float) -> float:
+    """작을수록 좋음: 가장 빠른 설정 대비 시간 + size_weight × 가장 작은 파일 대비 크기"""
+    return result["seconds"] / fastest + size_weight * result["size_mb"] / smallest
+
+
+def autotune_encoder(
+    reference_path: str,
+    presets=None,
+    crfs=None,
+    threads=None,
+    tunes=None,
+    size_weight: float | None = None,
+    min_ssim: float | None = None,
+    save: bool = True,
+) -> tuple[EncoderProfile, list[dict]]:
+    """
+    기준 영상(reference_path)을 설정 격자로 다시 인코딩해 가장 좋은 설정을 고름 (save면 프로필 파일로 저장).
+    시간은 설정마다 잰 ffmpeg 시간에서 디코딩만 한 시간을 뺀 값. SSIM이 min_ssim(ENCODER_AUTOTUNE_MIN_SSIM)
+    미만인 설정은 버리고, 남은 것 중 점수(_score, ENCODER_AUTOTUNE_SIZE_WEIGHT)가 가장 좋은 것.
+    하한을 넘는 설정이 없으면 SSIM이 가장 높은 설정.
+    반환: (고른 프로필, 설정별 결과 목록)
+    """
+    from modules.video_encoder import get_ffmpeg_exe
+
+    exe = get_ffmpeg_exe()
+    if not exe:
+        raise RuntimeError("ffmpeg 실행 파일을 찾을 수 없습니다.")
+    presets = presets or getattr(config, "ENCODER_AUTOTUNE_PRESETS", DEFAULT_PRESETS)
+    crfs = crfs or getattr(config, "ENCODER_AUTOTUNE_CRFS", DEFAULT_CRFS)
+    threads = threads or _thread_options()
+    tunes = tunes or DEFAULT_TUNES
+    if size_weight is None:
+        size_weight = float(getattr(config, "ENCODER_AUTOTUNE_SIZE_WEIGHT", 1.0))
+    if min_ssim is None:
+        min_ssim = float(getattr(config, "ENCODER_AUTOTUNE_MIN_SSIM", DEFAULT_MIN_SSIM))
+
+    source = ["-i", str(reference_path), "-map", "0:v:0", "-an"]
+    decode_sec = _timed_run([exe, "-y", "-loglevel", "error"] + source + ["-f", "null", "-"])
+    grid = list(itertools.product(presets, crfs, threads, tunes))
+    print(f"🎛️ 인코더 자동 조정: {len(grid)}개 설정 (기준 영상 디코딩 {decode_sec:.1f}초)")
+
+    results = []
+    work_dir = Path(tempfile.mkdtemp(prefix="autotune_"))
+    try:
+        for i, (preset, crf, n_threads, tune) in enumerate(grid, start=1):
+            out = work_dir / "out.mp4"
+            cmd = [exe, "-y", "-loglevel", "error"] + source
+            cmd += ["-c:v", "libx264", "-preset", preset, "-crf", str(crf), "-pix_fmt", "yuv420p"]
+            if tune:
+                cmd += ["-tune", tune]
+            cmd += ["-threads", str(n_threads), str(out)]
+            seconds = max(0.001, _timed_run(cmd) - decode_sec)
+            result = {
+                "preset": preset, "crf": crf, "threads": n_threads, "tune": tune,
+                "seconds": round(seconds, 3), "size_mb": round(out.stat().st_size / (1024 * 1024), 3),
+                "ssim": round(_ssim(exe, out, str(reference_path)), 5),
+            }
+            results.append(result)
+            print(
+                f"  [{i}/{len(grid)}] {preset} crf={crf} threads={n_threads} tune={tune or '-'}: "
+                f"{result['seconds']:.2f}초, {result['size_mb']:.2f}MB, SSIM {result['ssim']:.4f}"
+            )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    passed = [r for r in results if r["ssim"] >= min_ssim]
+    if passed:
+        fastest = min(r["seconds"] for r in passed)
+        smallest = min(r["size_mb"] for r in passed)
+        best = min(passed, key=lambda r: _score(r, fastest, smallest, size_weight))
+    else:
+        print(f"⚠️ SSIM {min_ssim} 이상인 설정이 없어 화질이 가장 좋은 설정 선택")
+        best = max(results, key=lambda r: r["ssim"])
+    profile = EncoderProfile(
+        version=PROFILE_VERSION, machine=_machine(),
+        preset=best["preset"], crf=best["crf"], tune=best["tune"], threads=best["threads"],
+        seconds=best["seconds"], size_mb=best["size_mb"], ssim=best["ssim"],
+        reference=str(reference_path), created=time.strftime("%Y-%m-%d %H:%M:%S"),
+    )
+    print(
+        f"✅ 선택: {best['preset']} crf={best['crf']} threads={best['threads']} tune={best['tune'] or '-'} "
+        f"({best['seconds']:.2f}초, {best['size_mb']:.2f}MB, SSIM {best['ssim']:.4f})"
+    )
+    if save:
+        path = save_encoder_profile(profile)
+        if path:
+            print(f"💾 인코더 프로필 저장: {path}")
+    return profile, results
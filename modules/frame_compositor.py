@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+프레임 합성기 - 미리 할당한 uint8 프레임 버퍼 1개에 카드 스프라이트를 배열 슬라이싱으로 붙임.
+매 프레임 배경 전체를 복사하지 않고, 이전 프레임에서 카드가 덮었던 영역(dirty rect)만 배경으로 복원.
+"""
+import numpy as np
+from PIL import Image
+
+
+class FrameCompositor:
+    """
+    사용법:
+        comp = FrameCompositor(bg_image)
+        for ...:
+            comp.begin_frame()
+            comp.blit(card_arr, x, y)
+            yield comp.frame()   # 버퍼의 읽기 전용 뷰 (다음 begin_frame 전까지만 유효)
+    """
+
+    def __init__(self, background: Image.Image | np.ndarray):
+        bg = np.asarray(background.convert("RGB") if isinstance(background, Image.Image) else background, dtype=np.uint8)
+        self.background = bg
+        self.height, self.width = bg.shape[:2]
+        self._buf = bg.copy()
+        self._dirty: list[tuple[int, int, int, int]] = []
+
+    def begin_frame(self) -> None:
+        """직전 프레임에서 그린 영역만 배경으로 되돌림."""
+        for y0, y1, x0, x1 in self._dirty:
+            self._buf[y0:y1, x0:x1] = self.background[y0:y1, x0:x1]
+        self._dirty = []
+
+    def blit(self, sprite: np.ndarray, x: int, y: int, alpha: float = 1.0) -> None:
+        """
+        스프라이트(RGB 또는 RGBA uint8)를 (x, y)에 붙임. 화면 밖은 잘라냄. RGBA는 알파 합성.
+        alpha(0~1): 스프라이트 전체 투명도 (텍스트 페이드 등). 1이면 원래 알파 그대로.
+        """
+        if alpha <= 0:
+            return
+        h, w = sprite.shape[:2]
+        x, y = int(x), int(y)
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        src = sprite[y0 - y : y1 - y, x0 - x : x1 - x]
+        dst = self._buf[y0:y1, x0:x1]
+        fade = min(255, int(round(alpha * 255)))
+        if src.ndim == 3 and src.shape[2] == 4:
+            a = src[..., 3:4].astype(np.uint16)
+            if fade < 255:
+                a = (a * fade + 127) // 255
+            dst[:] = ((src[..., :3] * a + dst * (255 - a) + 127) // 255).astype(np.uint8)
+        elif fade < 255:
+            dst[:] = ((src.astype(np.uint16) * fade + dst * (255 - fade) + 127) // 255).astype(np.uint8)
+        else:
+            dst[:] = src
+        self._dirty.append((y0, y1, x0, x1))
+
+    def frame(self) -> np.ndarray:
+        """현재 프레임 (복사 없는 읽기 전용 뷰). 보관하려면 호출 측에서 copy()."""
+        view = self._buf.view()
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+화면 배치(레이아웃) - 기준 해상도 1080x1920에서 정한 위치·크기·글자 크기를 실제 프레임 크기 비율로 환산.
+영상 1개 렌더링에 한 번 만들어(get_layout) 모든 화면 함수가 같은 값을 씀.
+→ 720x1280, 540x960 렌더 프로필도 1080p와 같은 구도 (픽셀 수 2.25~4배 적음).
+"""
+import functools
+from typing import TypedDict
+
+import config
+
+BASE_WIDTH, BASE_HEIGHT = 1080, 1920
+
+
+class GridLayout(TypedDict):
+    """카드 N장 그리드 (3장=3x1, 6장=3x2, 9장=3x3). 테두리 안쪽 82%."""
+    cols: int
+    rows: int
+    card_w: int
+    card_h: int
+    gap: int
+    offset_x: int
+    offset_y: int
+    cells: list[tuple[int, int]]   # 카드별 좌상단
+
+
+class ReadingLayout(TypedDict):
+    """카드 3장 세로 배치 + 오른쪽 설명 (1~3번/4~6번 의미 화면, 구간 전환)"""
+    card_w: int
+    card_h: int
+    card_x: int
+    text_x: int
+    section_h: int
+    rows_y: list[int]              # 카드별 윗변 y
+
+
+class Layout:
+    """프레임 크기별 화면 배치. 값은 기준 해상도 px로 적고 px()로 환산."""
+
+    def __init__(self, width: int, height: int):
+        self.width = int(width)
+        self.height = int(height)
+        self.scale = min(self.width / BASE_WIDTH, self.height / BASE_HEIGHT)
+        self._cache: dict = {}
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.width, self.height
+
+    def px(self, value: float) -> int:
+        """기준 해상도 px → 현재 프레임 px (0이 아니면 최소 ±1)"""
+        if not value:
+            return 0
+        out = int(round(value * self.scale))
+        if out == 0:
+            return 1 if value > 0 else -1
+        return out
+
+    def grid(self, n_cards: int, gap: int = 28, card_size: tuple[int, int] | None = None) -> GridLayout:
+        """카드 N장 그리드. gap은 기준 px, card_size는 현재 프레임 px (지정 시 그 크기로 가운데 배치)."""
+        key = ("grid", n_cards, gap, card_size)
+        if key not in self._cache:
+            cols, rows = (3, 1) if n_cards == 3 else ((3, 2) if n_cards <= 6 else (3, 3))
+            g = self.px(gap)
+            if card_size is None:
+                cw = (int(self.width * 0.82) - (cols - 1) * g) // cols
+                ch = (int(self.height * 0.82) - (rows - 1) * g) // rows
+                if n_cards == 3:
+                    ch = int(ch * 0.7)  # 3장: 위아래 15%씩 높이 축소
+            else:
+                cw, ch = card_size
+            offset_x = (self.width - (cols * cw + (cols - 1) * g)) // 2
+            offset_y = (self.height - (rows * ch + (rows - 1) * g)) // 2
+            cells = [
+                (offset_x + (i % cols) * (cw + g), offset_y + (i // cols) * (ch + g))
+                for i in range(n_cards)
+            ]
+            self._cache[key] = GridLayout(
+                cols=cols, rows=rows, card_w=cw, card_h=ch, gap=g,
+                offset_x=offset_x, offset_y=offset_y, cells=cells,
+            )
+        return self._cache[key]
+
+    def reading(self, transition: bool = False) -> ReadingLayout:
+        """
+        카드 3장 + 의미 화면 배치. transition=True면 구간 전환 화면 (위아래 여백 120, 높이 보정 없음),
+        아니면 의미 화면 (여백 100, 카드 높이 15% 보정).
+        """
+        key = ("reading", transition)
+        if key not in self._cache:
+            card_w = self.px(225)
+            margin = self.px(120 if transition else 100)
+            section_h = (self.height - margin * 2) // 3
+            raw_h = section_h - self.px(6)
+            card_h = int(raw_h * card_w / self.px(280) * (1.0 if transition else 1.15))
+            card_x = self.px(90)
+            self._cache[key] = ReadingLayout(
+                card_w=card_w, card_h=card_h, card_x=card_x, text_x=card_x + card_w + self.px(20),
+                section_h=section_h,
+                rows_y=[margin + i * section_h + (section_h - card_h) // 2 for i in range(3)],
+            )
+        return self._cache[key]
+
+
+@functools.lru_cache(maxsize=8)
+def get_layout(width: int | None = None, height: int | None = None) -> Layout:
+    """프레임 크기별 레이아웃 (같은 크기는 한 번만 계산). 기본은 config.VIDEO_WIDTH x VIDEO_HEIGHT."""
+    return Layout(width or config.VIDEO_WIDTH, height or config.VIDEO_HEIGHT)
+
+
+def get_profile_size(profile: str | None = None) -> tuple[int, int]:
+    """렌더 프로필 이름 → (가로, 세로). 없는 이름이면 config.VIDEO_WIDTH x VIDEO_HEIGHT."""
+    profiles = getattr(config, "RENDER_PROFILES", {})
+    name = profile or getattr(config, "RENDER_PROFILE", None)
+    if name in profiles:
+        return tuple(profiles[name])
+    return config.VIDEO_WIDTH, config.VIDEO_HEIGHT
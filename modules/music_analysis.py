@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+배경음악 분석 캐시 - 곡 전체의 RMS 에너지 곡선(창 2초, 1초 간격)을 누적합으로 한 번에 계산해
+가장 큰 구간(보통 후렴/드롭) 시작 시각과 함께 .npz로 저장. 곡마다 한 번만 디코딩하고
+다음 영상부터는 하이라이트 선택이 파일 읽기뿐.
+캐시 파일은 곡 경로별 하나이고 (경로, 크기, mtime_ns)와 내용 해시를 같이 저장.
+크기·mtime이 그대로면 파일을 읽지 않고 바로 사용, 바뀌었을 때만 내용을 해시해 같으면 분석 재사용, 다르면 다시 분석.
+"""
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+from typing import TypedDict
+
+import numpy as np
+
+import config
+
+# 분석 방식이 바뀌면 올려서 예전 캐시 무효화
+ANALYSIS_VERSION = 2
+ANALYSIS_SAMPLE_RATE = 22050   # 에너지 곡선용 모노 디코딩 샘플레이트
+WINDOW_SEC = 2.0
+HOP_SEC = 1.0                  # 50% 오버랩 (기존 방식과 같음)
+
+_stats = {"hits": 0, "misses": 0}
+
+
+class MusicAnalysis(TypedDict):
+    envelope: np.ndarray   # 창별 RMS (float32), i번째 창은 i * hop_sec초부터
+    peak_start: float      # 가장 큰 창의 시작 시각(초)
+    duration: float        # 곡 길이(초)
+    sample_rate: int
+    window_sec: float
+    hop_sec: float
+
+
+def get_cache_dir() -> Path:
+    return Path(getattr(config, "MUSIC_ANALYSIS_CACHE_DIR", config.OUTPUT_DIR / "music_analysis"))
+
+
+def _cache_path(path: str) -> Path:
+    key = hashlib.blake2b(path.encode("utf-8"), digest_size=16).hexdigest()
+    return get_cache_dir() / f"{key}_v{ANALYSIS_VERSION}.npz"
+
+
+def _content_hash(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _decode_mono(path: str, sample_rate: int) -> np.ndarray:
+    from modules.video_encoder import get_ffmpeg_exe
+
+    exe = get_ffmpeg_exe()
+    if not exe:
+        raise RuntimeError("ffmpeg 실행 파일을 찾을 수 없습니다.")
+    proc = subprocess.run(
+        [exe, "-loglevel", "error", "-i", path, "-vn", "-ac", "1", "-ar", str(sample_rate), "-f", "f32le", "-"],
+        stdin=subprocess.DEVNULL, capture_output=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"음악 디코딩 실패: {proc.stderr.decode('utf-8', errors='replace').strip()[-300:]}")
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+def rms_envelope(samples: np.ndarray, window: int, hop: int) -> np.ndarray:
+    """창 길이 window, 간격 hop 샘플의 RMS 곡선 (제곱 누적합 차분, 창 개수 제한 없음)"""
+    if window <= 0 or len(samples) < window:
+        return np.zeros(0, dtype=np.float32)
+    csum = np.concatenate(([0.0], np.cumsum(samples.astype(np.float64) ** 2)))
+    starts = np.arange(0, len(samples) - window + 1, max(1, hop))
+    energy = (csum[starts + window] - csum[starts]) / window
+    return np.sqrt(np.maximum(energy, 0.0)).astype(np.float32)
+
+
+def _analyze(path: str) -> MusicAnalysis:
+    sr = ANALYSIS_SAMPLE_RATE
+    samples = _decode_mono(path, sr)
+    envelope = rms_envelope(samples, int(WINDOW_SEC * sr), int(HOP_SEC * sr))
+    peak_start = float(np.argmax(envelope)) * HOP_SEC if envelope.size else 0.0
+    return MusicAnalysis(
+        envelope=envelope, peak_start=peak_start, duration=len(samples) / sr,
+        sample_rate=sr, window_sec=WINDOW_SEC, hop_sec=HOP_SEC,
+    )
+
+
+def _save(path: Path, analysis: MusicAnalysis, src: str, st: os.stat_result, content_hash: str) -> None:
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            tmp, **analysis, src_path=src, src_size=st.st_size, src_mtime_ns=st.st_mtime_ns, content_hash=content_hash,
+        )
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ 음악 분석 캐시 저장 실패 (다음에 다시 분석): {e}")
+        tmp.unlink(missing_ok=True)
+
+
+def analyze_music(path: str | Path) -> MusicAnalysis:
+    """곡 분석 결과 (캐시에 있으면 읽기만, 없으면 디코딩·분석 후 저장)"""
+    path = os.path.realpath(path)
+    st = os.stat(path)
+    cache = _cache_path(path)
+    cached, content_hash = None, None
+    try:
+        with np.load(cache) as data:
+            cached = MusicAnalysis(
+                envelope=data["envelope"], peak_start=float(data["peak_start"]), duration=float(data["duration"]),
+                sample_rate=int(data["sample_rate"]), window_sec=float(data["window_sec"]), hop_sec=float(data["hop_sec"]),
+            )
+            same_stat = int(data["src_size"]) == st.st_size and int(data["src_mtime_ns"]) == st.st_mtime_ns
+            cached_hash = str(data["content_hash"])
+        if same_stat:
+            _stats["hits"] += 1
+            return cached
+        # 크기·mtime이 바뀐 경우만 내용 해시 (복사·touch로 mtime만 바뀌었으면 분석 재사용)
+        content_hash = _content_hash(path)
+        if content_hash == cached_hash:
+            _stats["hits"] += 1
+            _save(cache, cached, path, st, content_hash)
+            return cached
+    except (OSError, ValueError, KeyError):
+        pass
+    _stats["misses"] += 1
+    analysis = _analyze(path)
+    _save(cache, analysis, path, st, content_hash or _content_hash(path))
+    return analysis
+
+
+def highlight_start(path: str | Path, need_dur: float) -> float:
+    """가장 큰 소리 구간 시작(초). 영상 길이만큼 남도록 곡 끝 쪽이면 앞으로 당김."""
+    analysis = analyze_music(path)
+    max_start = max(0.0, analysis["duration"] - need_dur - 1)
+    return float(min(analysis["peak_start"], max_start))
+
+
+def get_music_analysis_stats() -> dict:
+    """음악 분석 캐시 통계 (hits, misses, files)"""
+    cache_dir = get_cache_dir()
+    files = list(cache_dir.glob("*.npz")) if cache_dir.is_dir() else []
+    return {**_stats, "files": len(files)}
+
+
+def clear_music_analysis_cache() -> None:
+    for p in get_cache_dir().glob("*.npz"):
+        p.unlink(missing_ok=True)
+    _stats.update(hits=0, misses=0)
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+구간 프레임 병렬 렌더링 - 프로세스 풀로 애니메이션 구간을 프레임 조각(RENDER_CHUNK_FRAMES장) 단위로 나눠 동시에 렌더링.
+- 디코딩된 배경·카드 뒷면·카드 앞면은 multiprocessing.shared_memory 블록 하나에 올려 워커가 복사 없이 참조
+- 워커는 렌더링한 프레임을 출력용 공유 메모리 슬롯에 쓰고, 부모는 조각 순서대로 꺼내 인코더에 스트리밍
+- 조각은 타임라인 순서대로 제출. 구간별 인코딩 스레드가 여러 구간을 동시에 읽어도 됨 (구간 안에서는 순서대로)
+config.RENDER_PROCESSES로 프로세스 수 지정 (1=끔, 0=CPU 코어 수 전부).
+
+구간은 video_encoder.frames_segment(..., task=(렌더러 함수 이름, 인자))로 만든 것만 병렬 처리하고
+나머지(정지 화면, task 없는 구간)는 그대로 둠.
+"""
+import os
+import threading
+from collections import deque
+from multiprocessing import get_context, shared_memory
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import numpy as np
+from PIL import Image
+
+import config
+from modules.video_encoder import Segment
+
+
+class _SharedRef(NamedTuple):
+    """렌더러 인자 중 공유 메모리에 올린 이미지/배열 자리표시 (워커에서 실제 값으로 바꿈)"""
+    name: str
+    pil: bool
+
+
+# ---------- 워커 프로세스 쪽 ----------
+
+_worker: dict = {}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # 워커는 부모의 resource_tracker를 같이 쓰므로 (fork/spawn 모두) 등록은 중복돼도 무해, 해제는 부모가 함
+    return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(
+    asset_block: str, index: dict, frame_shape: tuple, font_path: str | None, fps: int | None, deck_path: str | None,
+) -> None:
+    from modules import tarot_video_generator as tvg
+    from modules.layout import get_layout
+
+    shm = _attach(asset_block)
+    arrays = {}
+    for key, (offset, shape) in index.items():
+        arr = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=offset)
+        arr.flags.writeable = False
+        arrays[key] = arr
+        if isinstance(key, tuple):  # ("card", 덱, 카드 인덱스, 크기)
+            tvg._shared_card_images[key[1:]] = arr
+    tvg._video_font_path = font_path
+    tvg._video_layout = get_layout(frame_shape[1], frame_shape[0])
+    tvg._video_fps = fps
+    if deck_path:
+        # 카드 아틀라스는 워커마다 한 번 열어 두고 카드 로드마다 재사용
+        tvg._use_card_atlas(Path(deck_path), tvg._card_atlas(Path(deck_path)))
+    _worker.update(shm=shm, arrays=arrays, images={}, slots={}, frame_shape=frame_shape)
+
+
+def _resolve(value):
+    if not isinstance(value, _SharedRef):
+        return value
+    if not value.pil:
+        return _worker["arrays"][value.name]
+    img = _worker["images"].get(value.name)
+    if img is None:
+        img = Image.fromarray(_worker["arrays"][value.name])
+        _worker["images"][value.name] = img
+    return img
+
+
+def _render_chunk(renderer: str, kwargs: dict, start: int, stop: int, slot: str) -> int:
+    """renderer(**kwargs)의 start~stop 프레임을 출력 슬롯에 씀. 쓴 프레임 수 반환."""
+    from modules import tarot_video_generator as tvg
+
+    shm = _worker["slots"].get(slot)
+    if shm is None:
+        shm = _worker["slots"][slot] = _attach(slot)
+    out = np.ndarray((stop - start,) + _worker["frame_shape"], dtype=np.uint8, buffer=shm.buf)
+    kwargs = {k: _resolve(v) for k, v in kwargs.items()}
+    count = 0
+    for frame in getattr(tvg, renderer)(**kwargs, frame_range=(start, stop)):
+        if count >= len(out):
+            break
+        out[count] = frame
+        count += 1
+    return count
+
+
+# ---------- 부모 프로세스 쪽 ----------
+
+def get_render_processes() -> int:
+    """config.RENDER_PROCESSES 해석 (0=코어 수 전부). 1 이하면 병렬 렌더링 안 함."""
+    n = int(getattr(config, "RENDER_PROCESSES", 1) or 0)
+    if n <= 0:
+        n = os.cpu_count() or 1
+    return n
+
+
+class ParallelRenderer:
+    """
+    사용법:
+        with ParallelRenderer(segments, card_images, frame_shape, font_path, fps=fps) as pr:
+            encode_segments(pr.segments, output_path, ...)
+    card_images: {(덱 경로 문자열, 카드 인덱스, (w, h)): 배열} - 워커에서 디스크 디코딩 없이 쓰도록 공유
+    deck_path: 카드 아틀라스가 있는 덱이면 워커가 시작할 때 아틀라스를 직접 엶 (card_images 대신)
+    """
+
+    def __init__(
+        self,
+        segments: list[Segment],
+        card_images: dict,
+        frame_shape: tuple[int, int, int],
+        font_path: str | None = None,
+        processes: int | None = None,
+        fps: int | None = None,
+        deck_path: str | None = None,
+    ):
+        self.processes = processes or get_render_processes()
+        self.chunk_frames = max(1, int(getattr(config, "RENDER_CHUNK_FRAMES", 4)))
+        self.frame_shape = tuple(frame_shape)
+        self._font_path = font_path
+        self._fps = fps
+        self._deck_path = deck_path
+        self._arrays: dict = {("card",) + tuple(k): np.asarray(v) for k, v in card_images.items()}
+        self._shared_ids: dict[int, _SharedRef] = {}
+        self._chunks: deque = deque()  # 아직 제출 안 한 조각 (구간 번호, start, stop, renderer, kwargs)
+        self._chunk_starts: dict[int, list[int]] = {}
+        self.segments = [self._wrap(i, seg) for i, seg in enumerate(segments)]
+        self._pool = None
+        self._blocks: list[shared_memory.SharedMemory] = []
+        self._free_slots: deque = deque()
+        self._submitted: dict = {}  # (구간 번호, start) → (슬롯, AsyncResult)
+        self._started: set[int] = set()
+        self._cond = threading.Condition()
+
+    def _share(self, value):
+        """PIL 이미지/배열 인자는 공유 메모리로 보내고 자리표시로 바꿈 (같은 객체는 한 번만)"""
+        if not isinstance(value, (Image.Image, np.ndarray)):
+            return value
+        ref = self._shared_ids.get(id(value))
+        if ref is None:
+            is_pil = isinstance(value, Image.Image)
+            ref = _SharedRef(f"a{len(self._shared_ids)}", is_pil)
+            self._arrays[ref.name] = np.asarray(value.convert("RGB") if is_pil else value, dtype=np.uint8)
+            self._shared_ids[id(value)] = ref
+        return ref
+
+    def _wrap(self, seg_idx: int, seg: Segment) -> Segment:
+        if seg["kind"] != "frames" or not seg.get("task"):
+            return seg
+        renderer, kwargs = seg["task"]
+        kwargs = {k: self._share(v) for k, v in kwargs.items()}
+        for start in range(0, seg["n_frames"], self.chunk_frames):
+            stop = min(seg["n_frames"], start + self.chunk_frames)
+            self._chunks.append((seg_idx, start, stop, renderer, kwargs))
+            self._chunk_starts.setdefault(seg_idx, []).append(start)
+        fallback = seg["make_frames"]
+        return {**seg, "make_frames": lambda: self._iter_segment(seg_idx, fallback)}
+
+    def __enter__(self):
+        index, size = {}, 0
+        for key, arr in self._arrays.items():
+            index[key] = (size, arr.shape)
+            size += arr.nbytes
+        block = shared_memory.SharedMemory(create=True, size=max(1, size))
+        self._blocks.append(block)
+        for key, (offset, shape) in index.items():
+            np.ndarray(shape, dtype=np.uint8, buffer=block.buf, offset=offset)[:] = self._arrays[key]
+        self._arrays.clear()
+
+        slot_bytes = self.chunk_frames * int(np.prod(self.frame_shape))
+        for _ in range(self.processes * 2):
+            slot = shared_memory.SharedMemory(create=True, size=slot_bytes)
+            self._blocks.append(slot)
+            self._free_slots.append(slot)
+        self._pool = get_context().Pool(
+            self.processes,
+            initializer=_init_worker,
+            initargs=(block.name, index, self.frame_shape, self._font_path, self._fps, self._deck_path),
+        )
+        with self._cond:
+            self._submit()
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            pool, self._pool = self._pool, None
+            self._cond.notify_all()
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:  # 아직 남은 프레임 뷰가 있으면 GC에 맡김
+                pass
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks.clear()
+        return False
+
+    def _submit(self) -> None:
+        """빈 슬롯만큼 다음 조각 제출 (self._cond 잡은 상태에서 호출)"""
+        while self._pool is not None and self._chunks and self._free_slots:
+            seg_idx, start, stop, renderer, kwargs = self._chunks.popleft()
+            slot = self._free_slots.popleft()
+            res = self._pool.apply_async(_render_chunk, (renderer, kwargs, start, stop, slot.name))
+            self._submitted[(seg_idx, start)] = (slot, res)
+        self._cond.notify_all()
+
+    def _free(self, slot) -> None:
+        with self._cond:
+            self._free_slots.append(slot)
+            self._submit()
+
+    def _iter_segment(self, seg_idx: int, fallback) -> Iterator[np.ndarray]:
+        """seg_idx 구간 프레임을 조각 순서대로 yield. 같은 구간을 두 번 읽으면(되감기 등) 현재 프로세스에서 직접 렌더링."""
+        with self._cond:
+            first_read = self._pool is not None and seg_idx not in self._started
+            self._started.add(seg_idx)
+        if not first_read:
+            yield from fallback()
+            return
+        held = None
+        try:
+            for start in self._chunk_starts[seg_idx]:
+                # 다음 프레임을 요청받은 시점이면 직전 조각의 프레임 뷰는 인코더가 다 쓴 것 → 슬롯 반납
+                if held is not None:
+                    self._free(held)
+                    held = None
+                with self._cond:
+                    self._cond.wait_for(lambda: (seg_idx, start) in self._submitted or self._pool is None)
+                    if self._pool is None:
+                        raise RuntimeError("병렬 렌더러가 이미 종료되었습니다.")
+                    held, res = self._submitted.pop((seg_idx, start))
+                count = res.get()
+                frames = np.ndarray((self.chunk_frames,) + self.frame_shape, dtype=np.uint8, buffer=held.buf)
+                for j in range(count):
+                    view = frames[j]
+                    view.flags.writeable = False
+                    yield view
+        finally:
+            # 인코더가 구간을 끝까지 안 읽었으면 남은 조각은 버림
+            with self._cond:
+                self._chunks = deque(c for c in self._chunks if c[0] != seg_idx)
+                dropped = [self._submitted.pop(k) for k in list(self._submitted) if k[0] == seg_idx]
+            for slot, res in dropped:
+                res.wait()  # 워커가 슬롯에 다 쓴 뒤 반납
+            for slot in [held] + [slot for slot, _ in dropped]:
+                if slot is not None:
+                    self._free(slot)
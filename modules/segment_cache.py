@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+인코딩된 구간 캐시 - 카드·GPT 문구와 무관한 구간(훅, 중앙 모임, 셔플, 자리 이동, 뒷면 선택 화면, 마지막 인사)은
+배경·카드 뒷면·폰트·셔플 스타일·카드 수(+해상도·fps·코덱 설정)가 같으면 항상 같은 영상.
+→ 인코딩한 구간 파일을 입력 해시(내용 주소) 이름으로 config.SEGMENT_CACHE_DIR에 보관하고,
+  다음 영상에서는 렌더링·인코딩 없이 concat 스트림 복사로 재사용.
+디스크 예산(SEGMENT_CACHE_MAX_MB)을 넘으면 가장 오래 안 쓴 파일부터 삭제 (LRU, 사용 시 mtime 갱신).
+"""
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import config
+from modules.disk_cache import evict_lru
+
+# 구간 렌더링 방식이 바뀌면 올려서 예전 캐시 무효화
+CACHE_VERSION = 2
+
+_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return bool(getattr(config, "SEGMENT_CACHE_ENABLED", False))
+
+
+def get_cache_dir() -> Path:
+    return Path(getattr(config, "SEGMENT_CACHE_DIR", config.OUTPUT_DIR / "segment_cache"))
+
+
+def file_token(path) -> tuple | None:
+    """파일 식별값 (절대 경로, 크기, 수정 시각). 파일이 바뀌면 키도 바뀜. 없으면 None."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.realpath(path), st.st_size, st.st_mtime_ns
+
+
+def segment_key(*parts) -> str:
+    """구간 입력(문자열·숫자·튜플 등 repr 가능한 값)으로 캐시 키 생성"""
+    spec = repr((CACHE_VERSION,) + parts)
+    return hashlib.blake2b(spec.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return get_cache_dir() / f"{key}.mp4"
+
+
+def lookup(key: str) -> Path | None:
+    """캐시된 구간 파일 경로 (없으면 None). 찾으면 사용 시각 갱신."""
+    path = _entry_path(key)
+    with _lock:
+        if path.is_file():
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            _stats["hits"] += 1
+            return path
+        _stats["misses"] += 1
+    return None
+
+
+def store(key: str, src: Path) -> Path | None:
+    """인코딩된 구간 파일을 캐시에 복사 (임시 이름으로 쓴 뒤 교체). 실패하면 None."""
+    dst = _entry_path(key)
+    tmp = dst.with_name(f"{dst.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except OSError as e:
+        print(f"⚠️ 구간 캐시 저장 실패: {e}")
+        tmp.unlink(missing_ok=True)
+        return None
+    with _lock:
+        _stats["stores"] += 1
+    return dst
+
+
+def evict(max_bytes: int | None = None) -> int:
+    """디스크 예산을 넘으면 오래 안 쓴 파일부터 삭제. 삭제한 파일 수 반환."""
+    if max_bytes is None:
+        max_bytes = int(float(getattr(config, "SEGMENT_CACHE_MAX_MB", 512)) * 1024 * 1024)
+    removed = evict_lru(get_cache_dir(), "*.mp4", max_bytes)
+    with _lock:
+        _stats["evictions"] += removed
+    return removed
+
+
+def get_segment_cache_stats() -> dict:
+    """구간 캐시 통계 (hits, misses, stores, evictions, files, size_mb)"""
+    cache_dir = get_cache_dir()
+    files = list(cache_dir.glob("*.mp4")) if cache_dir.is_dir() else []
+    size = sum(p.stat().st_size for p in files if p.exists())
+    return {**_stats, "files": len(files), "size_mb": round(size / (1024 * 1024), 1)}
+
+
+def clear_segment_cache() -> None:
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
+    with _lock:
+        _stats.update(hits=0, misses=0, stores=0, evictions=0)
@@ -2,17 +2,23 @@
 """
 타로 카드 셔플 스타일 - 영상 생성 시 랜덤 선택
 실제 셔플 애니메이션은 각 스타일별 파라미터로 구분
+
+카드 움직임(card_movement)은 SHUFFLE_MOVEMENTS에 궤도 항(Orbit) 목록으로 선언하고,
+shuffle_trajectory()가 구간 전체 (프레임 수, 카드 수, 2) 위치 배열을 NumPy 한 번에 계산.
+새 움직임은 elif 분기 대신 파라미터만 추가하면 됨.
 """
 import random
 from typing import TypedDict
 
+import numpy as np
+
 
 class ShuffleStyle(TypedDict):
     id: str
     name: str
     duration: float      # 셔플 구간 길이 (초)
     ease: str            # ease_in, ease_out, ease_in_out
-    card_movement: str   # spread, cascade, riffle, overhand, fan
+    card_movement: str   # SHUFFLE_MOVEMENTS 키 (chaos_orbit, scatter_swirl, bounce_mix, spiral_chaos)
 
 
 SHUFFLE_STYLES: list[ShuffleStyle] = [
@@ -23,6 +29,103 @@ SHUFFLE_STYLES: list[ShuffleStyle] = [
 ]
 
 
+class CardValue(TypedDict, total=False):
+    """카드 번호 i별 값 = base + per_card*i + per_col*(i%3) + per_row*(i//3) + (i*mod_step) % mod_span"""
+    base: float
+    per_card: float
+    per_col: float
+    per_row: float
+    mod_step: int
+    mod_span: int
+
+
+class Wave(TypedDict):
+    """흔들림 amp * fn(rate*t + phase*i) (t: 초, 각도는 라디안)"""
+    amp: float
+    fn: str              # "sin" / "cos"
+    rate: float
+    phase: float
+
+
+class Orbit(TypedDict, total=False):
+    """
+    궤도 항 하나: r = radius + Σwaves, θ = speed*t + offset*i (도)
+    dx += r * x[1] * x[0](θ), dy += r * y[1] * y[0](θ)  (x[0]/y[0]: "sin" / "cos" / "one"=1)
+    """
+    radius: float
+    waves: list[Wave]
+    speed: float | CardValue     # 각속도 (도/초)
+    offset: float                # 카드별 시작 각도 (도/카드)
+    x: tuple[str, float]
+    y: tuple[str, float]
+
+
+SHUFFLE_MOVEMENTS: dict[str, list[Orbit]] = {
+    # 카드마다 속도가 다른 타원 궤도 + 반지름 맥동
+    "chaos_orbit": [
+        {"radius": 120, "waves": [{"amp": 80, "fn": "sin", "rate": 2.1, "phase": 0.7}],
+         "speed": {"base": 90, "per_col": 40, "per_row": 25}, "offset": 42,
+         "x": ("sin", 1.0), "y": ("cos", -0.6)},
+    ],
+    # 서로 반대로 도는 두 궤도의 합
+    "scatter_swirl": [
+        {"radius": 100, "waves": [{"amp": 60, "fn": "sin", "rate": 1.5, "phase": 1.0}],
+         "speed": 120, "offset": 50, "x": ("sin", 1.0), "y": ("cos", -0.7)},
+        {"radius": 80, "waves": [{"amp": 50, "fn": "cos", "rate": 1.2, "phase": 0.8}],
+         "speed": 90, "offset": -35, "x": ("cos", 0.5), "y": ("sin", 0.4)},
+    ],
+    # 가로·세로 진동 주기가 카드마다 다름 + 느린 흔들림
+    "bounce_mix": [
+        {"radius": 180, "speed": {"base": 180, "mod_step": 37, "mod_span": 140}, "x": ("sin", 1.0)},
+        {"radius": 160, "speed": {"base": 150, "mod_step": 29, "mod_span": 120}, "y": ("cos", -1.0)},
+        {"radius": 0, "waves": [{"amp": 100, "fn": "sin", "rate": 0.9, "phase": 0.6}], "x": ("one", 1.0)},
+        {"radius": 0, "waves": [{"amp": 90, "fn": "cos", "rate": 1.1, "phase": 0.5}], "y": ("one", 1.0)},
+    ],
+    # 반지름이 크게 출렁이는 나선
+    "spiral_chaos": [
+        {"radius": 130, "waves": [
+            {"amp": 50, "fn": "sin", "rate": 2.5, "phase": 0.9},
+            {"amp": 30, "fn": "sin", "rate": 3.0, "phase": 1.2},
+        ], "speed": {"base": 100, "per_card": 15}, "offset": 40, "x": ("sin", 1.0), "y": ("cos", -0.7)},
+    ],
+}
+
+_FUNCS = {"sin": np.sin, "cos": np.cos, "one": np.ones_like}
+
+
+def _card_values(value: float | CardValue, i: np.ndarray) -> np.ndarray:
+    if not isinstance(value, dict):
+        return np.full(i.shape, float(value))
+    out = value.get("base", 0.0) + value.get("per_card", 0.0) * i
+    out = out + value.get("per_col", 0.0) * (i % 3) + value.get("per_row", 0.0) * (i // 3)
+    if value.get("mod_span"):
+        out = out + (i * value.get("mod_step", 0)) % value["mod_span"]
+    return out.astype(np.float64)
+
+
+def shuffle_trajectory(movement: str, n_frames: int, n_cards: int, fps: float = 30.0, scale: float = 1.0) -> np.ndarray:
+    """
+    셔플 구간 전체의 카드 중심 변위 (n_frames, n_cards, 2) int 배열 [dx, dy] (px, 소수점 버림).
+    궤도 반지름은 1080x1920 기준 px → scale(레이아웃 배율)을 곱해 해상도에 맞춤.
+    없는 movement는 spiral_chaos로.
+    """
+    orbits = SHUFFLE_MOVEMENTS.get(movement) or SHUFFLE_MOVEMENTS["spiral_chaos"]
+    t = (np.arange(n_frames, dtype=np.float64) / fps)[:, None]
+    i = np.arange(n_cards)[None, :]
+    dx = np.zeros((n_frames, n_cards))
+    dy = np.zeros((n_frames, n_cards))
+    for orbit in orbits:
+        r = np.full((n_frames, n_cards), float(orbit.get("radius", 0.0)))
+        for w in orbit.get("waves", []):
+            r = r + w["amp"] * _FUNCS[w["fn"]](w["rate"] * t + w["phase"] * i)
+        theta = np.radians(t * _card_values(orbit.get("speed", 0.0), i) + orbit.get("offset", 0.0) * i)
+        if "x" in orbit:
+            dx += r * orbit["x"][1] * _FUNCS[orbit["x"][0]](theta)
+        if "y" in orbit:
+            dy += r * orbit["y"][1] * _FUNCS[orbit["y"][0]](theta)
+    return np.stack([np.trunc(dx * scale), np.trunc(dy * scale)], axis=-1).astype(np.int32)
+
+
 def pick_random_shuffle() -> ShuffleStyle:
     """영상 생성 시 랜덤 셔플 스타일 반환"""
     return random.choice(SHUFFLE_STYLES)
@@ -1,23 +1,155 @@
 # -*- coding: utf-8 -*-
 """
 타로 덱 폴더 관리 - 영상 생성 시 랜덤 덱 선택
+덱 목록·카드 경로는 assets/tarot/deck_manifest.json 인덱스에 저장하고,
+폴더 mtime이 바뀐 덱만 다시 스캔합니다.
 """
+import json
+import os
 import random
 from pathlib import Path
 
 import config
 
+# 메모리에 올린 매니페스트 (프로세스당 한 번 로드)
+_manifest: dict | None = None
+# tarot 폴더 밖 덱의 스캔 결과 {덱 경로: (폴더 mtime, 항목)} (메모리에만)
+_external_decks: dict[str, tuple[float, dict]] = {}
+
+
+def _manifest_path() -> Path:
+    return config.TAROT_DIR / "deck_manifest.json"
+
+
+def _card_sort_key(p: Path) -> int:
+    # 00, 01, ... 또는 00_fool 등 → 숫자 기준 정렬
+    num = ""
+    for c in p.stem:
+        if c.isdigit():
+            num += c
+        elif num:
+            break
+    return int(num) if num else 999
+
+
+def _scan_deck(folder: Path) -> dict:
+    """덱 폴더 한 개 스캔 → {mtime, has_back, cards: [{file, width, height, mtime}]}"""
+    from PIL import Image
+
+    cards = [f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in (".png", ".jpg", ".jpeg")]
+    cards = [c for c in cards if c.stem.lower() != "back"]
+    cards.sort(key=_card_sort_key)
+    entries = []
+    for c in cards:
+        try:
+            with Image.open(c) as im:  # 헤더만 읽음 (디코딩 없음)
+                w, h = im.size
+        except Exception:
+            w, h = 0, 0
+        entries.append({"file": c.name, "width": w, "height": h, "mtime": c.stat().st_mtime})
+    return {
+        "mtime": folder.stat().st_mtime,
+        "has_back": (folder / "back.png").exists(),
+        "cards": entries,
+    }
+
+
+def _save_manifest(manifest: dict) -> None:
+    path = _manifest_path()
+    try:
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+        if manifest.get("tarot_mtime") is not None:
+            # 매니페스트 교체가 tarot 폴더 mtime을 바꾸므로 바뀐 값을 기록해 같은 파일에 덮어씀
+            # (파일 내용만 쓰면 폴더 mtime은 그대로 → 다음 프로세스는 폴더를 다시 나열하지 않음)
+            manifest["tarot_mtime"] = config.TAROT_DIR.stat().st_mtime
+            with open(path, "r+", encoding="utf-8") as f:
+                f.write(json.dumps(manifest, ensure_ascii=False, indent=1))
+                f.truncate()
+    except OSError as e:
+        print(f"⚠️ 덱 매니페스트 저장 실패 (메모리에서만 사용): {e}")
+
+
+def load_deck_manifest(refresh: bool = False) -> dict:
+    """
+    덱 매니페스트 반환 {"tarot_mtime": float, "decks": {deck_id: {...}}}.
+    tarot 폴더 mtime이 바뀌면 덱 목록을, 덱 폴더 mtime이 바뀌면 해당 덱만 다시 스캔.
+    refresh=True면 전체 재스캔.
+    """
+    global _manifest
+    tarot_dir = config.TAROT_DIR
+    manifest = None if refresh else _manifest
+    if manifest is None and not refresh and _manifest_path().exists():
+        try:
+            manifest = json.loads(_manifest_path().read_text(encoding="utf-8"))
+        except Exception:
+            manifest = None
+    if not manifest or manifest.get("root") != str(tarot_dir):
+        manifest = {"root": str(tarot_dir), "tarot_mtime": None, "decks": {}}
+
+    changed = False
+    decks = manifest["decks"]
+    try:
+        tarot_mtime = tarot_dir.stat().st_mtime
+    except OSError:
+        tarot_mtime = None
+    if tarot_mtime != manifest["tarot_mtime"]:
+        # 덱 폴더 추가/삭제 가능성 → 최상위 폴더만 다시 나열 (저장 후 mtime은 _save_manifest가 다시 기록)
+        names = set()
+        if tarot_mtime is not None:
+            names = {f.name for f in tarot_dir.iterdir() if f.is_dir() and f.name.startswith("deck_")}
+        for name in list(decks):
+            if name not in names:
+                del decks[name]
+        for name in names - set(decks):
+            decks[name] = None
+        manifest["tarot_mtime"] = tarot_mtime
+        changed = True
+
+    for name, entry in list(decks.items()):
+        folder = tarot_dir / name
+        try:
+            mtime = folder.stat().st_mtime
+        except OSError:
+            del decks[name]
+            changed = True
+            continue
+        if entry is None or entry.get("mtime") != mtime:
+            decks[name] = _scan_deck(folder)
+            changed = True
+
+    if changed:
+        _save_manifest(manifest)
+    _manifest = manifest
+    return manifest
+
+
+def _get_deck_entry(deck_path: Path) -> dict | None:
+    """덱 폴더의 매니페스트 항목. tarot 폴더 밖의 덱은 (경로, mtime)별로 한 번만 스캔해 메모리에 보관."""
+    try:
+        mtime = deck_path.stat().st_mtime
+    except OSError:
+        return None
+    if deck_path.parent.resolve() != config.TAROT_DIR.resolve():
+        key = str(deck_path.resolve())
+        hit = _external_decks.get(key)
+        if hit is None or hit[0] != mtime:
+            hit = _external_decks[key] = (mtime, _scan_deck(deck_path))
+        return hit[1]
+    entry = (_manifest or {}).get("decks", {}).get(deck_path.name)
+    if entry is None or entry.get("mtime") != mtime:
+        entry = load_deck_manifest()["decks"].get(deck_path.name)
+    return entry
+
 
 def get_available_decks() -> list[str]:
     """사용 가능한 덱 ID 목록 (78장+back.png 있는 폴더만)"""
-    available = []
-    for folder in sorted(config.TAROT_DIR.iterdir()):
-        if folder.is_dir() and folder.name.startswith("deck_"):
-            cards = list(folder.glob("*.png")) + list(folder.glob("*.jpg"))
-            cards = [c for c in cards if c.stem != "back"]
-            if len(cards) >= 78 and (folder / "back.png").exists():
-                available.append(folder.name)
-    return available
+    decks = load_deck_manifest()["decks"]
+    return sorted(
+        name for name, entry in decks.items()
+        if entry and len(entry["cards"]) >= 78 and entry["has_back"]
+    )
 
 
 def pick_random_deck() -> str | None:
@@ -34,23 +166,17 @@ def get_random_deck_path() -> Path | None:
     return None
 
 
+def get_card_info_from_manifest(deck_path: Path, card_index: int) -> dict | None:
+    """카드 인덱스(0~77)의 매니페스트 항목 {file, width, height, mtime}"""
+    if not deck_path:
+        return None
+    entry = _get_deck_entry(deck_path)
+    if not entry or not 0 <= card_index < len(entry["cards"]):
+        return None
+    return entry["cards"][card_index]
+
+
 def get_card_path(deck_path: Path, card_index: int) -> Path | None:
     """덱 폴더에서 카드 인덱스(0~77)에 해당하는 이미지 경로"""
-    if not deck_path or not deck_path.exists():
-        return None
-    cards = [f for f in deck_path.iterdir() if f.is_file() and f.suffix.lower() in (".png", ".jpg", ".jpeg")]
-    cards = [c for c in cards if c.stem.lower() != "back"]
-    # 00, 01, ... 또는 00_fool 등 → 숫자 기준 정렬
-    def sort_key(p):
-        s = p.stem
-        num = ""
-        for c in s:
-            if c.isdigit():
-                num += c
-            elif num:
-                break
-        return int(num) if num else 999
-    cards.sort(key=sort_key)
-    if 0 <= card_index < len(cards):
-        return cards[card_index]
-    return None
+    card = get_card_info_from_manifest(deck_path, card_index)
+    return deck_path / card["file"] if card else None
@@ -3,27 +3,43 @@
 타로 운세 Shorts 영상 생성
 6장 카드, 셔플, 의미 표시 (~36초).
 """
+import functools
+import json
 import math
 import os
 import random
 from pathlib import Path
+from typing import TypedDict
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 # editor 대신 필요한 모듈만 직접 import (Blink 등 fx 호환성 문제 회피)
 from moviepy.video.VideoClip import ImageClip
-from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
 from moviepy.video.compositing.concatenate import concatenate_videoclips
 from moviepy.audio.io.AudioFileClip import AudioFileClip
 
 import config
+from modules.card_flip import flip_strip
+from modules.frame_compositor import FrameCompositor
+from modules.layout import Layout, get_layout, get_profile_size
+from modules.text_sprite import text_block_sprite, text_sprite
+from modules.parallel_render import ParallelRenderer, get_render_processes
+from modules import card_atlas, music_analysis, segment_cache, timeline
+from modules.background_cache import load_background
+from modules.timeline import SegmentSpec
+from modules.video_encoder import (
+    MusicTrack, codec_signature, encode_segments, get_dedupe_stats, get_encode_settings, get_x264_params,
+    prepend_segment, splice_head_segment, still_segment,
+)
 
 # 기존 숏츠 카드 수 및 그리드 (6장 = 3x2)
 NUM_CARDS = getattr(config, "NUM_CARDS", 6)
 GRID_COLS, GRID_ROWS = (3, 2) if NUM_CARDS == 6 else (3, 3)
+# 감성형 첫 화면(공감 멘트) 노출 시간(초)
+EMPATHY_SEC = 3.5
 
-from modules.tarot_deck import get_random_deck_path, get_card_path
+from modules.tarot_deck import get_available_decks, get_random_deck_path, get_card_path
 from modules.tarot_meanings import get_card_pool, get_card_info
-from modules.shuffle_styles import pick_random_shuffle
+from modules.shuffle_styles import SHUFFLE_STYLES, ShuffleStyle, pick_random_shuffle, shuffle_trajectory
 from modules.metadata_generator import generate_tarot_interpretations, generate_empathy_ment
 from modules.hook_ments import (
     pick_random_hook,
@@ -36,42 +52,24 @@ from modules import theme_phrases_db
 from modules.theme_phrases_db import get_random_unused_hook_title, mark_hook_title_used
 
 
-def _detect_music_highlight_start(audio_clip, need_dur: float, window_sec: float = 2.0) -> float:
-    """
-    음악에서 가장 큰 소리(에너지) 구간을 찾아 그 시작 시점(초)을 반환.
-    보통 후렴/드롭 구간이 가장 크므로 자동으로 캐치한 부분을 찾음.
-    """
+def _pick_music_start(music_path: str, need_dur: float) -> float:
+    """배경음악 재생 시작 위치(초). MUSIC_AUTO_HIGHLIGHT면 하이라이트 자동 감지 (곡별 분석 캐시)."""
+    if getattr(config, "MUSIC_AUTO_HIGHLIGHT", False):
+        try:
+            start_offset = music_analysis.highlight_start(music_path, need_dur)
+            if start_offset > 0:
+                print(f"🎵 배경음악 하이라이트 자동 감지: {start_offset:.1f}초부터 재생")
+        except Exception:
+            start_offset = 0
+        return float(start_offset)
+    audio_src = AudioFileClip(music_path)
     try:
-        arr = audio_clip.to_soundarray()
-        if arr.size == 0:
-            return 0.0
-        if arr.ndim == 2:
-            arr = arr.mean(axis=1)
-        sr = int(audio_clip.fps)
-        window_samples = int(window_sec * sr)
-        if window_samples >= len(arr):
-            return 0.0
-        n_windows = (len(arr) - window_samples) // (window_samples // 2) + 1  # 50% 오버랩
-        if n_windows <= 0:
-            return 0.0
-        energies = []
-        positions = []
-        hop = max(1, window_samples // 2)
-        for i in range(0, len(arr) - window_samples + 1, hop):
-            chunk = arr[i : i + window_samples].astype(np.float64)
-            rms = float(np.sqrt(np.mean(chunk * chunk)))
-            energies.append(rms)
-            positions.append(i / sr)
-            if len(positions) >= 500:
-                break
-        if not energies:
-            return 0.0
-        peak_idx = int(np.argmax(energies))
-        start = positions[peak_idx]
-        max_start = max(0, audio_clip.duration - need_dur - 1)
-        return float(min(start, max_start))
-    except Exception:
-        return 0.0
+        start_offset = getattr(config, "MUSIC_START_OFFSET_SEC", 0) or 0
+        if start_offset >= audio_src.duration:
+            start_offset = 0
+        return float(start_offset)
+    finally:
+        audio_src.close()
 
 
 def _ease_in_out(t: float) -> float:
@@ -85,15 +83,33 @@ def _hex_to_rgb(hex_str: str) -> tuple[int, int, int]:
     return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
 
 
-# 영상 생성 시 한 번 선택된 폰트 (generate_tarot_video 시작 시 설정)
+# 이번 영상 폰트 (렌더링 시작 시 _begin_render가 RenderChoices 값으로 지정, 영상 밖에서는 config 기본 폰트)
 _video_font_path: str | None = None
+# 이번 영상의 화면 배치·프레임 레이트 (렌더링 시작 시 렌더 프로필/초안 설정으로 지정)
+_video_layout: Layout | None = None
+_video_fps: int | None = None
+# 이번 영상 덱의 카드 아틀라스 핸들 (덱 경로, 아틀라스). 렌더링 시작 때 한 번 열고 카드 로드마다 재사용
+_video_atlas: tuple[str, card_atlas.CardAtlas] | None = None
+
+
+def _layout() -> Layout:
+    """현재 렌더링 중인 영상의 레이아웃 (없으면 config 해상도)"""
+    return _video_layout or get_layout(config.VIDEO_WIDTH, config.VIDEO_HEIGHT)
+
+
+def _fps() -> int:
+    """현재 렌더링 중인 영상의 fps (없으면 config.VIDEO_FPS)"""
+    return _video_fps or config.VIDEO_FPS
 
 
 def _get_font(size: int, font_path: str | None = None):
-    """한글 폰트 로드 (assets/fonts 랜덤 또는 폴백)"""
+    """
+    한글 폰트 로드 (font_path → 이번 영상 폰트(_begin_render에서 지정) → config 기본 폰트 순).
+    폰트 객체는 config 폰트 캐시에서 재사용. size는 기준 해상도(1080x1920) 글자 크기 → 현재 레이아웃 비율로 환산.
+    """
+    size = _layout().px(size)
     try:
-        path = font_path or _video_font_path or config.get_random_font_path()
-        return config.get_korean_font(size, path)
+        return config.get_korean_font(size, font_path or _video_font_path)
     except Exception:
         try:
             return config.get_korean_font(size)
@@ -278,14 +294,15 @@ def _create_text_screen(
     line_spacing_override: int | None = None,
 ) -> Image.Image:
     """텍스트 화면 이미지 생성. theme_name 지정 시 해당 부분만 theme_color로 표시."""
+    L = _layout()
     if bg_image is not None:
         img = bg_image.copy()
     else:
-        img = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color=_hex_to_rgb(bg_color))
+        img = Image.new("RGB", (L.width, L.height), color=_hex_to_rgb(bg_color))
     draw = ImageDraw.Draw(img)
     font = _get_font(font_size)
     subfont = _get_font(48)
-    safe_width = max_width_px or (config.VIDEO_WIDTH - 120)
+    safe_width = max_width_px or (L.width - L.px(120))
     paragraphs = text.split("\n") if text else []
     lines = []
     for para in paragraphs:
@@ -305,34 +322,35 @@ def _create_text_screen(
                     lines.append(w)
     if not lines and text:
         lines = [text]
-    line_spacing = line_spacing_override if line_spacing_override is not None else 22
+    line_spacing = L.px(line_spacing_override if line_spacing_override is not None else 22)
+    stroke_w = L.px(2)
     total_h = 0
     for line in lines:
         b = draw.textbbox((0, 0), line, font=font)
         total_h += (b[3] - b[1]) + line_spacing
     total_h -= line_spacing
-    y_max = config.VIDEO_HEIGHT - total_h - 150
-    y_start = max(60, min((config.VIDEO_HEIGHT - total_h) // 2 - 30, y_max))
+    y_max = L.height - total_h - L.px(150)
+    y_start = max(L.px(60), min((L.height - total_h) // 2 - L.px(30), y_max))
     theme_rgb = _hex_to_rgb(theme_color) if theme_name else None
     for i, line in enumerate(lines):
         b = draw.textbbox((0, 0), line, font=font)
         th = b[3] - b[1]
         if theme_rgb and theme_name and theme_name in line:
             before, _, after = line.partition(theme_name)
-            x_cur = (config.VIDEO_WIDTH - (b[2] - b[0])) // 2
+            x_cur = (L.width - (b[2] - b[0])) // 2
             for part, fill in [(before, (255, 255, 255)), (theme_name, theme_rgb), (after, (255, 255, 255))]:
                 if part:
                     try:
-                        draw.text((x_cur, y_start), part, font=font, fill=fill, stroke_width=2, stroke_fill=(0, 0, 0))
+                        draw.text((x_cur, y_start), part, font=font, fill=fill, stroke_width=stroke_w, stroke_fill=(0, 0, 0))
                     except TypeError:
                         draw.text((x_cur + 2, y_start + 2), part, font=font, fill=(0, 0, 0))
                         draw.text((x_cur, y_start), part, font=font, fill=fill)
                     pb = draw.textbbox((0, 0), part, font=font)
                     x_cur += pb[2] - pb[0]
         else:
-            x = (config.VIDEO_WIDTH - (b[2] - b[0])) // 2
+            x = (L.width - (b[2] - b[0])) // 2
             try:
-                draw.text((x, y_start), line, font=font, fill="white", stroke_width=2, stroke_fill=(0, 0, 0))
+                draw.text((x, y_start), line, font=font, fill="white", stroke_width=stroke_w, stroke_fill=(0, 0, 0))
             except TypeError:
                 draw.text((x + 2, y_start + 2), line, font=font, fill=(0, 0, 0))
                 draw.text((x, y_start), line, font=font, fill="white")
@@ -343,11 +361,11 @@ def _create_text_screen(
             sb = draw.textbbox((0, 0), sl, font=subfont)
             sw = sb[2] - sb[0]
             try:
-                draw.text(((config.VIDEO_WIDTH - sw) // 2, y_start + 20), sl, font=subfont, fill="white", stroke_width=2, stroke_fill=(0, 0, 0))
+                draw.text(((L.width - sw) // 2, y_start + L.px(20)), sl, font=subfont, fill="white", stroke_width=stroke_w, stroke_fill=(0, 0, 0))
             except TypeError:
-                draw.text(((config.VIDEO_WIDTH - sw) // 2 + 2, y_start + 22), sl, font=subfont, fill=(0, 0, 0))
-                draw.text(((config.VIDEO_WIDTH - sw) // 2, y_start + 20), sl, font=subfont, fill="white")
-            y_start += sb[3] - sb[1] + 12
+                draw.text(((L.width - sw) // 2 + 2, y_start + L.px(20) + 2), sl, font=subfont, fill=(0, 0, 0))
+                draw.text(((L.width - sw) // 2, y_start + L.px(20)), sl, font=subfont, fill="white")
+            y_start += sb[3] - sb[1] + L.px(12)
     return img
 
 
@@ -362,13 +380,14 @@ def _create_empathy_ment_screen(
     감성형 타로 공감 멘트 화면. 글자 크게, 7~10자/줄, 단어 끊김 방지, 핵심 단어 강조.
     어두운 배경에서 잘 보이는 금색(#FFD700)으로 핵심 단어 강조.
     """
+    L = _layout()
     HIGHLIGHT_RGB = (255, 215, 0)  # 금색 #FFD700 (어두운 배경에서 선명)
     NORMAL_RGB = (255, 255, 255)
 
     if bg_image is not None:
         img = bg_image.copy()
     else:
-        img = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color=(26, 10, 46))
+        img = Image.new("RGB", (L.width, L.height), color=(26, 10, 46))
     draw = ImageDraw.Draw(img)
     font = _get_font(font_size)
     keywords = _get_empathy_highlight_keywords()
@@ -382,7 +401,8 @@ def _create_empathy_ment_screen(
         lines = [text.strip()]
 
     # 총 높이 계산
-    line_sp = line_spacing
+    line_sp = L.px(line_spacing)
+    stroke_w = L.px(2)
     total_h = 0
     line_heights = []
     for line in lines:
@@ -392,7 +412,7 @@ def _create_empathy_ment_screen(
         total_h += h + line_sp
     total_h -= line_sp
 
-    y_start = max(80, (config.VIDEO_HEIGHT - total_h) // 2 - 40)
+    y_start = max(L.px(80), (L.height - total_h) // 2 - L.px(40))
 
     for i, line in enumerate(lines):
         segments = _split_line_with_highlights(line, keywords)
@@ -402,7 +422,7 @@ def _create_empathy_ment_screen(
         # 전체 줄 너비 (중앙 정렬용)
         bl = draw.textbbox((0, 0), line, font=font)
         full_w = bl[2] - bl[0]
-        x_cur = (config.VIDEO_WIDTH - full_w) // 2
+        x_cur = (L.width - full_w) // 2
         th = line_heights[i] if i < len(line_heights) else draw.textbbox((0, 0), line, font=font)[3] - draw.textbbox((0, 0), line, font=font)[1]
 
         for seg_text, is_highlight in segments:
@@ -410,7 +430,7 @@ def _create_empathy_ment_screen(
                 continue
             fill = HIGHLIGHT_RGB if is_highlight else NORMAL_RGB
             try:
-                draw.text((x_cur, y_start), seg_text, font=font, fill=fill, stroke_width=2, stroke_fill=(0, 0, 0))
+                draw.text((x_cur, y_start), seg_text, font=font, fill=fill, stroke_width=stroke_w, stroke_fill=(0, 0, 0))
             except TypeError:
                 draw.text((x_cur + 2, y_start + 2), seg_text, font=font, fill=(0, 0, 0))
                 draw.text((x_cur, y_start), seg_text, font=font, fill=fill)
@@ -429,11 +449,12 @@ def _create_closing_frame(
     line_spacing: int = 44,
 ) -> Image.Image:
     """마지막 인사 화면. comment_blink_highlight True면 '댓글' 부분을 강조색으로 (깜빡임용). 첫 시작 멘트와 글자 크기 맞춤."""
+    L = _layout()
     img = bg_image.copy()
     draw = ImageDraw.Draw(img)
     font = _get_font(font_size)
     subfont = _get_font(72)  # 구독 문구도 비슷한 크기
-    w_center = config.VIDEO_WIDTH // 2
+    w_center = L.width // 2
     # 줄 순서: 당신이 고른~ / 댓글로 남겨주세요 / 오늘도~ / 다음 영상~ / 구독과~
     lines_main = [
         "당신이 고른 카드는",
@@ -445,7 +466,8 @@ def _create_closing_frame(
     sub_line = "구독과 좋아요 부탁드려요"
     comment_highlight_rgb = (255, 255, 0)
     normal_rgb = (255, 255, 255)
-    stroke_w = 2
+    stroke_w = L.px(2)
+    line_spacing = L.px(line_spacing)
     stroke_fill = (0, 0, 0)
 
     total_h = 0
@@ -455,9 +477,9 @@ def _create_closing_frame(
         line_heights.append(b[3] - b[1])
         total_h += line_heights[-1] + line_spacing
     sb = draw.textbbox((0, 0), sub_line, font=subfont)
-    total_h += sb[3] - sb[1] + 20
+    total_h += sb[3] - sb[1] + L.px(20)
     total_h -= line_spacing
-    y_start = max(80, (config.VIDEO_HEIGHT - total_h) // 2 - 20)
+    y_start = max(L.px(80), (L.height - total_h) // 2 - L.px(20))
 
     def draw_centered_text(x_center: int, y: int, text: str, f, fill_color, stroke_width=stroke_w, stroke_f=stroke_fill):
         b = draw.textbbox((0, 0), text, font=f)
@@ -491,17 +513,36 @@ def _create_closing_frame(
             th = draw_centered_text(w_center, y_start, line, font, normal_rgb)
         y_start += th + line_spacing
 
-    draw_centered_text(w_center, y_start + 20, sub_line, subfont, normal_rgb)
+    draw_centered_text(w_center, y_start + L.px(20), sub_line, subfont, normal_rgb)
     return img
 
 
 def _get_background_image(background_path: str | None) -> Image.Image:
-    """배경 이미지 반환 (경로 있으면 로드, 없으면 단색)"""
-    if background_path and os.path.exists(background_path):
-        return Image.open(background_path).convert("RGB").resize(
-            (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), Image.Resampling.LANCZOS
-        )
-    return Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color=(26, 10, 46))
+    """배경 이미지 반환 (경로 있으면 로드, 없으면 단색). 렌더 해상도로 리사이즈한 배경은 배경 캐시(.npy)에서 읽음."""
+    L = _layout()
+    arr = load_background(background_path, L.size)
+    if arr is not None:
+        return Image.fromarray(np.asarray(arr))
+    return Image.new("RGB", (L.width, L.height), color=(26, 10, 46))
+
+
+def _new_compositor(bg_image: Image.Image | None) -> FrameCompositor:
+    """배경(없으면 단색)으로 프레임 합성기 생성. 구간 하나에서 재사용."""
+    L = _layout()
+    if bg_image is None:
+        bg_image = Image.new("RGB", (L.width, L.height), color="#1a0a2e")
+    return FrameCompositor(bg_image)
+
+
+def _center_text_sprite(text: str, font_size: int = 72) -> tuple[np.ndarray, int, int]:
+    """가운데 텍스트(검정 글자+흰 외곽선)를 RGBA 스프라이트로 (텍스트 스프라이트 캐시). (배열, x, y) 반환."""
+    L = _layout()
+    font = _get_font(font_size)
+    sprite, dx, dy = text_sprite(text, font, (0, 0, 0), stroke_width=L.px(3), stroke_fill=(255, 255, 255))
+    tb = font.getbbox(text)
+    cx = (L.width - (tb[2] - tb[0])) // 2
+    cy = (L.height - (tb[3] - tb[1])) // 2
+    return sprite, cx + dx, cy + dy
 
 
 def _add_sparkle_overlay(img: Image.Image, t: float, seed: int = 42) -> Image.Image:
@@ -526,26 +567,111 @@ def _add_sparkle_overlay(img: Image.Image, t: float, seed: int = 42) -> Image.Im
     return out.convert("RGB")
 
 
-def _load_card_back(deck_path: Path, size: tuple[int, int]) -> Image.Image:
-    """카드 뒷면 이미지 로드 (assets/card_backs에 있으면 랜덤 선택, 없으면 덱 기본)"""
+def _pick_card_back_path(deck_path: Path | None) -> Path | None:
+    """카드 뒷면 이미지 경로 (assets/card_backs에 있으면 랜덤 선택, 없으면 덱 기본)"""
     backs = list(config.CARD_BACKS_DIR.glob("*.png")) + list(config.CARD_BACKS_DIR.glob("*.jpg")) + list(config.CARD_BACKS_DIR.glob("*.jpeg"))
     if backs:
-        back_path = Path(str(random.choice(backs)))
-    else:
-        back_path = deck_path / "back.png" if deck_path else None
+        return Path(str(random.choice(backs)))
+    return deck_path / "back.png" if deck_path else None
+
+
+def _load_card_back(deck_path: Path, size: tuple[int, int], back_path: Path | None = None) -> Image.Image:
+    """카드 뒷면 이미지 로드. back_path 없으면 _pick_card_back_path로 선택."""
+    if back_path is None:
+        back_path = _pick_card_back_path(deck_path)
+    if back_path and deck_path and Path(back_path) == Path(deck_path) / "back.png":
+        atlas = _render_atlas(deck_path)
+        arr = atlas.get("back", size) if atlas is not None else None
+        if arr is not None:
+            return Image.fromarray(np.asarray(arr))
     if back_path and back_path.exists():
         return Image.open(back_path).convert("RGB").resize(size, Image.Resampling.LANCZOS)
     return Image.new("RGB", size, color=(60, 40, 80))
 
 
-def _load_card_image(deck_path: Path, card_index: int, size: tuple[int, int]) -> np.ndarray | None:
-    """카드 이미지 로드 및 리사이즈"""
-    path = get_card_path(deck_path, card_index)
+# 병렬 렌더링 워커가 공유 메모리에서 받은 카드 이미지 {(덱, 카드 인덱스, 크기): 배열}
+_shared_card_images: dict[tuple[str, int, tuple[int, int]], np.ndarray] = {}
+
+
+def _atlas_card_sizes(L: Layout | None = None) -> list[tuple[int, int]]:
+    """레이아웃이 쓰는 카드 크기 전부 (3장/N장 그리드, 의미 화면, 구간 전환)"""
+    L = L or _layout()
+    sizes = [(g["card_w"], g["card_h"]) for g in (L.grid(3), L.grid(NUM_CARDS))]
+    sizes += [(r["card_w"], r["card_h"]) for r in (L.reading(), L.reading(transition=True))]
+    return sizes
+
+
+def _card_atlas(deck_path: Path) -> card_atlas.CardAtlas | None:
+    """이번 영상 해상도의 덱 카드 아틀라스 (메모리 맵). 없으면 None (만드는 것은 scripts/build_card_atlas.py)."""
+    return card_atlas.get_card_atlas(deck_path, _atlas_card_sizes())
+
+
+def _use_card_atlas(deck_path: Path, atlas: card_atlas.CardAtlas | None) -> None:
+    """이번 영상의 아틀라스 핸들 지정 (렌더링 시작·병렬 워커 시작 때 한 번)"""
+    global _video_atlas
+    _video_atlas = (str(deck_path), atlas) if atlas is not None else None
+
+
+def _render_atlas(deck_path: Path) -> card_atlas.CardAtlas | None:
+    """이번 영상 덱이면 렌더링 시작 때 연 아틀라스 핸들, 아니면 None (카드 로드마다 크기 목록·서명 확인 안 함)"""
+    if _video_atlas is not None and _video_atlas[0] == str(deck_path):
+        return _video_atlas[1]
+    return None
+
+
+@functools.lru_cache(maxsize=getattr(config, "CARD_IMAGE_CACHE_SIZE", 128))
+def _load_card_image_cached(deck_key: str, card_index: int, size: tuple[int, int]) -> np.ndarray | None:
+    """(덱, 카드 인덱스, 크기)별 디코딩+리사이즈 결과. 캐시 공유 배열이므로 읽기 전용."""
+    path = get_card_path(Path(deck_key), card_index)
     if not path or not path.exists():
         return None
     img = Image.open(path).convert("RGB")
     img = img.resize(size, Image.Resampling.LANCZOS)
-    return np.array(img)
+    arr = np.array(img)
+    arr.setflags(write=False)
+    return arr
+
+
+def _load_card_image(deck_path: Path, card_index: int, size: tuple[int, int]) -> np.ndarray | None:
+    """카드 이미지 로드 및 리사이즈 (LRU 캐시: 같은 카드·크기는 한 번만 디코딩)"""
+    if not deck_path:
+        return None
+    key = (str(deck_path), int(card_index), (int(size[0]), int(size[1])))
+    shared = _shared_card_images.get(key)
+    if shared is not None:
+        return shared
+    atlas = _render_atlas(deck_path)
+    if atlas is not None:
+        arr = atlas.get(key[1], key[2])
+        if arr is not None:
+            return arr
+    return _load_card_image_cached(*key)
+
+
+@functools.lru_cache(maxsize=8)
+def _placeholder_card(size: tuple[int, int]) -> np.ndarray:
+    """카드 이미지가 없을 때 쓰는 단색 카드"""
+    arr = np.full((size[1], size[0], 3), (80, 60, 100), dtype=np.uint8)
+    arr.flags.writeable = False
+    return arr
+
+
+def get_card_cache_stats() -> dict:
+    """카드 이미지 캐시 통계 (hits, misses, evictions, size, max_size)"""
+    info = _load_card_image_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "evictions": max(0, info.misses - info.currsize),
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+def clear_card_cache() -> None:
+    """카드 이미지 캐시 비우기 (덱 파일을 교체한 경우 등)"""
+    _load_card_image_cached.cache_clear()
+    card_atlas.clear_card_atlas_handles()
 
 
 def _create_9cards_layout(
@@ -556,34 +682,21 @@ def _create_9cards_layout(
     bg_image: Image.Image | None = None,
 ) -> Image.Image:
     """N장 카드 그리드 레이아웃 (3장=3x1, 6장=3x2, 9장=3x3). 테두리 안쪽 82%."""
-    n = len(card_indices)
-    cols, rows = (3, 1) if n == 3 else ((GRID_COLS, GRID_ROWS) if n == NUM_CARDS else (3, 3))
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-    if card_size is None:
-        cw = (grid_w - (cols - 1) * gap) // cols
-        ch = (grid_h - (rows - 1) * gap) // rows
-    else:
-        cw, ch = card_size
-    total_w = cols * cw + (cols - 1) * gap
-    total_h = rows * ch + (rows - 1) * gap
-    offset_x = (config.VIDEO_WIDTH - total_w) // 2
-    offset_y = (config.VIDEO_HEIGHT - total_h) // 2
+    L = _layout()
+    grid = L.grid(len(card_indices), gap, card_size)
+    cw, ch = grid["card_w"], grid["card_h"]
 
     if bg_image is not None:
         base = bg_image.copy()
     else:
-        base = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
+        base = Image.new("RGB", (L.width, L.height), color="#1a0a2e")
     card_size_tuple = (cw, ch)
-    for i, idx in enumerate(card_indices):
+    for (x, y), idx in zip(grid["cells"], card_indices):
         arr = _load_card_image(deck_path, idx, card_size_tuple)
         if arr is None:
             card_img = Image.new("RGB", card_size_tuple, color=(80, 60, 100))
         else:
             card_img = Image.fromarray(arr)
-        col, row = i % cols, i // cols
-        x = offset_x + col * (cw + gap)
-        y = offset_y + row * (ch + gap)
         base.paste(card_img, (x, y))
     return base
 
@@ -596,6 +709,7 @@ def _create_9cards_with_center_text(
     bg_image: Image.Image | None = None,
 ) -> Image.Image:
     """9장 카드 레이아웃 + 가운데 텍스트 (show_text=True일 때만 표시, 검정+흰 외곽선)"""
+    L = _layout()
     base = _create_9cards_layout(deck_path, card_indices, bg_image=bg_image)
     if not show_text:
         return base
@@ -603,12 +717,12 @@ def _create_9cards_with_center_text(
     font = _get_font(72)
     b = draw.textbbox((0, 0), center_text, font=font)
     tw, th = b[2] - b[0], b[3] - b[1]
-    cx = (config.VIDEO_WIDTH - tw) // 2
-    cy = (config.VIDEO_HEIGHT - th) // 2
+    cx = (L.width - tw) // 2
+    cy = (L.height - th) // 2
     try:
-        draw.text((cx, cy), center_text, font=font, fill=(0, 0, 0), stroke_width=3, stroke_fill=(255, 255, 255))
+        draw.text((cx, cy), center_text, font=font, fill=(0, 0, 0), stroke_width=L.px(3), stroke_fill=(255, 255, 255))
     except TypeError:
-        draw.text((cx + 2, cy + 2), center_text, font=font, fill=(255, 255, 255))
+        draw.text((cx + L.px(2), cy + L.px(2)), center_text, font=font, fill=(255, 255, 255))
         draw.text((cx, cy), center_text, font=font, fill=(0, 0, 0))
     return base
 
@@ -622,45 +736,28 @@ def _create_9cards_with_numbers(
     num_font_size: int = 48,
 ) -> Image.Image:
     """N장 카드 + 1~N 번호 (선택용). 3장=가로배치(높이 축소)+브랜딩, 6장=3x2, 9장=3x3."""
-    n = len(card_indices)
-    cols, rows = (3, 1) if n == 3 else ((GRID_COLS, GRID_ROWS) if n == NUM_CARDS else (3, 3))
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-
-    # 3장일 때: 카드 높이를 비율에 맞게 축소 (위아래 15%씩)
-    if n == 3 and card_size is None:
-        cw = (grid_w - (cols - 1) * gap) // cols
-        ch_base = (grid_h - (rows - 1) * gap) // rows
-        ch = int(ch_base * 0.7)  # 위아래 15%씩 높이 축소
-        card_size = (cw, ch)
-
-    base = _create_9cards_layout(deck_path, card_indices, card_size, gap, bg_image)
+    L = _layout()
+    # 3장일 때: 카드 높이를 비율에 맞게 축소 (위아래 15%씩, L.grid에서 처리)
+    grid = L.grid(len(card_indices), gap, card_size)
+    cw, ch = grid["card_w"], grid["card_h"]
+    base = _create_9cards_layout(deck_path, card_indices, (cw, ch), gap, bg_image)
     draw = ImageDraw.Draw(base)
 
-    cw = (grid_w - (cols - 1) * gap) // cols if card_size is None else card_size[0]
-    ch = (grid_h - (rows - 1) * gap) // rows if card_size is None else card_size[1]
-    total_w = cols * cw + (cols - 1) * gap
-    total_h = rows * ch + (rows - 1) * gap
-    offset_x = (config.VIDEO_WIDTH - total_w) // 2
-    offset_y = (config.VIDEO_HEIGHT - total_h) // 2
-    circle_size = 80
+    circle_size = L.px(80)
     num_font = _get_font(num_font_size)
-    badge_margin = 18
+    badge_margin = L.px(18)
 
-    for i in range(n):
-        col, row = i % cols, i // cols
-        card_x = offset_x + col * (cw + gap)
-        card_y = offset_y + row * (ch + gap)
+    for i, (card_x, card_y) in enumerate(grid["cells"]):
         cx = card_x + (cw - circle_size) // 2
         cy = card_y + badge_margin
-        draw.ellipse([cx, cy, cx + circle_size, cy + circle_size], fill="#2c1810", outline="#DAA520", width=4)
+        draw.ellipse([cx, cy, cx + circle_size, cy + circle_size], fill="#2c1810", outline="#DAA520", width=L.px(4))
         num_str = str(i + 1)
         b = draw.textbbox((0, 0), num_str, font=num_font)
         tw, th = b[2] - b[0], b[3] - b[1]
         tx = cx + (circle_size - tw) // 2
-        ty = cy + (circle_size - th) // 2 - 2
+        ty = cy + (circle_size - th) // 2 - L.px(2)
         try:
-            draw.text((tx, ty), num_str, font=num_font, fill="white", stroke_width=3, stroke_fill="black")
+            draw.text((tx, ty), num_str, font=num_font, fill="white", stroke_width=L.px(3), stroke_fill="black")
         except TypeError:
             draw.text((tx + 1, ty + 1), num_str, font=num_font, fill="black")
             draw.text((tx, ty), num_str, font=num_font, fill="white")
@@ -677,70 +774,59 @@ def _create_9cards_facedown_with_numbers(
     msg_font_size: int | None = None,
 ) -> Image.Image:
     """N장 카드 뒷면 + 1~N 번호 + 선택 안내. n_cards 없으면 config.NUM_CARDS(6)."""
+    L = _layout()
     nc = n_cards or NUM_CARDS
-    cols, rows = (3, 1) if nc == 3 else ((GRID_COLS, GRID_ROWS) if nc == 6 else (3, 3))
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-    cw = (grid_w - (cols - 1) * gap) // cols
-    ch = (grid_h - (rows - 1) * gap) // rows
-    if nc == 3:
-        ch = int(ch * 0.7)  # 3장: 위아래 15%씩 높이 축소
-    total_w = cols * cw + (cols - 1) * gap
-    total_h = rows * ch + (rows - 1) * gap
-    offset_x = (config.VIDEO_WIDTH - total_w) // 2
-    offset_y = (config.VIDEO_HEIGHT - total_h) // 2
+    grid = L.grid(nc, gap)  # 3장: 위아래 15%씩 높이 축소
+    cw, ch = grid["card_w"], grid["card_h"]
 
     if bg_image is not None:
         base = bg_image.copy()
     else:
-        base = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
+        base = Image.new("RGB", (L.width, L.height), color="#1a0a2e")
 
     if card_back is None:
         card_back = _load_card_back(deck_path, (cw, ch))
     elif card_back.size != (cw, ch):
         card_back = card_back.resize((cw, ch), Image.Resampling.LANCZOS)
-    circle_size = 76
+    circle_size = L.px(76)
     num_font = _get_font(48)
-    badge_margin = 20
-    n = n_cards or NUM_CARDS
+    badge_margin = L.px(20)
 
-    for i in range(n):
-        col, row = i % cols, i // cols
-        card_x = offset_x + col * (cw + gap)
-        card_y = offset_y + row * (ch + gap)
+    for i, (card_x, card_y) in enumerate(grid["cells"]):
         base.paste(card_back, (card_x, card_y))
         draw = ImageDraw.Draw(base)
         cx = card_x + (cw - circle_size) // 2
         cy = card_y + badge_margin
-        draw.ellipse([cx, cy, cx + circle_size, cy + circle_size], fill="#8B4513", outline="#DAA520", width=3)
+        draw.ellipse([cx, cy, cx + circle_size, cy + circle_size], fill="#8B4513", outline="#DAA520", width=L.px(3))
         b = draw.textbbox((0, 0), str(i + 1), font=num_font)
         tw, th = b[2] - b[0], b[3] - b[1]
         tx = cx + (circle_size - tw) // 2
-        ty = cy + (circle_size - th) // 2 - 2
+        ty = cy + (circle_size - th) // 2 - L.px(2)
         draw.text((tx, ty), str(i + 1), font=num_font, fill="white")
 
     # 선택 안내 문구: 3장=화면 중앙, 6장=상단(카드 숫자와 겹치지 않도록)
     draw = ImageDraw.Draw(base)
     msg_font = _get_font(msg_font_size or 88)
     msg_lines = pick_message.split("\n")
+    line_gap = L.px(12)
     total_h = 0
     line_heights = []
     for line in msg_lines:
         mb = draw.textbbox((0, 0), line, font=msg_font)
         line_heights.append(mb[3] - mb[1])
-        total_h += line_heights[-1] + 12
-    total_h -= 12
+        total_h += line_heights[-1] + line_gap
+    total_h -= line_gap
     if nc == 3:
-        cy = max(80, (config.VIDEO_HEIGHT - total_h) // 2)  # 3장: 화면 중앙으로
+        cy = max(L.px(80), (L.height - total_h) // 2)  # 3장: 화면 중앙으로
     else:
-        cy = int(config.VIDEO_HEIGHT * 0.26)  # 6장: 상단 (카드 숫자와 겹치지 않도록)
+        cy = int(L.height * 0.26)  # 6장: 상단 (카드 숫자와 겹치지 않도록)
     for i, line in enumerate(msg_lines):
         mb = draw.textbbox((0, 0), line, font=msg_font)
         mw = mb[2] - mb[0]
-        cx = (config.VIDEO_WIDTH - mw) // 2
-        draw.text((cx + 3, cy + 3), line, font=msg_font, fill=(0, 0, 0))
+        cx = (L.width - mw) // 2
+        draw.text((cx + L.px(3), cy + L.px(3)), line, font=msg_font, fill=(0, 0, 0))
         draw.text((cx, cy), line, font=msg_font, fill="white")
-        cy += line_heights[i] + 12
+        cy += line_heights[i] + line_gap
     return base
 
 
@@ -751,25 +837,26 @@ def _create_3cards_facedown(
     card_back: Image.Image | None = None,
 ) -> Image.Image:
     """바이럴 숏츠용: 3장 카드 뒷면 가로 배치 + 번호 + 선택 안내."""
+    L = _layout()
     cols = 3
-    gap = 40
-    card_w = int((config.VIDEO_WIDTH - 120 - (cols - 1) * gap) / cols)
+    gap = L.px(40)
+    card_w = int((L.width - L.px(120) - (cols - 1) * gap) / cols)
     card_h = int(card_w * 1.4)
     total_w = cols * card_w + (cols - 1) * gap
-    offset_x = (config.VIDEO_WIDTH - total_w) // 2
-    offset_y = int(config.VIDEO_HEIGHT * 0.35)
+    offset_x = (L.width - total_w) // 2
+    offset_y = int(L.height * 0.35)
 
     if bg_image is not None:
         base = bg_image.copy()
     else:
-        base = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
+        base = Image.new("RGB", (L.width, L.height), color="#1a0a2e")
 
     if card_back is None:
         card_back = _load_card_back(deck_path, (card_w, card_h))
     elif card_back.size != (card_w, card_h):
         card_back = card_back.resize((card_w, card_h), Image.Resampling.LANCZOS)
 
-    circle_size = 56
+    circle_size = L.px(56)
     num_font = _get_font(42)
     draw = ImageDraw.Draw(base)
     for i in range(3):
@@ -777,20 +864,20 @@ def _create_3cards_facedown(
         card_y = offset_y
         base.paste(card_back, (card_x, card_y))
         cx = card_x + (card_w - circle_size) // 2
-        cy = card_y + 16
-        draw.ellipse([cx, cy, cx + circle_size, cy + circle_size], fill="#8B4513", outline="#DAA520", width=2)
+        cy = card_y + L.px(16)
+        draw.ellipse([cx, cy, cx + circle_size, cy + circle_size], fill="#8B4513", outline="#DAA520", width=L.px(2))
         b = draw.textbbox((0, 0), str(i + 1), font=num_font)
         tw, th = b[2] - b[0], b[3] - b[1]
         tx = cx + (circle_size - tw) // 2
-        ty = cy + (circle_size - th) // 2 - 2
+        ty = cy + (circle_size - th) // 2 - L.px(2)
         draw.text((tx, ty), str(i + 1), font=num_font, fill="white")
 
     msg_font = _get_font(58)
     mb = draw.textbbox((0, 0), pick_message, font=msg_font)
     mw = mb[2] - mb[0]
-    mx = (config.VIDEO_WIDTH - mw) // 2
-    my = offset_y + card_h + 50
-    _draw_text_with_stroke(draw, (mx, my), pick_message, msg_font, (255, 255, 255))
+    mx = (L.width - mw) // 2
+    my = offset_y + card_h + L.px(50)
+    _draw_text_with_stroke(draw, (mx, my), pick_message, msg_font, (255, 255, 255), stroke_w=L.px(2))
     return base
 
 
@@ -802,33 +889,25 @@ def _create_card_flip_front_to_back_frame(
     show_center_text: bool = True,
     bg_image: Image.Image | None = None,
     card_back: Image.Image | None = None,
-) -> Image.Image:
+    compositor: FrameCompositor | None = None,
+) -> np.ndarray:
     """
     N장 카드 앞→뒤 한 번에 뒤집기. progress 0=앞면, 1=뒷면. (3장=3x1, 6장=3x2)
+    compositor를 넘기면 구간 내 프레임 버퍼를 재사용 (반환값은 그 버퍼의 뷰).
     """
+    L = _layout()
     n_c = len(card_indices)
-    cols, rows = (3, 1) if n_c == 3 else (GRID_COLS, GRID_ROWS)
-    gap = 28
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-    cw = (grid_w - (cols - 1) * gap) // cols
-    ch = (grid_h - (rows - 1) * gap) // rows
-    if n_c == 3:
-        ch = int(ch * 0.7)  # 3장: 위아래 15%씩 높이 축소
-    total_w = cols * cw + (cols - 1) * gap
-    total_h = rows * ch + (rows - 1) * gap
-    offset_x = (config.VIDEO_WIDTH - total_w) // 2
-    offset_y = (config.VIDEO_HEIGHT - total_h) // 2
+    grid = L.grid(n_c)  # 3장: 위아래 15%씩 높이 축소
+    cw, ch = grid["card_w"], grid["card_h"]
 
-    if bg_image is not None:
-        base = bg_image.copy()
-    else:
-        base = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
+    comp = compositor or _new_compositor(bg_image)
+    comp.begin_frame()
 
     if card_back is None:
         card_back = _load_card_back(deck_path, (cw, ch))
     elif card_back.size != (cw, ch):
         card_back = card_back.resize((cw, ch), Image.Resampling.LANCZOS)
+    back_arr = np.asarray(card_back)
 
     p = _ease_in_out(progress)
     n_cards = len(card_indices)
@@ -840,35 +919,27 @@ def _create_card_flip_front_to_back_frame(
             scale_x = 2 * (p - 0.5)
             show_front = False
 
-        col, row = i % cols, i // cols
-        card_x = offset_x + col * (cw + gap)
-        card_y = offset_y + row * (ch + gap)
+        card_x, card_y = grid["cells"][i]
 
         if scale_x < 0.05:
             continue
         nw = max(2, int(cw * scale_x))
+        card_key = None  # 뒷면·빈 카드는 flip_strip이 내용 해시로 구분
         if show_front:
-            arr = _load_card_image(deck_path, card_indices[i], (cw, ch))
-            card_img = Image.fromarray(arr) if arr is not None else Image.new("RGB", (cw, ch), (80, 60, 100))
+            card_arr = _load_card_image(deck_path, card_indices[i], (cw, ch))
+            if card_arr is None:
+                card_arr = _placeholder_card((cw, ch))
+            else:
+                card_key = (str(deck_path), card_indices[i])
         else:
-            card_img = card_back.copy()
-        squished = card_img.resize((nw, ch), Image.Resampling.LANCZOS)
+            card_arr = back_arr
         px = card_x + (cw - nw) // 2
-        base.paste(squished, (px, card_y))
+        comp.blit(flip_strip(card_arr, nw, near_left=show_front, card_key=card_key), px, card_y)
 
     if show_center_text and center_text:
-        draw = ImageDraw.Draw(base)
-        font = _get_font(72)
-        b = draw.textbbox((0, 0), center_text, font=font)
-        tw, th = b[2] - b[0], b[3] - b[1]
-        cx = (config.VIDEO_WIDTH - tw) // 2
-        cy = (config.VIDEO_HEIGHT - th) // 2
-        try:
-            draw.text((cx, cy), center_text, font=font, fill=(0, 0, 0), stroke_width=3, stroke_fill=(255, 255, 255))
-        except TypeError:
-            draw.text((cx + 2, cy + 2), center_text, font=font, fill=(255, 255, 255))
-            draw.text((cx, cy), center_text, font=font, fill=(0, 0, 0))
-    return base
+        sprite, sx, sy = _center_text_sprite(center_text)
+        comp.blit(sprite, sx, sy)
+    return comp.frame()
 
 
 def _create_card_flip_frame(
@@ -877,33 +948,25 @@ def _create_card_flip_frame(
     progress: float,
     bg_image: Image.Image | None = None,
     card_back: Image.Image | None = None,
-) -> Image.Image:
+    compositor: FrameCompositor | None = None,
+) -> np.ndarray:
     """
     카드 뒤집기 애니메이션 한 프레임. N장 순차 뒤→앞. (3장=3x1, 6장=3x2)
+    compositor를 넘기면 구간 내 프레임 버퍼를 재사용 (반환값은 그 버퍼의 뷰).
     """
+    L = _layout()
     n_c = len(card_indices)
-    cols, rows = (3, 1) if n_c == 3 else (GRID_COLS, GRID_ROWS)
-    gap = 28
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-    cw = (grid_w - (cols - 1) * gap) // cols
-    ch = (grid_h - (rows - 1) * gap) // rows
-    if n_c == 3:
-        ch = int(ch * 0.7)  # 3장: 위아래 15%씩 높이 축소
-    total_w = cols * cw + (cols - 1) * gap
-    total_h = rows * ch + (rows - 1) * gap
-    offset_x = (config.VIDEO_WIDTH - total_w) // 2
-    offset_y = (config.VIDEO_HEIGHT - total_h) // 2
+    grid = L.grid(n_c)  # 3장: 위아래 15%씩 높이 축소
+    cw, ch = grid["card_w"], grid["card_h"]
 
-    if bg_image is not None:
-        base = bg_image.copy()
-    else:
-        base = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
+    comp = compositor or _new_compositor(bg_image)
+    comp.begin_frame()
 
     if card_back is None:
         card_back = _load_card_back(deck_path, (cw, ch))
     elif card_back.size != (cw, ch):
         card_back = card_back.resize((cw, ch), Image.Resampling.LANCZOS)
+    back_arr = np.asarray(card_back)
 
     for i in range(n_c):
         stagger, span = 0.08, 0.55
@@ -916,23 +979,24 @@ def _create_card_flip_frame(
             scale_x = 2 * (p - 0.5)
             show_front = True
 
-        col, row = i % cols, i // cols
-        card_x = offset_x + col * (cw + gap)
-        card_y = offset_y + row * (ch + gap)
+        card_x, card_y = grid["cells"][i]
 
         if scale_x < 0.05:
             continue
         nw = max(2, int(cw * scale_x))
+        card_key = None  # 뒷면·빈 카드는 flip_strip이 내용 해시로 구분
         if show_front:
-            arr = _load_card_image(deck_path, card_indices[i], (cw, ch))
-            card_img = Image.fromarray(arr) if arr is not None else Image.new("RGB", (cw, ch), (80, 60, 100))
+            card_arr = _load_card_image(deck_path, card_indices[i], (cw, ch))
+            if card_arr is None:
+                card_arr = _placeholder_card((cw, ch))
+            else:
+                card_key = (str(deck_path), card_indices[i])
         else:
-            card_img = card_back.copy()
-        squished = card_img.resize((nw, ch), Image.Resampling.LANCZOS)
+            card_arr = back_arr
         px = card_x + (cw - nw) // 2
-        base.paste(squished, (px, card_y))
+        comp.blit(flip_strip(card_arr, nw, near_left=not show_front, card_key=card_key), px, card_y)
 
-    return base
+    return comp.frame()
 
 
 def _wrap_text(text: str, chars_per_line: int = 20, max_lines: int = 6) -> list[str]:
@@ -964,21 +1028,18 @@ def _create_3cards_with_meanings(
     bg_image: Image.Image | None = None,
 ) -> Image.Image:
     """3장 카드. 형식: 이 카드는 / [카드명]입니다. / 의미는 / [의미]입니다. []안은 금색(#FFD700), 얇은 검정 외곽선."""
+    L = _layout()
     GOLD = (255, 215, 0)  # #FFD700
 
     if bg_image is not None:
         base = bg_image.copy()
     else:
-        base = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
-
-    card_w = 225  # 테두리 안쪽 배치
-    gap_between_cards = 6  # 카드 간격 더 축소
-    margin_top, margin_bottom = 100, 100  # 여백 축소 → 카드에 더 많은 공간 (너무 작아 보이는 것 완화)
-    section_h = (config.VIDEO_HEIGHT - margin_top - margin_bottom) // 3
-    raw_h = section_h - gap_between_cards
-    card_h = int(raw_h * card_w / 280 * 1.15)  # 비율 유지 + 15% 높이 보정 (너무 작음 완화)
-    card_x = 90
-    text_x = card_x + card_w + 20
+        base = Image.new("RGB", (L.width, L.height), color="#1a0a2e")
+
+    # 카드 폭 225, 위아래 여백 100, 카드 높이 15% 보정 (L.reading)
+    rl = L.reading()
+    card_w, card_h, card_x, text_x = rl["card_w"], rl["card_h"], rl["card_x"], rl["text_x"]
+    stroke_w = L.px(2)
     num_font = _get_font(65)   # 5pt 추가
     label_font = _get_font(49)
     value_font = _get_font(47)
@@ -992,7 +1053,7 @@ def _create_3cards_with_meanings(
         if len(short) > 18:
             short = short[:18] + "…"
 
-        row_y = margin_top + i * section_h + (section_h - card_h) // 2
+        row_y = rl["rows_y"][i]
         text_y = row_y
 
         arr = _load_card_image(deck_path, idx, card_size)
@@ -1001,7 +1062,7 @@ def _create_3cards_with_meanings(
             base.paste(card_img, (card_x, row_y))
 
         # 번호
-        _draw_text_with_stroke(draw, (card_x + 10, row_y + 10), str(number_offset + i + 1), num_font, "white")
+        _draw_text_with_stroke(draw, (card_x + L.px(10), row_y + L.px(10)), str(number_offset + i + 1), num_font, "white", stroke_w)
 
         # 이 카드는 / [카드명]입니다. / 의미는 / [의미]입니다. (줄바꿈 최소화, []안 금색)
         lines = [
@@ -1011,20 +1072,26 @@ def _create_3cards_with_meanings(
             (f"{short}입니다.", GOLD),
         ]
         for txt, color in lines:
-            _draw_text_with_stroke(draw, (text_x, text_y), txt, value_font if color == GOLD else label_font, color)
+            _draw_text_with_stroke(draw, (text_x, text_y), txt, value_font if color == GOLD else label_font, color, stroke_w)
             b = draw.textbbox((0, 0), txt, font=value_font if color == GOLD else label_font)
-            text_y += b[3] - b[1] + 8
+            text_y += b[3] - b[1] + L.px(8)
 
         # 카드 의미와 한 줄 띄우고 독립적으로 표시
-        text_y += 24
+        text_y += L.px(24)
         detail_lines = ["이 카드에 자세한 설명은", "더보기에 적어 두었습니다"]
         for dl in detail_lines:
-            _draw_text_with_stroke(draw, (text_x, text_y), dl, detail_font, (255, 255, 255), stroke_w=2)
+            _draw_text_with_stroke(draw, (text_x, text_y), dl, detail_font, (255, 255, 255), stroke_w)
             b = draw.textbbox((0, 0), dl, font=detail_font)
-            text_y += b[3] - b[1] + 4
+            text_y += b[3] - b[1] + L.px(4)
     return base
 
 
+def _transition_card_size() -> tuple[int, int]:
+    """구간 전환 화면의 카드 크기 (위아래 여백 120, 3단)."""
+    rl = _layout().reading(transition=True)
+    return rl["card_w"], rl["card_h"]
+
+
 def _create_segment_transition_frame(
     deck_path: Path,
     cards_out: list[int],
@@ -1036,36 +1103,34 @@ def _create_segment_transition_frame(
     progress: float,
     bg_image: Image.Image | None = None,
     card_back: Image.Image | None = None,
-) -> Image.Image:
+    compositor: FrameCompositor | None = None,
+) -> np.ndarray:
     """
     구간 전환 프레임: 카드 앞→뒤 회전, 다음 카드 뒤→앞 회전.
     텍스트: 기존은 좌측으로 연기처럼 사라지고, 새 텍스트는 우측에서 연기처럼 등장.
-    progress 0~1.
+    텍스트 블록은 스프라이트로 한 번만 그리고 프레임마다 위치·알파만 바꿔 합성. progress 0~1.
+    compositor를 넘기면 구간 내 프레임 버퍼를 재사용 (반환값은 그 버퍼의 뷰).
     """
+    L = _layout()
     GOLD = (255, 215, 0)
-    card_w = 225
-    gap_between_cards = 6
-    margin_top, margin_bottom = 120, 120
-    section_h = (config.VIDEO_HEIGHT - margin_top - margin_bottom) // 3
-    raw_h = section_h - gap_between_cards
-    card_h = int(raw_h * card_w / 280)
-    card_x = 90
-    text_x = card_x + card_w + 20
+    WHITE = (255, 255, 255)
+    rl = L.reading(transition=True)
+    card_w, card_h, card_x, text_x = rl["card_w"], rl["card_h"], rl["card_x"], rl["text_x"]
+    sw, gap, gap_s = L.px(2), L.px(8), L.px(4)
     num_font = _get_font(65)
     label_font = _get_font(49)
     value_font = _get_font(47)
     detail_font = _get_font(43)
     card_size = (card_w, card_h)
 
-    if bg_image is not None:
-        base = bg_image.copy()
-    else:
-        base = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
+    comp = compositor or _new_compositor(bg_image)
+    comp.begin_frame()
 
     if card_back is None:
         card_back = _load_card_back(deck_path, card_size)
     elif card_back.size != card_size:
         card_back = card_back.resize(card_size, Image.Resampling.LANCZOS)
+    back_arr = np.asarray(card_back)
 
     p = _ease_in_out(progress)
 
@@ -1076,80 +1141,65 @@ def _create_segment_transition_frame(
 
     # 카드 플립
     for i in range(3):
-        row_y = margin_top + i * section_h + (section_h - card_h) // 2
+        row_y = rl["rows_y"][i]
 
+        card_key = None  # 뒷면·빈 카드는 flip_strip이 내용 해시로 구분
         if flip_out_phase:
             scale = 1.0 - (p / 0.45)
-            arr = _load_card_image(deck_path, cards_out[i], card_size)
-            card_img = Image.fromarray(arr) if arr is not None else Image.new("RGB", card_size, (80, 60, 100))
+            card_arr = _load_card_image(deck_path, cards_out[i], card_size)
+            card_key = (str(deck_path), cards_out[i])
         elif flip_in_phase:
             scale = (p - 0.55) / 0.45
-            arr = _load_card_image(deck_path, cards_in[i], card_size)
-            card_img = Image.fromarray(arr) if arr is not None else Image.new("RGB", card_size, (80, 60, 100))
+            card_arr = _load_card_image(deck_path, cards_in[i], card_size)
+            card_key = (str(deck_path), cards_in[i])
         else:
             scale = 1.0
-            card_img = card_back.copy()
+            card_arr = back_arr
+        if card_arr is None:
+            card_arr = _placeholder_card(card_size)
+            card_key = None
 
         if scale < 0.02:
             continue
         nw = max(2, int(card_w * scale))
-        squished = card_img.resize((nw, card_h), Image.Resampling.LANCZOS)
         px = card_x + (card_w - nw) // 2
-        base.paste(squished, (px, row_y))
+        comp.blit(flip_strip(card_arr, nw, near_left=flip_out_phase, card_key=card_key), px, row_y)
 
         # 번호 (flip out일 때 cards_out 번호, flip in일 때 cards_in 번호)
         if flip_out_phase or mid_phase:
             num = str(number_offset_out + i + 1)
         else:
             num = str(number_offset_in + i + 1)
-        draw = ImageDraw.Draw(base)
-        _draw_text_with_stroke(draw, (card_x + 10, row_y + 10), num, num_font, "white")
+        sprite, dx, dy = text_sprite(num, num_font, WHITE, stroke_width=sw)
+        comp.blit(sprite, card_x + L.px(10) + dx, row_y + L.px(10) + dy)
 
     # 텍스트: 기존(0~0.4) 좌측으로 연기 사라짐, 새 텍스트(0.6~1) 우측에서 연기 등장
-    draw = ImageDraw.Draw(base)
-    slide_dist = 450
-    bg_color = (26, 10, 46)
+    slide_dist = L.px(450)
 
-    def draw_card_text(cards, meanings, num_off, base_text_x: int, slide_offset: int, alpha: float):
+    def blit_card_text(cards, base_text_x: int, slide_offset: int, alpha: float):
         for i, idx in enumerate(cards):
             info = get_card_info(idx)
             name, short = info["name"], info["meaning"]
             if len(short) > 18:
                 short = short[:18] + "…"
-            row_y = margin_top + i * section_h + (section_h - card_h) // 2
-            tx = base_text_x + slide_offset
-            ty = row_y
-            # alpha에 따라 색상 보간 (연기 효과)
-            r = int(255 * alpha + bg_color[0] * (1 - alpha))
-            g = int(255 * alpha + bg_color[1] * (1 - alpha))
-            b = int(255 * alpha + bg_color[2] * (1 - alpha))
-            white_fade = (r, g, b)
-            gold_r = int(255 * alpha + bg_color[0] * (1 - alpha))
-            gold_g = int(215 * alpha + bg_color[1] * (1 - alpha))
-            gold_b = int(0 * alpha + bg_color[2] * (1 - alpha))
-            gold_fade = (min(255, gold_r), min(255, gold_g), min(255, gold_b))
-            lines = [
-                ("이 카드는", white_fade),
-                (f"{name}입니다.", gold_fade),
-                ("의미는", white_fade),
-                (f"{short}입니다.", gold_fade),
-            ]
-            for txt, color in lines:
-                _draw_text_with_stroke(draw, (tx, ty), txt, value_font if color == gold_fade else label_font, color)
-                bb = draw.textbbox((0, 0), txt, font=value_font if color == gold_fade else label_font)
-                ty += bb[3] - bb[1] + 8
-            ty += 24
-            for dl in ["이 카드에 자세한 설명은", "더보기에 적어 두었습니다"]:
-                _draw_text_with_stroke(draw, (tx, ty), dl, detail_font, white_fade, stroke_w=2)
-                bb = draw.textbbox((0, 0), dl, font=detail_font)
-                ty += bb[3] - bb[1] + 4
+            row_y = rl["rows_y"][i]
+            # 이 카드는 / [카드명]입니다. / 의미는 / [의미]입니다. → 한 줄 띄우고 상세 안내 2줄
+            sprite, dx, dy = text_block_sprite([
+                ("이 카드는", label_font, WHITE, sw, gap),
+                (f"{name}입니다.", value_font, GOLD, sw, gap),
+                ("의미는", label_font, WHITE, sw, gap),
+                (f"{short}입니다.", value_font, GOLD, sw, gap + L.px(24)),
+                ("이 카드에 자세한 설명은", detail_font, WHITE, sw, gap_s),
+                ("더보기에 적어 두었습니다", detail_font, WHITE, sw, gap_s),
+            ])
+            comp.blit(sprite, base_text_x + slide_offset + dx, row_y + dy, alpha=alpha)
 
     # 기존 텍스트: 0~0.4 구간에서 좌측으로 이동 + 페이드
     if p < 0.5:
         out_alpha = 1.0 - (p / 0.4) if p < 0.4 else 0
         out_offset = int(-slide_dist * (p / 0.4)) if p < 0.4 else -slide_dist
         if out_alpha > 0.02:
-            draw_card_text(cards_out, meanings_out, number_offset_out, text_x, out_offset, out_alpha)
+            blit_card_text(cards_out, text_x, out_offset, out_alpha)
 
     # 새 텍스트: 0.6~1 구간에서 우측에서 들어오며 페이드인
     if p > 0.5:
@@ -1157,32 +1207,31 @@ def _create_segment_transition_frame(
         in_alpha = min(1.0, in_t / 0.4)  # 0.5~0.7에서 페이드인
         in_offset = int(slide_dist * (1 - in_t)) if in_t < 1 else 0
         if in_alpha > 0.02:
-            draw_card_text(cards_in, meanings_in, number_offset_in, text_x, in_offset, in_alpha)
+            blit_card_text(cards_in, text_x, in_offset, in_alpha)
+
+    return comp.frame()
 
-    return base
 
+def _frame_span(n_frames: int, frame_range: tuple[int, int] | None) -> range:
+    """구간 프레임 번호 범위. frame_range=(start, stop)이면 그 부분만 (병렬 렌더링 시 조각 단위)."""
+    if frame_range is None:
+        return range(n_frames)
+    return range(max(0, frame_range[0]), min(n_frames, frame_range[1]))
 
-def _create_cards_fly_to_center_frames(
+
+def _iter_cards_fly_to_center_frames(
     deck_path: Path,
     duration_sec: float,
     bg_image: Image.Image | None = None,
     card_back: Image.Image | None = None,
     n_cards: int | None = None,
-) -> list:
-    """그리드 1~N번 카드가 중앙으로 날아가는 프레임. (3장=3x1, 6장=3x2)"""
+    frame_range: tuple[int, int] | None = None,
+):
+    """그리드 1~N번 카드가 중앙으로 날아가는 프레임 (합성 버퍼 뷰를 yield). (3장=3x1, 6장=3x2)"""
+    L = _layout()
     nc = n_cards or NUM_CARDS
-    cols, rows = (3, 1) if nc == 3 else (GRID_COLS, GRID_ROWS)
-    gap = 28
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-    cw = (grid_w - (cols - 1) * gap) // cols
-    ch = (grid_h - (rows - 1) * gap) // rows
-    if nc == 3:
-        ch = int(ch * 0.7)  # 3장: 위아래 15%씩 높이 축소
-    total_w = cols * cw + (cols - 1) * gap
-    total_h = rows * ch + (rows - 1) * gap
-    offset_x = (config.VIDEO_WIDTH - total_w) // 2
-    offset_y = (config.VIDEO_HEIGHT - total_h) // 2
+    grid = L.grid(nc)  # 3장: 위아래 15%씩 높이 축소
+    cw, ch = grid["card_w"], grid["card_h"]
 
     if card_back is None:
         card_img = _load_card_back(deck_path, (cw, ch))
@@ -1190,29 +1239,21 @@ def _create_cards_fly_to_center_frames(
         card_img = card_back.resize((cw, ch), Image.Resampling.LANCZOS)
     else:
         card_img = card_back
+    card_arr = np.asarray(card_img)
+    comp = _new_compositor(bg_image)
 
-    if bg_image is not None:
-        base_bg = bg_image.copy()
-    else:
-        base_bg = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
-
-    cx = config.VIDEO_WIDTH // 2 - cw // 2
-    cy = config.VIDEO_HEIGHT // 2 - ch // 2
-    starts = []
-    for i in range(nc):
-        col, row = i % cols, i // cols
-        sx = offset_x + col * (cw + gap)
-        sy = offset_y + row * (ch + gap)
-        starts.append((sx, sy))
-
-    n_frames = max(1, int(config.VIDEO_FPS * duration_sec))
+    cx = L.width // 2 - cw // 2
+    cy = L.height // 2 - ch // 2
+    starts = grid["cells"]
+
+    fps = _fps()
+    n_frames = max(1, int(fps * duration_sec))
     fly_dur_sec = 0.12
     start_offset_sec = 0.12
 
-    frames = []
-    for fi in range(n_frames):
-        t = fi / config.VIDEO_FPS
-        frame = base_bg.copy()
+    for fi in _frame_span(n_frames, frame_range):
+        t = fi / fps
+        comp.begin_frame()
         for i in range(nc):
             start_i = i * start_offset_sec
             if t <= start_i:
@@ -1225,80 +1266,45 @@ def _create_cards_fly_to_center_frames(
                 sx, sy = starts[i]
                 x = int(sx + (cx - sx) * prog)
                 y = int(sy + (cy - sy) * prog)
-            frame.paste(card_img, (x, y))
-        frames.append(np.array(frame))
-    return frames
+            comp.blit(card_arr, x, y)
+        yield comp.frame()
 
 
-def _create_shuffle_frame(
-    deck_path: Path, style: str, frame_idx: int, n_frames: int, bg_image: Image.Image | None = None,
+def _shuffle_card_positions(style: str, n_frames: int, nc: int, card_w: int, card_h: int) -> np.ndarray:
+    """셔플 스타일별 구간 전체 카드 N장 좌상단 위치 (n_frames, nc, 2), 화면 안으로 클램프"""
+    L = _layout()
+    offsets = shuffle_trajectory(style, n_frames, nc, fps=_fps(), scale=L.scale)
+    x = np.clip(L.width // 2 - card_w // 2 + offsets[..., 0], 0, L.width - card_w)
+    y = np.clip(L.height // 2 - card_h // 2 + offsets[..., 1], 0, L.height - card_h)
+    return np.stack([x, y], axis=-1)
+
+
+def _iter_shuffle_frames(
+    deck_path: Path, style: str, n_frames: int, bg_image: Image.Image | None = None,
     card_back: Image.Image | None = None,
     n_cards: int | None = None,
-) -> Image.Image:
-    """셔플 - N장 카드가 계속 섞임 (3장=3x1, 6장=3x2)"""
+    frame_range: tuple[int, int] | None = None,
+):
+    """셔플 - N장 카드가 계속 섞임 (합성 버퍼 뷰를 yield). (3장=3x1, 6장=3x2)"""
+    L = _layout()
     nc = n_cards or NUM_CARDS
-    cols, rows = (3, 1) if nc == 3 else (GRID_COLS, GRID_ROWS)
-    gap = 28
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-    card_w = (grid_w - (cols - 1) * gap) // cols
-    card_h = (grid_h - (rows - 1) * gap) // rows
-    if nc == 3:
-        card_h = int(card_h * 0.7)  # 3장: 위아래 15%씩 높이 축소
+    grid = L.grid(nc)  # 3장: 위아래 15%씩 높이 축소
+    card_w, card_h = grid["card_w"], grid["card_h"]
     if card_back is None:
         card_img = _load_card_back(deck_path, (card_w, card_h))
     elif card_back.size != (card_w, card_h):
         card_img = card_back.resize((card_w, card_h), Image.Resampling.LANCZOS)
     else:
         card_img = card_back
-    if bg_image is not None:
-        base = bg_image.copy()
-    else:
-        base = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
-
-    cx, cy = config.VIDEO_WIDTH // 2, config.VIDEO_HEIGHT // 2
-    t = frame_idx / 30.0
-
-    def clamp_x(x): return max(0, min(config.VIDEO_WIDTH - card_w, int(x)))
-    def clamp_y(y): return max(0, min(config.VIDEO_HEIGHT - card_h, int(y)))
+    card_arr = np.asarray(card_img)
+    comp = _new_compositor(bg_image)
 
-    if style == "chaos_orbit":
-        for i in range(nc):
-            spd = 90 + (i % 3) * 40 + (i // 3) * 25
-            angle = t * spd + i * 42
-            r = 120 + 80 * np.sin(t * 2.1 + i * 0.7)
-            dx = int(r * np.sin(np.radians(angle)))
-            dy = int(-r * 0.6 * np.cos(np.radians(angle)))
-            x, y = clamp_x(cx - card_w // 2 + dx), clamp_y(cy - card_h // 2 + dy)
-            base.paste(card_img, (x, y))
-    elif style == "scatter_swirl":
-        for i in range(nc):
-            a1, a2 = t * 120 + i * 50, t * 90 - i * 35
-            r1 = 100 + 60 * np.sin(t * 1.5 + i)
-            r2 = 80 + 50 * np.cos(t * 1.2 + i * 0.8)
-            dx = int(r1 * np.sin(np.radians(a1)) + r2 * 0.5 * np.cos(np.radians(a2)))
-            dy = int(-r1 * 0.7 * np.cos(np.radians(a1)) + r2 * 0.4 * np.sin(np.radians(a2)))
-            x, y = clamp_x(cx - card_w // 2 + dx), clamp_y(cy - card_h // 2 + dy)
-            base.paste(card_img, (x, y))
-    elif style == "bounce_mix":
-        for i in range(nc):
-            vx, vy = 180 + (i * 37) % 140, 150 + (i * 29) % 120
-            ox = 100 * np.sin(t * 0.9 + i * 0.6)
-            oy = 90 * np.cos(t * 1.1 + i * 0.5)
-            dx = int(180 * np.sin(np.radians(t * vx)) + ox)
-            dy = int(-160 * np.cos(np.radians(t * vy)) + oy)
-            x, y = clamp_x(cx - card_w // 2 + dx), clamp_y(cy - card_h // 2 + dy)
-            base.paste(card_img, (x, y))
-    else:
-        for i in range(nc):
-            angle = t * (100 + i * 15) + i * 40
-            r = 80 + 100 * (0.5 + 0.5 * np.sin(t * 2.5 + i * 0.9))
-            dr = 30 * np.sin(t * 3 + i * 1.2)
-            dx = int((r + dr) * np.sin(np.radians(angle)))
-            dy = int(-(r + dr) * 0.7 * np.cos(np.radians(angle)))
-            x, y = clamp_x(cx - card_w // 2 + dx), clamp_y(cy - card_h // 2 + dy)
-            base.paste(card_img, (x, y))
-    return base
+    positions = _shuffle_card_positions(style, n_frames, nc, card_w, card_h)
+    for frame_idx in _frame_span(n_frames, frame_range):
+        comp.begin_frame()
+        for x, y in positions[frame_idx]:
+            comp.blit(card_arr, x, y)
+        yield comp.frame()
 
 
 def _ease_out_quad(p: float) -> float:
@@ -1306,27 +1312,19 @@ def _ease_out_quad(p: float) -> float:
     return 1.0 - (1.0 - p) ** 2
 
 
-def _create_cards_fly_to_grid_frames(
+def _iter_cards_fly_to_grid_frames(
     deck_path: Path,
     duration_sec: float,
     bg_image: Image.Image | None = None,
     card_back: Image.Image | None = None,
     n_cards: int | None = None,
-) -> list:
-    """셔플 후 중앙 카드들이 1~N번 자리로 날아가는 프레임. (3장=3x1, 6장=3x2)"""
+    frame_range: tuple[int, int] | None = None,
+):
+    """셔플 후 중앙 카드들이 1~N번 자리로 날아가는 프레임 (합성 버퍼 뷰를 yield). (3장=3x1, 6장=3x2)"""
+    L = _layout()
     nc = n_cards or NUM_CARDS
-    cols, rows = (3, 1) if nc == 3 else (GRID_COLS, GRID_ROWS)
-    gap = 28
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-    cw = (grid_w - (cols - 1) * gap) // cols
-    ch = (grid_h - (rows - 1) * gap) // rows
-    if nc == 3:
-        ch = int(ch * 0.7)  # 3장: 위아래 15%씩 높이 축소
-    total_w = cols * cw + (cols - 1) * gap
-    total_h = rows * ch + (rows - 1) * gap
-    offset_x = (config.VIDEO_WIDTH - total_w) // 2
-    offset_y = (config.VIDEO_HEIGHT - total_h) // 2
+    grid = L.grid(nc)  # 3장: 위아래 15%씩 높이 축소
+    cw, ch = grid["card_w"], grid["card_h"]
 
     if card_back is None:
         card_img = _load_card_back(deck_path, (cw, ch))
@@ -1334,29 +1332,21 @@ def _create_cards_fly_to_grid_frames(
         card_img = card_back.resize((cw, ch), Image.Resampling.LANCZOS)
     else:
         card_img = card_back
+    card_arr = np.asarray(card_img)
+    comp = _new_compositor(bg_image)
 
-    if bg_image is not None:
-        base_bg = bg_image.copy()
-    else:
-        base_bg = Image.new("RGB", (config.VIDEO_WIDTH, config.VIDEO_HEIGHT), color="#1a0a2e")
-
-    cx = config.VIDEO_WIDTH // 2 - cw // 2
-    cy = config.VIDEO_HEIGHT // 2 - ch // 2
-    targets = []
-    for i in range(nc):
-        col, row = i % cols, i // cols
-        tx = offset_x + col * (cw + gap)
-        ty = offset_y + row * (ch + gap)
-        targets.append((tx, ty))
-
-    n_frames = max(1, int(config.VIDEO_FPS * duration_sec))
+    cx = L.width // 2 - cw // 2
+    cy = L.height // 2 - ch // 2
+    targets = grid["cells"]
+
+    fps = _fps()
+    n_frames = max(1, int(fps * duration_sec))
     fly_dur_sec = 0.14
     start_offset_sec = 0.14
 
-    frames = []
-    for fi in range(n_frames):
-        t = fi / config.VIDEO_FPS
-        frame = base_bg.copy()
+    for fi in _frame_span(n_frames, frame_range):
+        t = fi / fps
+        comp.begin_frame()
         for i in range(nc):
             start_i = i * start_offset_sec
             if t <= start_i:
@@ -1369,9 +1359,97 @@ def _create_cards_fly_to_grid_frames(
                 tx, ty = targets[i]
                 x = int(cx + (tx - cx) * prog)
                 y = int(cy + (ty - cy) * prog)
-            frame.paste(card_img, (x, y))
-        frames.append(np.array(frame))
-    return frames
+            comp.blit(card_arr, x, y)
+        yield comp.frame()
+
+
+def _iter_memoized_frames(states, render):
+    """
+    프레임 상태 메모이제이션. states: 프레임별 상태 키(해시 가능, 프레임이 의존하는 입력 전부),
+    render(state): 해당 상태의 프레임. 같은 상태는 한 번만 렌더링하고 같은 배열을 참조로 재사용.
+    """
+    rendered = {}
+    for state in states:
+        frame = rendered.get(state)
+        if frame is None:
+            frame = np.asarray(render(state))
+            frame.flags.writeable = False
+            rendered[state] = frame
+        yield frame
+
+
+def _iter_cards_face_frames(
+    deck_path: Path,
+    card_indices: list[int],
+    n_show: int,
+    n_flip: int,
+    bg_image: Image.Image | None = None,
+    card_back: Image.Image | None = None,
+    frame_range: tuple[int, int] | None = None,
+):
+    """N장 앞면 + '이 카드를 사용해볼게요' 깜빡임(n_show) 후 앞→뒤 뒤집기(n_flip)."""
+    center_text = "이 카드를 사용해볼게요"
+    blink_frames = max(1, int(_fps() * 0.5))
+    span = _frame_span(n_show + n_flip, frame_range)
+    # 프레임 상태 = 가운데 문구 표시 여부 (2가지) → 2번만 렌더링
+    yield from _iter_memoized_frames(
+        ((i // blink_frames) % 2 == 0 for i in range(span.start, min(span.stop, n_show))),
+        lambda show_text: _create_9cards_with_center_text(deck_path, card_indices, center_text, show_text, bg_image),
+    )
+    comp = _new_compositor(bg_image)
+    for i in range(max(0, span.start - n_show), max(0, span.stop - n_show)):
+        p = i / (n_flip - 1) if n_flip > 1 else 1.0
+        yield _create_card_flip_front_to_back_frame(
+            deck_path, card_indices, p,
+            center_text=center_text, show_center_text=False,
+            card_back=card_back, compositor=comp,
+        )
+
+
+def _iter_card_flip_frames(
+    deck_path: Path,
+    card_indices: list[int],
+    n_frames: int,
+    bg_image: Image.Image | None = None,
+    card_back: Image.Image | None = None,
+    frame_range: tuple[int, int] | None = None,
+):
+    """카드 N장 순차 뒤→앞 공개 프레임."""
+    comp = _new_compositor(bg_image)
+    for i in _frame_span(n_frames, frame_range):
+        p = i / (n_frames - 1) if n_frames > 1 else 1.0
+        yield _create_card_flip_frame(deck_path, card_indices, _ease_in_out(p), card_back=card_back, compositor=comp)
+
+
+def _iter_segment_transition_frames(
+    deck_path: Path,
+    cards_out: list[int],
+    cards_in: list[int],
+    meanings_out: list[str],
+    meanings_in: list[str],
+    n_frames: int,
+    bg_image: Image.Image | None = None,
+    card_back: Image.Image | None = None,
+    frame_range: tuple[int, int] | None = None,
+):
+    """1~3번 → 4~6번 구간 전환 프레임 (합성 버퍼 뷰를 yield)."""
+    comp = _new_compositor(bg_image)
+    for i in _frame_span(n_frames, frame_range):
+        p = i / (n_frames - 1) if n_frames > 1 else 1.0
+        yield _create_segment_transition_frame(
+            deck_path, cards_out, cards_in, meanings_out, meanings_in,
+            0, 3, p, card_back=card_back, compositor=comp
+        )
+
+
+def _iter_closing_frames(bg_image: Image.Image, n_frames: int, frame_range: tuple[int, int] | None = None):
+    """마지막 인사 프레임 ('댓글' 0.4초 간격 깜빡임)."""
+    blink_interval_frames = max(1, int(_fps() * 0.4))
+    # 프레임 상태 = '댓글' 강조 여부 (2가지) → 2번만 렌더링
+    yield from _iter_memoized_frames(
+        ((fi // blink_interval_frames) % 2 == 0 for fi in _frame_span(n_frames, frame_range)),
+        lambda highlight: _create_closing_frame(bg_image, comment_blink_highlight=highlight),
+    )
 
 
 def prepend_thumbnail_to_video(
@@ -1382,6 +1460,8 @@ def prepend_thumbnail_to_video(
 ) -> str:
     """
     영상 맨 앞에 썸네일 이미지를 duration_sec초 동안 붙인 새 영상을 만듭니다.
+    이 프로그램이 만든 영상(렌더링 기록 있음)이면 썸네일 구간만 같은 코덱 설정으로 인코딩해 스트림 복사로 이어 붙이고
+    (_prepend_thumbnail_fast, 1초 안팎), 안 되면 MoviePy로 전체를 다시 인코딩.
     video_path: 원본 영상 경로
     thumbnail_path: 썸네일 이미지 경로 (PNG/JPEG)
     output_path: 출력 경로. None이면 원본과 같은 폴더에 _with_thumb 접미사로 저장
@@ -1401,6 +1481,9 @@ def prepend_thumbnail_to_video(
         p = Path(video_path)
         output_path = str(p.parent / f"{p.stem}_with_thumb{p.suffix}")
 
+    if _prepend_thumbnail_fast(video_path, thumbnail_path, output_path, duration_sec):
+        return output_path
+
     main = VideoFileClip(video_path)
     w, h = main.size
     # MoviePy 1.0.3 ImageClip에는 resize 없음 → PIL로 리사이즈 후 ImageClip 생성
@@ -1408,15 +1491,16 @@ def prepend_thumbnail_to_video(
     thumb_resized = thumb_img.resize((w, h), Image.Resampling.LANCZOS)
     thumb_clip = ImageClip(np.array(thumb_resized)).set_duration(duration_sec)
     final = concatenate_videoclips([thumb_clip, main])
-    encode_preset = getattr(config, "VIDEO_ENCODE_PRESET", "medium")
-    encode_threads = getattr(config, "VIDEO_ENCODE_THREADS", 4) or 4
+    # 인코더 프로필(있으면) → VIDEO_ENCODE_PRESET / VIDEO_ENCODE_THREADS (0=자동이면 -threads 생략)
+    encode_preset, encode_threads = get_encode_settings()
     final.write_videofile(
         output_path,
         fps=main.fps,
         codec="libx264",
         audio_codec="aac",
         preset=encode_preset,
-        threads=encode_threads,
+        threads=encode_threads or None,
+        ffmpeg_params=get_x264_params() or None,
         logger=None,
     )
     thumb_clip.close()
@@ -1425,34 +1509,61 @@ def prepend_thumbnail_to_video(
     return output_path
 
 
-def generate_tarot_video(
-    fortune_type: str = "",
-    background_path: str | None = None,
-    music_path: str | None = None,
-    output_path: str = "",
-    time_slot_id: str | None = None,
-    use_minor_arcana: bool = False,
-    minor_fortune_type: str | None = None,
-    major_theme: str | None = None,
-    hook_duration_sec: float | None = None,
-    hook_text_override: str | None = None,
-) -> tuple[str, str]:
-    """
-    타로 운세 Shorts 영상 생성
+def _prepend_thumbnail_fast(video_path: str, thumbnail_path: str, output_path: str, duration_sec: float) -> bool:
+    """렌더링 기록의 해상도·fps·프리셋으로 썸네일 구간만 인코딩해 원본 앞에 스트림 복사로 연결. 못 하면 False."""
+    manifest = load_render_manifest(video_path)
+    if not manifest or getattr(config, "VIDEO_ENCODER", "ffmpeg") != "ffmpeg":
+        return False
+    fps = int(manifest["fps"])
+    size = get_profile_size(manifest["render_profile"])
+    thumb = Image.open(thumbnail_path).convert("RGB").resize(size, Image.Resampling.LANCZOS)
+    segment = still_segment(np.array(thumb), max(1, round(duration_sec * fps)))
+    try:
+        prepend_segment(segment, video_path, output_path, fps=fps, preset=manifest["preset"])
+    except Exception as e:
+        print(f"⚠️ 썸네일 빠른 연결 실패, 전체 다시 인코딩: {e}")
+        return False
+    return True
 
-    Args:
-        time_slot_id: 아침(morning)/점심(lunch)/저녁(evening) 지정 시 해당 훅·테마 사용. None이면 랜덤.
-        major_theme: 메이저 22장 기반 추가 주제 (직장운/학업운/인간관계운/재회·이별운)
-        hook_duration_sec: 훅(첫 화면) 노출 시간(초). None이면 config 기본값 사용.
-        hook_text_override: 감성형 타로(4테마) 사용 시 사용자 선택 제목. 지정 시 랜덤 문구 대신 사용.
-        background_path: 배경 이미지 (None이면 단색)
-        music_path: 배경음악 (None 가능)
-        output_path: 출력 경로
 
-    Returns:
-        (생성된 영상 경로, 테마명)
+
+
+class RenderChoices(TypedDict):
     """
-    times = config.TAROT_SECTION_TIMES
+    영상 1개의 랜덤 선택·GPT 결과 전부 (JSON 저장 가능).
+    같은 값으로 다시 렌더링하면 해상도·fps만 다르고 내용은 같은 영상 (초안 → 최종 렌더링).
+    """
+    theme_name: str
+    major_theme: str | None
+    deck_path: str
+    shuffle_style: ShuffleStyle
+    num_cards: int
+    card_indices: list[int]
+    display_order: list[int]     # 앞면 공개(아침 운세) 자리 순서
+    shuffled_order: list[int]    # 셔플 후 1~N번 자리 순서
+    card_meanings: list[str]
+    is_empathy: bool
+    hook_text: str               # 첫 화면 문구 (감성형: 사용자 선택 제목)
+    empathy_ment: str | None     # 감성형 공감 멘트 (GPT)
+    font_path: str | None
+    background_path: str | None
+    card_back_path: str | None
+    music_path: str | None
+    music_start: float | None    # 첫 렌더링 때 정해짐 (하이라이트 감지 결과 재사용)
+    thumbnail_path: str | None   # 있으면 맨 앞 썸네일 인트로 구간 (음악은 그 뒤부터)
+    thumbnail_sec: float | None
+
+
+def _pick_render_choices(
+    background_path: str | None,
+    music_path: str | None,
+    time_slot_id: str | None,
+    use_minor_arcana: bool,
+    minor_fortune_type: str | None,
+    major_theme: str | None,
+    hook_text_override: str | None,
+) -> RenderChoices:
+    """훅·덱·카드·셔플·배경·폰트·카드 뒷면 랜덤 선택 + GPT 해석 생성 (렌더링 전 한 번만)."""
     shuffle_style = pick_random_shuffle()
     deck_path = get_random_deck_path()
 
@@ -1495,243 +1606,555 @@ def generate_tarot_video(
         card_indices, theme_name, hook_text_override=hook_text_override
     )
 
-    # 배경: 전달받은 경로 또는 assets/images에서 랜덤
-    global _video_font_path
-    _video_font_path = config.get_random_font_path()
+    # 폰트·배경(전달받은 경로 또는 assets/images에서 랜덤)·카드 뒷면
+    font_path = config.get_random_font_path()
     bg_path = background_path or config.get_random_background_path()
-    bg_img = _get_background_image(bg_path)
-
-    cols, rows = (3, 1) if num_cards_use == 3 else (GRID_COLS, GRID_ROWS)
-    gap = 28
-    grid_w = int(config.VIDEO_WIDTH * 0.82)
-    grid_h = int(config.VIDEO_HEIGHT * 0.82)
-    cw = (grid_w - (cols - 1) * gap) // cols
-    ch = (grid_h - (rows - 1) * gap) // rows
-    if num_cards_use == 3:
-        ch = int(ch * 0.7)  # 3장: 위아래 15%씩 높이 축소
-    card_back_img = _load_card_back(deck_path, (cw, ch))
-
-    # 클립 리스트
-    clips = []
-    t = 0.0
+    card_back_path = _pick_card_back_path(deck_path)
 
+    # 첫 화면: 감성형 타로면 공감 멘트 / 아침 타로운세면 미사용 훅 제목 (문구는 썸네일에만)
     is_empathy = bool(hook_text_override and hook_text_override.strip())
-
-    # 1. 첫 화면: 감성형 타로면 공감 멘트만 (3초, 줄간격 넓게) / 아침 타로운세면 1초 배경
+    empathy_ment = None
     if is_empathy:
         hook_title_text = hook_text_override.strip()
-        hook_title_id = 0
         print("  🤖 공감 멘트 생성 중...")
         empathy_ment = generate_empathy_ment(hook_title_text)
-        empathy_sec = 3.5  # 멘트 노출 3.5초
-        empathy_frame = _create_empathy_ment_screen(
-            empathy_ment,
-            bg_image=bg_img,
-            font_size=82,       # 글자 크게 (공간 활용)
-            chars_per_line=9,   # 7~10자/줄 가독성
-            line_spacing=40,    # 줄간격 넓게
-        )
-        n_empathy = max(1, int(config.VIDEO_FPS * empathy_sec))
-        clips.append(ImageSequenceClip([np.array(empathy_frame)] * n_empathy, fps=config.VIDEO_FPS))
-        t += empathy_sec
     else:
         hook_title_text, hook_title_id = get_random_unused_hook_title()
-        hook_sec = times["hook"]  # 1초 고정
-        n_hook = max(1, int(config.VIDEO_FPS * hook_sec))
-        hook_frame = np.array(bg_img.copy())
-        clips.append(ImageSequenceClip([hook_frame] * n_hook, fps=config.VIDEO_FPS))
-        t += hook_sec
         if hook_title_id > 0:
             mark_hook_title_used(hook_title_id)
 
+    return RenderChoices(
+        theme_name=theme_name,
+        major_theme=major_theme or None,
+        deck_path=str(deck_path),
+        shuffle_style=shuffle_style,
+        num_cards=num_cards_use,
+        card_indices=card_indices,
+        display_order=display_order_10s,
+        shuffled_order=shuffled_order,
+        card_meanings=card_meanings,
+        is_empathy=is_empathy,
+        hook_text=hook_title_text,
+        empathy_ment=empathy_ment,
+        font_path=font_path,
+        background_path=bg_path,
+        card_back_path=str(card_back_path) if card_back_path else None,
+        music_path=str(music_path) if music_path else None,
+        music_start=None,
+        thumbnail_path=None,
+        thumbnail_sec=None,
+    )
+
+
+def _reference_render_choices() -> RenderChoices:
+    """
+    인코더 자동 조정용 고정 선택 (랜덤·GPT·훅 DB 없음): 첫 덱·첫 셔플·이름순 첫 폰트/배경, 카드 0~N-1,
+    해석은 카드 기본 의미. 같은 컴퓨터에서는 항상 같은 영상.
+    """
+    decks = get_available_decks()
+    if not decks:
+        raise RuntimeError(
+            "타로 덱이 없습니다. '타로덱_다운로드.bat'을 실행해 덱을 다운로드하세요."
+        )
+    deck_path = config.TAROT_DIR / decks[0]
+    fonts = sorted(p for p in config.FONTS_DIR.glob("*") if p.suffix.lower() in {".ttf", ".otf"} and p.is_file())
+    images = sorted(p for p in config.IMAGES_DIR.glob("*") if p.suffix.lower() in {".png", ".jpg", ".jpeg"} and p.is_file())
+    card_indices = list(range(NUM_CARDS))
+    return RenderChoices(
+        theme_name="기준 영상",
+        major_theme=None,
+        deck_path=str(deck_path),
+        shuffle_style=SHUFFLE_STYLES[0],
+        num_cards=NUM_CARDS,
+        card_indices=card_indices,
+        display_order=list(range(NUM_CARDS)),
+        shuffled_order=list(range(NUM_CARDS)),
+        card_meanings=[get_card_info(i)["meaning"] for i in card_indices],
+        is_empathy=False,
+        hook_text="기준 영상",
+        empathy_ment=None,
+        font_path=str(fonts[0]) if fonts else None,
+        background_path=str(images[0]) if images else None,
+        card_back_path=str(deck_path / "back.png"),
+        music_path=None,
+        music_start=None,
+        thumbnail_path=None,
+        thumbnail_sec=None,
+    )
+
+
+def render_reference_video(output_path: str, render_profile: str | None = None) -> str:
+    """인코더 자동 조정용 기준 숏츠 (_reference_render_choices, 음악 없음). GPT·네트워크·훅 DB 사용 안 함."""
+    return _render_tarot_video(_reference_render_choices(), output_path, render_profile)
+
+
+class RenderManifest(TypedDict):
+    """렌더링 기록 (영상 옆 <이름>.render.json). 첫 화면 문구만 바꿀 때 나머지 구간을 그대로 재사용."""
+    version: int
+    choices: RenderChoices
+    render_profile: str | None
+    fps: int
+    preset: str
+    draft: bool
+    segment_frames: list[int]    # 구간별 프레임 수 (첫 구간 교체 시 경계 위치)
+
+
+# 구간 구성이 바뀌면 올려서 예전 매니페스트로 부분 재렌더링하지 않게
+MANIFEST_VERSION = 1
+
+
+def _manifest_path(video_path: str | Path) -> Path:
+    p = Path(video_path)
+    return p.with_name(f"{p.stem}.render.json")
+
+
+def _save_render_manifest(video_path: str, manifest: RenderManifest) -> None:
+    path = _manifest_path(video_path)
+    try:
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ 렌더링 기록 저장 실패 (문구 수정 시 전체 재생성): {e}")
+
+
+def load_render_manifest(video_path: str | Path) -> RenderManifest | None:
+    """영상의 렌더링 기록. 없거나 버전이 다르면 None."""
+    path = _manifest_path(video_path)
+    if not path.is_file():
+        return None
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def _begin_render(choices: RenderChoices, render_profile: str | None, fps: int | None) -> tuple[Layout, int, Image.Image]:
+    """이번 영상의 화면 배치·fps·폰트 지정 (모든 화면 함수가 _layout()/_fps()로 같은 값 사용). (레이아웃, fps, 배경) 반환."""
+    global _video_font_path, _video_layout, _video_fps
+    _video_layout = get_layout(*get_profile_size(render_profile))
+    _video_fps = int(fps or config.VIDEO_FPS)
+    _video_font_path = choices["font_path"]
+    _use_card_atlas(Path(choices["deck_path"]), None)  # 아틀라스는 _render_tarot_video가 지정
+    return _video_layout, _video_fps, _get_background_image(choices["background_path"])
+
+
+def _create_background_frame(bg_image: Image.Image) -> Image.Image:
+    """배경만 있는 화면 (아침 타로운세 첫 화면 - 문구는 썸네일에만)"""
+    return bg_image
+
+
+def _create_thumbnail_frame(thumbnail_path: str) -> Image.Image:
+    """썸네일 인트로 화면: 썸네일 이미지를 영상 크기로 (prepend_thumbnail_to_video와 같은 LANCZOS 리사이즈)"""
+    return Image.open(thumbnail_path).convert("RGB").resize(_layout().size, Image.Resampling.LANCZOS)
+
+
+def _empathy_spec(choices: RenderChoices, bg_img: Image.Image, fps: int) -> SegmentSpec:
+    """감성형 첫 화면: 공감 멘트 3.5초 (줄간격 넓게)"""
+    return timeline.still(
+        "empathy", EMPATHY_SEC, fps, _create_empathy_ment_screen,
+        text=choices["empathy_ment"],
+        bg_image=bg_img,
+        font_size=82,       # 글자 크게 (공간 활용)
+        chars_per_line=9,   # 7~10자/줄 가독성
+        line_spacing=40,    # 줄간격 넓게
+    )
+
+
+def _build_timeline(
+    choices: RenderChoices, fps: int, bg_img: Image.Image, card_back_img: Image.Image,
+) -> list[SegmentSpec]:
+    """
+    choices대로 영상 구간 명세 리스트 (순서대로 이어 붙임). 구간 길이는 config.TAROT_SECTION_TIMES.
+    cache가 있는 구간은 카드·GPT 문구와 무관 → 배경·폰트·카드 뒷면·카드 수(+해상도·fps·코덱)가 같으면 구간 캐시 재사용.
+    """
+    times = config.TAROT_SECTION_TIMES
+    deck_path = Path(choices["deck_path"])
+    num_cards_use = choices["num_cards"]
+    card_indices = choices["card_indices"]
+    shuffled_order = choices["shuffled_order"]
+    card_meanings = choices["card_meanings"]
+    is_empathy = choices["is_empathy"]
+    common = dict(deck_path=deck_path, bg_image=bg_img, card_back=card_back_img)
+    specs = []
+
+    # 0. 썸네일 인트로 (generate_tarot_video(thumbnail=...)): 썸네일 이미지 정지 화면
+    if choices.get("thumbnail_path"):
+        specs.append(timeline.still(
+            "thumbnail_intro", choices.get("thumbnail_sec") or times["thumbnail_intro"], fps,
+            _create_thumbnail_frame, thumbnail_path=choices["thumbnail_path"],
+        ))
+
+    # 1. 첫 화면: 감성형 타로면 공감 멘트만 (3.5초, 줄간격 넓게) / 아침 타로운세면 1초 배경
+    if is_empathy:
+        specs.append(_empathy_spec(choices, bg_img, fps))
+    else:
+        hook_sec = times["hook"]  # 1초 고정
+        n_hook = max(1, int(fps * hook_sec))
+        specs.append(timeline.still(
+            "hook", hook_sec, fps, _create_background_frame, cache=("hook", n_hook), bg_image=bg_img,
+        ))
+
     # 2. 아침 타로운세만: N장 카드 앞면 + "이 카드를 사용해볼게요" + 앞→뒤 뒤집기 / 감성형: 스킵(바로 뒷장 셔플)
-    cards_at_10s = [card_indices[display_order_10s[i]] for i in range(num_cards_use)]
     if not is_empathy:
+        cards_at_10s = [card_indices[choices["display_order"][i]] for i in range(num_cards_use)]
         face_dur = times["cards_face"]
         face_show_sec = 3.0
         flip_sec = max(1.0, face_dur - face_show_sec)
-        cards_face_frames = []
-        n_show = max(1, int(config.VIDEO_FPS * face_show_sec))
-        for i in range(n_show):
-            show_text = (i // int(config.VIDEO_FPS * 0.5)) % 2 == 0
-            frame = _create_9cards_with_center_text(
-                deck_path, cards_at_10s, "이 카드를 사용해볼게요", show_text, bg_img
-            )
-            cards_face_frames.append(np.array(frame))
-        n_flip_ftb = max(1, int(config.VIDEO_FPS * flip_sec))
-        for i in range(n_flip_ftb):
-            p = i / (n_flip_ftb - 1) if n_flip_ftb > 1 else 1.0
-            frame = _create_card_flip_front_to_back_frame(
-                deck_path, cards_at_10s, p,
-                center_text="이 카드를 사용해볼게요", show_center_text=False,
-                bg_image=bg_img, card_back=card_back_img
-            )
-            cards_face_frames.append(np.array(frame))
-        clips.append(ImageSequenceClip(cards_face_frames, fps=config.VIDEO_FPS))
-        t += face_dur
+        n_show = max(1, int(fps * face_show_sec))
+        n_flip_ftb = max(1, int(fps * flip_sec))
+        specs.append(timeline.frames(
+            "cards_face", face_dur, fps, _iter_cards_face_frames, frame_count=n_show + n_flip_ftb,
+            card_indices=cards_at_10s, n_show=n_show, n_flip=n_flip_ftb, **common,
+        ))
 
     # 3b. 그리드 1~N번 카드가 중앙으로 모임 (셔플 직전)
     gather_dur = times.get("gather_to_center", 1.5)
-    gather_frames = _create_cards_fly_to_center_frames(
-        deck_path, gather_dur, bg_image=bg_img, card_back=card_back_img, n_cards=num_cards_use
-    )
-    clips.append(ImageSequenceClip(gather_frames, fps=config.VIDEO_FPS))
-    t += gather_dur
+    n_gather = max(1, int(fps * gather_dur))
+    specs.append(timeline.frames(
+        "gather_to_center", gather_dur, fps, _iter_cards_fly_to_center_frames, cache=("gather", gather_dur, n_gather),
+        duration_sec=gather_dur, n_cards=num_cards_use, **common,
+    ))
 
     # 4. 셔플 - 카드가 멈추지 않고 이리저리 계속 섞임
-    shuffle_frames = []
-    n_frames = max(1, int(config.VIDEO_FPS * times["shuffle"]))
-    for i in range(n_frames):
-        frame = _create_shuffle_frame(deck_path, shuffle_style["card_movement"], i, n_frames, bg_image=bg_img, card_back=card_back_img, n_cards=num_cards_use)
-        shuffle_frames.append(np.array(frame))
-    shuffle_clip = ImageSequenceClip(shuffle_frames, fps=config.VIDEO_FPS)
-    clips.append(shuffle_clip)
-    t += times["shuffle"]
+    movement = choices["shuffle_style"]["card_movement"]
+    n_shuffle = max(1, int(fps * times["shuffle"]))
+    specs.append(timeline.frames(
+        "shuffle", times["shuffle"], fps, _iter_shuffle_frames, cache=("shuffle", movement, n_shuffle),
+        style=movement, n_frames=n_shuffle, n_cards=num_cards_use, **common,
+    ))
 
     # 4b. 카드가 중앙에서 1~N번 자리로 이동
     arrange_move_dur = times.get("arrange_move", 1.6)
-    fly_frames = _create_cards_fly_to_grid_frames(
-        deck_path, arrange_move_dur, bg_image=bg_img, card_back=card_back_img, n_cards=num_cards_use
-    )
-    clips.append(ImageSequenceClip(fly_frames, fps=config.VIDEO_FPS))
-    t += arrange_move_dur
-
-    # 5a. 카드 뒷면 + 번호 + 선택 안내 (감성형: 4초, 줄바꿈 / 일반: 3초)
+    n_arrange = max(1, int(fps * arrange_move_dur))
+    specs.append(timeline.frames(
+        "arrange_move", arrange_move_dur, fps, _iter_cards_fly_to_grid_frames,
+        cache=("arrange", arrange_move_dur, n_arrange),
+        duration_sec=arrange_move_dur, n_cards=num_cards_use, **common,
+    ))
+
+    # 5a. 카드 뒷면 + 번호 + 선택 안내 (감성형: 3초, 줄바꿈 / 일반: 3초)
     facedown_sec = 3.0 if num_cards_use == 3 else times["arrange_facedown"]  # 감성형: 선택 안내 3초
     pick_msg = "1, 2, 3번 카드 중\n하나를 선택하세요" if num_cards_use == 3 else "여기에서 카드를\n한장 선택하세요!"
-    arrange_facedown = _create_9cards_facedown_with_numbers(
-        deck_path, bg_image=bg_img, card_back=card_back_img, n_cards=num_cards_use,
-        pick_message=pick_msg, msg_font_size=96 if num_cards_use == 3 else None,
-    )
-    clips.append(ImageClip(np.array(arrange_facedown)).set_duration(facedown_sec))
-    t += facedown_sec
+    msg_font_size = 96 if num_cards_use == 3 else None
+    n_facedown = max(1, int(fps * facedown_sec))
+    specs.append(timeline.still(
+        "arrange_facedown", facedown_sec, fps, _create_9cards_facedown_with_numbers,
+        cache=("facedown", pick_msg, msg_font_size, n_facedown),
+        n_cards=num_cards_use, pick_message=pick_msg, msg_font_size=msg_font_size, **common,
+    ))
 
     # 5b. 카드 회전하면서 뒤집어서 공개 (N장 순차 뒤→앞)
     cards_after_shuffle = [card_indices[shuffled_order[i]] for i in range(num_cards_use)]
-    flip_frames = []
-    n_flip_frames = max(1, int(config.VIDEO_FPS * times["arrange_faceup"]))
-    for i in range(n_flip_frames):
-        p = i / (n_flip_frames - 1) if n_flip_frames > 1 else 1.0
-        p = _ease_in_out(p)
-        frame = _create_card_flip_frame(deck_path, cards_after_shuffle, p, bg_image=bg_img, card_back=card_back_img)
-        flip_frames.append(np.array(frame))
-    flip_clip = ImageSequenceClip(flip_frames, fps=config.VIDEO_FPS)
-    clips.append(flip_clip)
-    t += times["arrange_faceup"]
+    n_flip_frames = max(1, int(fps * times["arrange_faceup"]))
+    specs.append(timeline.frames(
+        "arrange_faceup", times["arrange_faceup"], fps, _iter_card_flip_frames,
+        card_indices=cards_after_shuffle, n_frames=n_flip_frames, **common,
+    ))
 
     # 5c. N장 다 펼쳐진 상태 보여주기
-    flip_hold_dur = times.get("flip_hold", 2)
-    flip_hold_frame = _create_9cards_with_numbers(deck_path, cards_after_shuffle, bg_image=bg_img)
-    clips.append(ImageClip(np.array(flip_hold_frame)).set_duration(flip_hold_dur))
-    t += flip_hold_dur
+    specs.append(timeline.still(
+        "flip_hold", times.get("flip_hold", 2), fps, _create_9cards_with_numbers,
+        deck_path=deck_path, card_indices=cards_after_shuffle, bg_image=bg_img,
+    ))
 
     # 6. 1~3번 카드 + 의미 (감성형 3장이면 여기까지, 6장이면 seg2로)
     n_seg1 = min(3, num_cards_use)
     seg1_cards = [cards_after_shuffle[i] for i in range(n_seg1)]
     seg1_meanings = [card_meanings[shuffled_order[i]] for i in range(n_seg1)]
-    seg1 = _create_3cards_with_meanings(
-        deck_path, seg1_cards, seg1_meanings, number_offset=0, bg_image=bg_img
-    )
-    seg1_dur = 4.0 if num_cards_use == 3 else times["cards_1_3"]  # 감성형: 카드 리딩 4초
-    clips.append(ImageClip(np.array(seg1)).set_duration(seg1_dur))
-    t += seg1_dur
+    specs.append(timeline.still(
+        "cards_1_3", 4.0 if num_cards_use == 3 else times["cards_1_3"], fps,  # 감성형: 카드 리딩 4초
+        _create_3cards_with_meanings,
+        deck_path=deck_path, card_indices=seg1_cards, meanings=seg1_meanings, number_offset=0, bg_image=bg_img,
+    ))
 
     if num_cards_use > 3:
         # 6b. 전환 (1,2,3 → 4,5,6): 카드 뒤집기 + 글자 연기 효과
         trans_dur = times.get("segment_transition", 1.5)
         seg2_cards = [cards_after_shuffle[i] for i in range(3, 6)]
         seg2_meanings = [card_meanings[shuffled_order[i]] for i in range(3, 6)]
-        trans1_frames = []
-        n_trans = max(1, int(config.VIDEO_FPS * trans_dur))
-        for i in range(n_trans):
-            p = i / (n_trans - 1) if n_trans > 1 else 1.0
-            frame = _create_segment_transition_frame(
-                deck_path, seg1_cards, seg2_cards, seg1_meanings, seg2_meanings,
-                0, 3, p, bg_image=bg_img, card_back=card_back_img
-            )
-            trans1_frames.append(np.array(frame))
-        clips.append(ImageSequenceClip(trans1_frames, fps=config.VIDEO_FPS))
-        t += trans_dur
+        specs.append(timeline.frames(
+            "segment_transition", trans_dur, fps, _iter_segment_transition_frames,
+            cards_out=seg1_cards, cards_in=seg2_cards, meanings_out=seg1_meanings, meanings_in=seg2_meanings,
+            n_frames=max(1, int(fps * trans_dur)), **common,
+        ))
 
         # 7. 4~6번 카드 + 의미
-        seg2 = _create_3cards_with_meanings(
-            deck_path, seg2_cards, seg2_meanings, number_offset=3, bg_image=bg_img
-        )
-        clips.append(ImageClip(np.array(seg2)).set_duration(times["cards_4_6"]))
-        t += times["cards_4_6"]
+        specs.append(timeline.still(
+            "cards_4_6", times["cards_4_6"], fps, _create_3cards_with_meanings,
+            deck_path=deck_path, card_indices=seg2_cards, meanings=seg2_meanings, number_offset=3, bg_image=bg_img,
+        ))
 
     # 8. 마지막 인사 (6장이므로 7~9번 구간 없음): 당신이 고른 카드는~ / 댓글로 남겨주세요(댓글 깜빡임) / 인사 / 구독과 좋아요
     closing_dur = times.get("closing", 5)
-    n_closing = max(1, int(config.VIDEO_FPS * closing_dur))
-    blink_interval_frames = max(1, int(config.VIDEO_FPS * 0.4))
-    closing_frames = []
-    for fi in range(n_closing):
-        comment_highlight = (fi // blink_interval_frames) % 2 == 0
-        frame = _create_closing_frame(bg_img, comment_blink_highlight=comment_highlight)
-        closing_frames.append(np.array(frame))
-    clips.append(ImageSequenceClip(closing_frames, fps=config.VIDEO_FPS))
-
-    # 합성
-    final = concatenate_videoclips(clips)
-    music_path_str = str(music_path) if music_path else None
+    n_closing = max(1, int(fps * closing_dur))
+    specs.append(timeline.frames(
+        "closing", closing_dur, fps, _iter_closing_frames, cache=("closing", n_closing),
+        bg_image=bg_img, n_frames=n_closing,
+    ))
+    return specs
+
+
+def _render_tarot_video(
+    choices: RenderChoices,
+    output_path: str,
+    render_profile: str | None = None,
+    fps: int | None = None,
+    preset: str | None = None,
+    draft: bool = False,
+) -> str:
+    """
+    choices대로 타임라인(_build_timeline)을 만들고 렌더링·인코딩 (랜덤·GPT 호출 없음).
+    영상 옆에 렌더링 기록(RenderManifest) 저장.
+    render_profile: config.RENDER_PROFILES 이름, fps/preset: 없으면 config.VIDEO_FPS / 인코더 프로필·VIDEO_ENCODE_PRESET.
+    """
+    L, fps, bg_img = _begin_render(choices, render_profile, fps)
+    shuffle_style = choices["shuffle_style"]
+    deck_path = Path(choices["deck_path"])
+    grid = L.grid(choices["num_cards"])  # 3장: 위아래 15%씩 높이 축소
+    cw, ch = grid["card_w"], grid["card_h"]
+    # 덱 카드 아틀라스: 미리 만들어 둔 게 있으면 메모리 맵으로 읽고, 없으면 카드를 직접 디코딩 (LRU 캐시)
+    atlas = _card_atlas(deck_path)
+    if atlas is None and card_atlas.is_enabled():
+        print("ℹ️ 카드 아틀라스 없음. python scripts/build_card_atlas.py를 실행해 두면 카드 디코딩 없이 렌더링합니다.")
+    _use_card_atlas(deck_path, atlas)
+    back_path = Path(choices["card_back_path"]) if choices["card_back_path"] else None
+    card_back_img = _load_card_back(deck_path, (cw, ch), back_path)
+    encode_preset = get_encode_settings(preset)[0]
+    encoder = getattr(config, "VIDEO_ENCODER", "ffmpeg")
+
+    specs = _build_timeline(choices, fps, bg_img, card_back_img)
+
+    # 구간 캐시 공통 키: 배경·폰트·카드 뒷면·카드 수·해상도·fps·코덱 설정 (구간별 재료는 spec["cache"])
+    cache_base = None
+    if segment_cache.is_enabled() and encoder == "ffmpeg":
+        cache_base = (
+            L.size, fps, codec_signature(encode_preset), choices["num_cards"],
+            segment_cache.file_token(choices["background_path"]),
+            segment_cache.file_token(choices["font_path"]),
+            segment_cache.file_token(back_path),
+        )
+    segments = timeline.build_segments(specs, cache_base)
+
+    # 배경음악 (시작 위치는 첫 렌더링에서 정한 값을 choices에 남겨 재사용)
+    music: MusicTrack | None = None
+    music_path_str = choices["music_path"]
     if music_path_str and os.path.exists(music_path_str):
         try:
-            audio_src = AudioFileClip(music_path_str)
-            need_dur = final.duration
-            if getattr(config, "MUSIC_AUTO_HIGHLIGHT", False):
-                try:
-                    start_offset = _detect_music_highlight_start(audio_src, need_dur)
-                    if start_offset > 0:
-                        print(f"🎵 배경음악 하이라이트 자동 감지: {start_offset:.1f}초부터 재생")
-                except Exception:
-                    start_offset = 0
-            else:
-                start_offset = getattr(config, "MUSIC_START_OFFSET_SEC", 0) or 0
-            # 하이라이트 구간부터 재생: start_offset초부터 need_dur만큼 사용
-            if start_offset >= audio_src.duration:
-                start_offset = 0
-            end_time = start_offset + need_dur
-            if end_time <= audio_src.duration:
-                audio = audio_src.subclip(start_offset, end_time)
-            elif start_offset < audio_src.duration:
-                # 남은 구간 + 앞부분 루프로 채움
-                from moviepy.audio.AudioClip import concatenate_audioclips
-                remaining = audio_src.duration - start_offset
-                n = int((need_dur - remaining) / audio_src.duration) + 1
-                parts = [audio_src.subclip(start_offset, audio_src.duration)]
-                parts.extend([audio_src] * n)
-                audio = concatenate_audioclips(parts).subclip(0, need_dur)
-            else:
-                audio = audio_src.subclip(0, need_dur)
-            final = final.set_audio(audio)
+            # 썸네일 인트로 동안은 무음, 음악은 그 다음 구간부터
+            delay = specs[0]["n_frames"] / fps if choices.get("thumbnail_path") else 0.0
+            if choices.get("music_start") is None:
+                need_dur = timeline.timeline_frames(specs) / fps - delay
+                choices["music_start"] = _pick_music_start(music_path_str, need_dur)
+            music = {"path": music_path_str, "start": choices["music_start"], "delay": delay}
         except Exception as e:
             print(f"⚠️ 배경음악 로드 실패, 무음으로 진행: {e}")
     elif not music_path_str:
         print("ℹ️ 배경음악 없음. assets/music 폴더에 mp3, wav, m4a 파일을 넣으면 자동 적용됩니다.")
 
-    encode_preset = getattr(config, "VIDEO_ENCODE_PRESET", "medium")
-    encode_threads = getattr(config, "VIDEO_ENCODE_THREADS", 4) or 4
-    print(f"🎬 타로 영상 생성: {theme_name} | 덱: {deck_path.name} | 셔플: {shuffle_style['name']} (인코딩: {encode_preset})")
-    final.write_videofile(
-        output_path,
-        fps=config.VIDEO_FPS,
-        codec="libx264",
-        audio_codec="aac",
-        preset=encode_preset,
-        threads=encode_threads,
-        logger=None,
+    print(
+        f"🎬 타로 영상 생성: {choices['theme_name']} | 덱: {deck_path.name} | 셔플: {shuffle_style['name']} "
+        f"({L.width}x{L.height} {fps}fps, 인코딩: {encoder}/{encode_preset})"
     )
-    final.close()
+    cost = timeline.estimate_cost(specs)
+    print(
+        f"🗂️ 타임라인: 구간 {len(specs)}개, {cost['frames']}프레임 (그릴 프레임 {cost['render_frames']}, "
+        f"캐시 대상 {cost['cacheable_frames']})"
+    )
+    dedupe_before = get_dedupe_stats()
+    processes = get_render_processes()
+    if processes > 1:
+        # 워커가 카드를 다시 디코딩하지 않도록: 아틀라스가 있으면 워커가 직접 메모리 맵으로 열고,
+        # 없으면 이번 영상에 쓰는 카드(그리드·전환 화면 크기)를 공유 메모리로
+        card_images = {}
+        if atlas is None:
+            for idx in choices["card_indices"]:
+                for size in ((cw, ch), _transition_card_size()):
+                    arr = _load_card_image(deck_path, idx, size)
+                    if arr is not None:
+                        card_images[(str(deck_path), idx, size)] = arr
+        print(f"⚡ 병렬 렌더링: 프로세스 {processes}개")
+        frame_shape = (L.height, L.width, 3)
+        with ParallelRenderer(
+            segments, card_images, frame_shape, _video_font_path, processes, fps=fps,
+            deck_path=str(deck_path) if atlas is not None else None,
+        ) as renderer:
+            encode_segments(renderer.segments, output_path, music=music, fps=fps, preset=encode_preset)
+    else:
+        encode_segments(segments, output_path, music=music, fps=fps, preset=encode_preset)
     print(f"✅ 영상 생성 완료: {output_path}")
+    _save_render_manifest(output_path, RenderManifest(
+        version=MANIFEST_VERSION, choices=choices, render_profile=render_profile, fps=fps,
+        preset=encode_preset, draft=draft, segment_frames=[seg["n_frames"] for seg in segments],
+    ))
+    if atlas is not None:
+        print(f"🃏 카드: 아틀라스 {atlas.path.name}에서 메모리 맵으로 읽음 (디코딩 캐시 미사용)")
+    else:
+        cache_stats = get_card_cache_stats()
+        print(
+            f"🃏 카드 캐시: hit {cache_stats['hits']} / miss {cache_stats['misses']} "
+            f"/ 제거 {cache_stats['evictions']} ({cache_stats['size']}/{cache_stats['max_size']})"
+        )
+    font_stats = config.get_font_cache_stats()
+    print(f"🔤 폰트 캐시: hit {font_stats['hits']} / miss {font_stats['misses']} ({font_stats['size']}개)")
+    dedupe = {k: v - dedupe_before[k] for k, v in get_dedupe_stats().items()}
+    if dedupe["frames"]:
+        print(
+            f"🧮 중복 프레임 합치기: {dedupe['frames']}프레임 중 {dedupe['encoded']}장만 인코딩 "
+            f"({dedupe['saved']}장 절약)"
+        )
+    if cache_base:
+        seg_stats = segment_cache.get_segment_cache_stats()
+        print(
+            f"📦 구간 캐시: hit {seg_stats['hits']} / miss {seg_stats['misses']} "
+            f"({seg_stats['files']}개, {seg_stats['size_mb']}MB)"
+        )
+    return output_path
+
+
+def _draft_settings() -> tuple[str, int, str]:
+    """초안 렌더링 (프로필, fps, 인코딩 프리셋)"""
+    return (
+        getattr(config, "DRAFT_RENDER_PROFILE", "540p"),
+        int(getattr(config, "DRAFT_FPS", 15)),
+        getattr(config, "DRAFT_ENCODE_PRESET", "ultrafast"),
+    )
+
+
+def generate_tarot_video(
+    fortune_type: str = "",
+    background_path: str | None = None,
+    music_path: str | None = None,
+    output_path: str = "",
+    time_slot_id: str | None = None,
+    use_minor_arcana: bool = False,
+    minor_fortune_type: str | None = None,
+    major_theme: str | None = None,
+    hook_duration_sec: float | None = None,
+    hook_text_override: str | None = None,
+    render_profile: str | None = None,
+    draft: bool = False,
+    thumbnail: str | dict | None = None,
+    thumbnail_sec: float | None = None,
+) -> tuple[str, str]:
+    """
+    타로 운세 Shorts 영상 생성
 
-    metadata_extra = {
-        "cards_after_shuffle": cards_after_shuffle,
-        "card_meanings": card_meanings,
+    Args:
+        time_slot_id: 아침(morning)/점심(lunch)/저녁(evening) 지정 시 해당 훅·테마 사용. None이면 랜덤.
+        major_theme: 메이저 22장 기반 추가 주제 (직장운/학업운/인간관계운/재회·이별운)
+        hook_duration_sec: 훅(첫 화면) 노출 시간(초). None이면 config 기본값 사용.
+        hook_text_override: 감성형 타로(4테마) 사용 시 사용자 선택 제목. 지정 시 랜덤 문구 대신 사용.
+        background_path: 배경 이미지 (None이면 단색)
+        music_path: 배경음악 (None 가능)
+        output_path: 출력 경로
+        render_profile: config.RENDER_PROFILES 이름 (예: "720p"). None이면 config.RENDER_PROFILE.
+        draft: True면 초안 (config.DRAFT_RENDER_PROFILE·DRAFT_FPS·DRAFT_ENCODE_PRESET, 수 초 안에 미리보기).
+            마음에 들면 metadata_extra["render_choices"]로 promote_draft_video 호출 → 같은 내용을 최종 화질로.
+        thumbnail: 썸네일 이미지 경로, 또는 썸네일 명세(generate_one_tarot_fortune_thumbnail 인자 dict,
+            theme_label·hook_phrase_override는 이 영상 값이 기본). 주면 영상 맨 앞 구간으로 같이 인코딩
+            (prepend_thumbnail_to_video로 다시 붙일 필요 없음). 음악은 인트로 뒤부터.
+        thumbnail_sec: 썸네일 인트로 길이(초). None이면 TAROT_SECTION_TIMES["thumbnail_intro"].
+
+    Returns:
+        (생성된 영상 경로, 테마명, metadata_extra)
+    """
+    choices = _pick_render_choices(
+        background_path, music_path, time_slot_id, use_minor_arcana,
+        minor_fortune_type, major_theme, hook_text_override,
+    )
+    if thumbnail is not None:
+        choices["thumbnail_path"] = _resolve_thumbnail(thumbnail, choices, time_slot_id)
+        choices["thumbnail_sec"] = thumbnail_sec
+    if draft:
+        _render_tarot_video(choices, output_path, *_draft_settings(), draft=True)
+    else:
+        _render_tarot_video(choices, output_path, render_profile)
+    return output_path, choices["theme_name"], _metadata_extra(choices, draft)
+
+
+def _metadata_extra(choices: RenderChoices, draft: bool) -> dict:
+    """generate_tarot_video가 돌려주는 metadata_extra (업로드 메타데이터·썸네일·재렌더링용)"""
+    card_indices, shuffled_order = choices["card_indices"], choices["shuffled_order"]
+    return {
+        "cards_after_shuffle": [card_indices[i] for i in shuffled_order],
+        "card_meanings": choices["card_meanings"],
         "card_indices": card_indices,
         "shuffled_order": shuffled_order,
-        "num_cards": num_cards_use,
-        "hook_text": hook_title_text,
-        "major_theme": major_theme if major_theme else None,
-        "is_empathy": is_empathy,
+        "num_cards": choices["num_cards"],
+        "hook_text": choices["hook_text"],
+        "major_theme": choices["major_theme"],
+        "is_empathy": choices["is_empathy"],
+        "draft": draft,
+        "thumbnail_path": choices.get("thumbnail_path"),
+        "render_choices": choices,
     }
-    return output_path, theme_name, metadata_extra
+
+
+def _resolve_thumbnail(thumbnail: str | dict, choices: RenderChoices, time_slot_id: str | None) -> str | None:
+    """썸네일 이미지 경로 또는 명세(dict) → 인트로에 쓸 이미지 경로 (만들 수 없으면 None, 인트로 없이 진행)"""
+    if not isinstance(thumbnail, dict):
+        if os.path.exists(thumbnail):
+            return str(Path(thumbnail).resolve())
+        print(f"⚠️ 썸네일 파일 없음, 인트로 없이 진행: {thumbnail}")
+        return None
+    from modules.thumbnail_creator import generate_one_tarot_fortune_thumbnail
+
+    # 앱에서 영상 생성 직후 만드는 썸네일과 같은 기본값 (감성형 테마면 영상 제목 문구)
+    hook = choices["hook_text"] if choices["major_theme"] in theme_phrases_db.THEME_DB_NAMES else None
+    spec = {"time_slot": time_slot_id or "아침", "theme_label": choices["theme_name"], "hook_phrase_override": hook}
+    try:
+        result = generate_one_tarot_fortune_thumbnail(**{**spec, **thumbnail})
+    except Exception as e:
+        print(f"⚠️ 썸네일 생성 실패, 인트로 없이 진행: {e}")
+        return None
+    if not result or not result[0]:
+        print("⚠️ 썸네일 배경이 없어 인트로 없이 진행")
+        return None
+    return str(Path(result[0]).resolve())
+
+
+def promote_draft_video(render_choices: RenderChoices, output_path: str, render_profile: str | None = None) -> str:
+    """
+    초안(draft=True)과 같은 카드·덱·배경·폰트·셔플·GPT 문구·음악 위치로 최종 화질 다시 렌더링.
+    render_choices: 초안 generate_tarot_video의 metadata_extra["render_choices"]
+    """
+    print(f"🎞️ 초안 → 최종 화질 렌더링: {render_choices['theme_name']}")
+    return _render_tarot_video(render_choices, output_path, render_profile)
+
+
+def rerender_hook_video(video_path: str, hook_text: str, output_path: str) -> tuple[str, str, dict] | None:
+    """
+    감성형 영상의 첫 화면 문구만 바꿔 다시 만듦: 새 공감 멘트(GPT 1회)로 첫 구간만 렌더링·인코딩하고
+    나머지 구간·배경음악은 기존 파일에서 스트림 복사 (카드·해석·셔플 그대로).
+    렌더링 기록이 없거나, 감성형이 아니거나, 구간 경계에서 자를 수 없으면 None → 전체 재생성.
+    Returns: generate_tarot_video와 같은 (영상 경로, 테마명, metadata_extra)
+    """
+    manifest = load_render_manifest(video_path)
+    if not manifest or not manifest["choices"]["is_empathy"] or not Path(video_path).exists():
+        return None
+    if manifest["choices"].get("thumbnail_path"):
+        return None  # 첫 구간이 썸네일 인트로 → 공감 멘트 구간은 중간이라 교체 불가
+    choices: RenderChoices = {**manifest["choices"], "hook_text": hook_text.strip()}
+    print("  🤖 공감 멘트 생성 중...")
+    choices["empathy_ment"] = generate_empathy_ment(choices["hook_text"])
+
+    _, fps, bg_img = _begin_render(choices, manifest["render_profile"], manifest["fps"])
+    head = timeline.build_segment(_empathy_spec(choices, bg_img, fps))
+    segment_frames = manifest["segment_frames"]
+    if head["n_frames"] != segment_frames[0]:
+        return None
+    print(f"✂️ 첫 화면만 다시 렌더링: {Path(video_path).name} → {Path(output_path).name}")
+    try:
+        splice_head_segment(
+            head, video_path, sum(segment_frames), output_path, fps=fps, preset=manifest["preset"],
+        )
+    except Exception as e:
+        print(f"⚠️ 첫 화면 교체 실패, 전체 재생성으로 진행: {e}")
+        return None
+    _save_render_manifest(output_path, {**manifest, "choices": choices})
+    print(f"✅ 영상 생성 완료: {output_path}")
+    return output_path, choices["theme_name"], _metadata_extra(choices, manifest["draft"])
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+텍스트 스프라이트 캐시 - 여러 줄 텍스트(폰트·색·외곽선)를 RGBA 배열로 한 번만 래스터화해 내용 해시로 캐시.
+프레임마다 FreeType으로 다시 그리지 않고 FrameCompositor.blit(sprite, x, y, alpha)로 위치·투명도만 바꿔 합성.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+import config
+
+# 한 줄: (텍스트, 폰트, 글자색, 외곽선 두께, 다음 줄까지 추가 간격 px)
+TextLine = tuple[str, ImageFont.FreeTypeFont, tuple[int, int, int], int, int]
+
+_sprite_cache: OrderedDict = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+_lock = threading.Lock()
+
+
+def _font_key(font) -> tuple:
+    return (getattr(font, "path", None) or id(font), getattr(font, "size", None))
+
+
+def _sprite_key(lines: list[TextLine], stroke_fill: tuple) -> bytes:
+    spec = repr(([(t, _font_key(f), tuple(c), sw, gap) for t, f, c, sw, gap in lines], tuple(stroke_fill)))
+    return hashlib.blake2b(spec.encode("utf-8"), digest_size=16).digest()
+
+
+def _rasterize(lines: list[TextLine], stroke_fill: tuple) -> tuple[np.ndarray, int, int]:
+    probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    # 줄 위치는 기존 그리기 방식과 같게: 다음 줄 y += (외곽선 없는 bbox 높이) + 간격
+    placed = []
+    y = 0
+    for text, font, fill, stroke_w, gap in lines:
+        placed.append((0, y, text, font, fill, stroke_w))
+        b = probe.textbbox((0, 0), text, font=font)
+        y += b[3] - b[1] + gap
+    boxes = [probe.textbbox((x, y), t, font=f, stroke_width=sw) for x, y, t, f, _, sw in placed]
+    x0, y0 = min(b[0] for b in boxes), min(b[1] for b in boxes)
+    x1, y1 = max(b[2] for b in boxes), max(b[3] for b in boxes)
+    layer = Image.new("RGBA", (max(1, x1 - x0), max(1, y1 - y0)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    for x, y, text, font, fill, stroke_w in placed:
+        xy = (x - x0, y - y0)
+        try:
+            draw.text(xy, text, font=font, fill=tuple(fill), stroke_width=stroke_w, stroke_fill=tuple(stroke_fill))
+        except TypeError:
+            draw.text((xy[0] + 1, xy[1] + 1), text, font=font, fill=tuple(stroke_fill))
+            draw.text(xy, text, font=font, fill=tuple(fill))
+    arr = np.asarray(layer)
+    arr.flags.writeable = False
+    return arr, x0, y0
+
+
+def text_block_sprite(lines: list[TextLine], stroke_fill: tuple = (0, 0, 0)) -> tuple[np.ndarray, int, int]:
+    """
+    여러 줄 텍스트 블록 스프라이트. 반환: (RGBA 읽기 전용 배열, dx, dy)
+    - 첫 줄을 (x, y)에 draw.text 했을 때와 같은 모습이 되려면 (x + dx, y + dy)에 blit.
+    같은 내용(텍스트·폰트·색·외곽선·간격)은 한 번만 래스터화.
+    """
+    key = _sprite_key(lines, stroke_fill)
+    with _lock:
+        hit = _sprite_cache.get(key)
+        if hit is not None:
+            _sprite_cache.move_to_end(key)
+            _stats["hits"] += 1
+            return hit
+        _stats["misses"] += 1
+    sprite = _rasterize(lines, stroke_fill)
+    max_items = int(getattr(config, "TEXT_SPRITE_CACHE_SIZE", 256))
+    with _lock:
+        _sprite_cache[key] = sprite
+        while len(_sprite_cache) > max_items:
+            _sprite_cache.popitem(last=False)
+    return sprite
+
+
+def text_sprite(text: str, font, fill=(255, 255, 255), stroke_width: int = 2, stroke_fill=(0, 0, 0)) -> tuple[np.ndarray, int, int]:
+    """한 줄 텍스트 스프라이트 (text_block_sprite의 한 줄 버전)"""
+    return text_block_sprite([(text, font, tuple(fill), stroke_width, 0)], stroke_fill)
+
+
+def get_text_sprite_cache_stats() -> dict:
+    """텍스트 스프라이트 캐시 통계 (hits, misses, size)"""
+    return {"hits": _stats["hits"], "misses": _stats["misses"], "size": len(_sprite_cache)}
+
+
+def clear_text_sprite_cache() -> None:
+    with _lock:
+        _sprite_cache.clear()
+        _stats.update(hits=0, misses=0)
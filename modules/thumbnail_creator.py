@@ -8,7 +8,10 @@ from typing import List, Optional
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 import config
+from modules.background_cache import load_background
 
 
 # 썸네일 배경 확장자
@@ -277,7 +280,8 @@ def generate_one_tarot_fortune_thumbnail(
     font_path = str(Path(raw_font).resolve()) if raw_font else None
     size_scale = max(0.5, min(2.0, float(font_size_scale)))
     try:
-        img = Image.open(bg_path).convert("RGBA")
+        bg_arr = load_background(bg_path, mode="RGBA")  # 원본 크기, 투명도 유지 (배경 캐시에서 메모리 맵)
+        img = Image.fromarray(np.asarray(bg_arr)).convert("RGBA")
         w, h = img.size
         draw = ImageDraw.Draw(img)
         scale = 1.0 if h >= 800 else 0.75
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+선언형 타임라인 - 영상을 구간 명세(SegmentSpec) 리스트로 적고, 엔진이 그대로 구간(Segment)으로 만듦.
+구간 명세: 이름·길이(초)·프레임 수·렌더러(화면 함수 또는 프레임 제너레이터)·입력·구간 캐시 키 재료.
+→ 구간 코드를 건드리지 않고 엔진 쪽에서 병렬 렌더링(task)·비용 추정·구간 캐시 조회·인코더 선택을 처리.
+
+- still: renderer(**inputs)가 화면 한 장(PIL 이미지/배열) → n_frames 동안 정지
+- frames: renderer(**inputs)가 프레임 제너레이터 (frame_range 인자 지원 시 병렬 렌더링 워커가 조각 단위로 다시 만듦)
+"""
+from typing import Callable, TypedDict
+
+import numpy as np
+
+from modules import segment_cache
+from modules.video_encoder import Segment, file_segment, frames_segment, still_segment
+
+
+class SegmentSpec(TypedDict):
+    name: str                  # 구간 이름 (로그·비용 추정용, 보통 TAROT_SECTION_TIMES 키)
+    kind: str                  # "still" 또는 "frames"
+    duration: float            # 초
+    n_frames: int
+    renderer: Callable         # still: 화면 함수, frames: 프레임 제너레이터 (병렬 워커는 __name__으로 찾음)
+    inputs: dict               # 렌더러 키워드 인자
+    cache: tuple | None        # 구간 캐시 키 재료 (카드·GPT 문구와 무관한 구간만). None이면 캐시 안 함
+
+
+def still(name: str, duration: float, fps: int, renderer: Callable, cache: tuple | None = None, **inputs) -> SegmentSpec:
+    """정지 화면 구간 명세"""
+    return SegmentSpec(
+        name=name, kind="still", duration=float(duration), n_frames=max(1, int(fps * duration)),
+        renderer=renderer, inputs=inputs, cache=cache,
+    )
+
+
+def frames(
+    name: str,
+    duration: float,
+    fps: int,
+    renderer: Callable,
+    cache: tuple | None = None,
+    frame_count: int | None = None,
+    **inputs,
+) -> SegmentSpec:
+    """
+    애니메이션 구간 명세. n_frames를 renderer 입력으로도 쓰려면 inputs에 같이 넣음.
+    frame_count: 여러 단계를 이어 그리는 구간처럼 프레임 수를 따로 정할 때 (없으면 fps * duration).
+    """
+    n_frames = max(1, int(frame_count if frame_count is not None else fps * duration))
+    return SegmentSpec(
+        name=name, kind="frames", duration=n_frames / fps if frame_count is not None else float(duration),
+        n_frames=n_frames, renderer=renderer, inputs=inputs, cache=cache,
+    )
+
+
+def timeline_frames(timeline: list[SegmentSpec]) -> int:
+    return sum(spec["n_frames"] for spec in timeline)
+
+
+def estimate_cost(timeline: list[SegmentSpec]) -> dict:
+    """
+    렌더링 비용 추정 (프레임 수 기준). 정지 구간은 화면 1장만 그리고 인코더가 반복하므로 1로 셈.
+    반환: {"frames": 전체 프레임, "render_frames": 실제로 그릴 프레임, "cacheable_frames": 구간 캐시 대상 중 그릴 프레임}
+    """
+    render = sum(1 if spec["kind"] == "still" else spec["n_frames"] for spec in timeline)
+    cacheable = sum(
+        1 if spec["kind"] == "still" else spec["n_frames"]
+        for spec in timeline if spec["cache"] is not None
+    )
+    return {"frames": timeline_frames(timeline), "render_frames": render, "cacheable_frames": cacheable}
+
+
+def _make_segment(spec: SegmentSpec) -> Segment:
+    renderer, inputs = spec["renderer"], spec["inputs"]
+    if spec["kind"] == "still":
+        return still_segment(np.array(renderer(**inputs)), spec["n_frames"])
+    # (함수 이름, 인자)도 남겨 병렬 렌더링 워커가 같은 구간을 만들 수 있게 함
+    return frames_segment(lambda: renderer(**inputs), spec["n_frames"], task=(renderer.__name__, inputs))
+
+
+def build_segment(spec: SegmentSpec, cache_base: tuple | None = None) -> Segment:
+    """
+    구간 명세 → 구간. cache_base(해상도·fps·코덱·배경 등 공통 키)가 있고 spec["cache"]가 있으면
+    구간 캐시에 인코딩된 파일이 있을 때 렌더링 없이 file_segment, 없으면 만들고 cache_key를 달아 인코딩 후 저장.
+    """
+    if cache_base is None or spec["cache"] is None:
+        return _make_segment(spec)
+    key = segment_cache.segment_key(cache_base, *spec["cache"])
+    path = segment_cache.lookup(key)
+    if path is not None:
+        return file_segment(path, spec["n_frames"])
+    seg = _make_segment(spec)
+    seg["cache_key"] = key
+    return seg
+
+
+def build_segments(timeline: list[SegmentSpec], cache_base: tuple | None = None) -> list[Segment]:
+    return [build_segment(spec, cache_base) for spec in timeline]
@@ -0,0 +1,742 @@
+# -*- coding: utf-8 -*-
+"""
+영상 인코더 백엔드
+- ffmpeg: ffmpeg 프로세스 하나를 띄워 stdin으로 RGB 원시 프레임을 넣고, 배경음악도 같은 프로세스에서 합침
+  VIDEO_ENCODE_JOBS > 1이면 구간별로 따로(병렬) 인코딩한 뒤 concat demuxer 스트림 복사로 잇고 음악은 마지막에 한 번 mux
+- moviepy: 기존 MoviePy concatenate_videoclips + write_videofile (ffmpeg 백엔드 실패 시 폴백)
+config.VIDEO_ENCODER로 선택. x264 프리셋·CRF·스레드 수는 인코더 프로필(encoder_profile)이 있으면 그 값.
+
+구간(Segment) 리스트를 입력으로 받음:
+- still_segment(frame, n_frames): 정지 화면 n_frames 프레임
+- frames_segment(make_frames, n_frames): make_frames()가 프레임 이터레이터를 반환 (스트리밍)
+  task=(렌더러 함수 이름, 인자)를 같이 주면 다른 프로세스에서도 다시 만들 수 있음 (병렬 렌더링용)
+두 경로 모두 구간 시작마다 키프레임 → splice_head_segment로 첫 구간만 다시 인코딩해 교체 가능.
+VIDEO_DEDUPE_FRAMES면 구간별 인코딩에서 연속 중복 프레임을 한 장으로 합쳐 길이만 늘림 (가변 프레임 레이트).
+"""
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypedDict
+
+import numpy as np
+
+import config
+from modules import encoder_profile, segment_cache
+
+
+class Segment(TypedDict):
+    kind: str                  # "still", "frames" 또는 "file"
+    n_frames: int
+    frame: np.ndarray | None   # still일 때
+    make_frames: Callable[[], Iterable[np.ndarray]] | None  # frames일 때
+    task: tuple[str, dict] | None  # frames일 때 (렌더러 함수 이름, 키워드 인자). 없으면 병렬 렌더링 안 함
+    path: str | None           # file일 때 (인코딩된 영상 파일, 음성 없음)
+    cache_key: str | None      # 있으면 인코딩 결과를 구간 캐시에 저장
+
+
+class MusicTrack(TypedDict):
+    path: str
+    start: float               # 재생 시작 위치(초). 곡 끝에 닿으면 처음부터 루프
+    delay: float               # 영상 시작 후 음악이 나오기까지(초). 썸네일 인트로 동안 무음 (없으면 0)
+
+
+def still_segment(frame: np.ndarray, n_frames: int) -> Segment:
+    return {
+        "kind": "still", "n_frames": max(1, int(n_frames)), "frame": np.asarray(frame),
+        "make_frames": None, "task": None, "path": None, "cache_key": None,
+    }
+
+
+def frames_segment(
+    make_frames: Callable[[], Iterable[np.ndarray]],
+    n_frames: int,
+    task: tuple[str, dict] | None = None,
+) -> Segment:
+    return {
+        "kind": "frames", "n_frames": max(1, int(n_frames)), "frame": None, "make_frames": make_frames,
+        "task": task, "path": None, "cache_key": None,
+    }
+
+
+def file_segment(path: str | Path, n_frames: int) -> Segment:
+    return {
+        "kind": "file", "n_frames": max(1, int(n_frames)), "frame": None, "make_frames": None,
+        "task": None, "path": str(path), "cache_key": None,
+    }
+
+
+def total_frames(segments: list[Segment]) -> int:
+    return sum(s["n_frames"] for s in segments)
+
+
+def iter_segment_frames(segment: Segment, fps: int | None = None) -> Iterator[np.ndarray]:
+    """
+    구간의 프레임을 정확히 n_frames장 yield (제너레이터가 짧으면 마지막 프레임 반복).
+    fps: file 구간 디코딩 시 고정 프레임 레이트로 (가변 프레임 레이트 구간 파일의 중복 프레임 복원)
+    """
+    n = segment["n_frames"]
+    if segment["kind"] == "still":
+        for _ in range(n):
+            yield segment["frame"]
+        return
+    last = None
+    count = 0
+    frames = _decode_file(segment["path"], fps) if segment["kind"] == "file" else segment["make_frames"]()
+    for frame in frames:
+        if count >= n:
+            break
+        last = frame
+        count += 1
+        yield frame
+    while count < n and last is not None:
+        count += 1
+        yield last
+
+
+def _decode_file(path: str, fps: int | None = None) -> Iterator[np.ndarray]:
+    """인코딩된 구간 파일을 RGB 프레임으로 디코딩 (구간별 인코딩을 못 쓸 때 폴백용)"""
+    import imageio_ffmpeg
+
+    output_params = ["-vf", f"fps={fps}"] if fps else None
+    reader = imageio_ffmpeg.read_frames(path, pix_fmt="rgb24", output_params=output_params)
+    meta = next(reader)
+    w, h = meta["size"]
+    try:
+        for buf in reader:
+            yield np.frombuffer(buf, dtype=np.uint8).reshape(h, w, 3)
+    finally:
+        reader.close()
+
+
+def get_ffmpeg_exe() -> str | None:
+    """ffmpeg 실행 파일 경로 (config.FFMPEG_BINARY → imageio-ffmpeg 내장 → PATH). 없으면 None."""
+    path = getattr(config, "FFMPEG_BINARY", None)
+    if path and os.path.exists(path):
+        return str(path)
+    try:
+        import imageio_ffmpeg  # moviepy 의존성으로 함께 설치됨
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return shutil.which("ffmpeg")
+
+
+def get_encode_settings(preset: str | None = None) -> tuple[str, int]:
+    """
+    (x264 프리셋, 스레드 수 0=자동). 인코더 프로필(scripts/autotune_encoder.py)이 있으면
+    VIDEO_ENCODE_PRESET / VIDEO_ENCODE_THREADS 대신 그 값. preset을 넘기면(초안 등) 프리셋은 그대로.
+    """
+    profile = encoder_profile.load_encoder_profile()
+    if profile:
+        return preset or profile["preset"], int(profile["threads"] or 0)
+    preset = preset or getattr(config, "VIDEO_ENCODE_PRESET", "medium")
+    threads = int(getattr(config, "VIDEO_ENCODE_THREADS", 0) or 0)
+    return preset, threads
+
+
+def get_x264_params() -> list[str]:
+    """프리셋 외 x264 옵션 (-crf, -tune). 인코더 프로필 → config.VIDEO_ENCODE_CRF / VIDEO_ENCODE_TUNE 순."""
+    profile = encoder_profile.load_encoder_profile()
+    if profile:
+        crf, tune = profile["crf"], profile["tune"]
+    else:
+        crf, tune = getattr(config, "VIDEO_ENCODE_CRF", None), getattr(config, "VIDEO_ENCODE_TUNE", None)
+    params = []
+    if crf is not None:
+        params += ["-crf", str(crf)]
+    if tune:
+        params += ["-tune", str(tune)]
+    return params
+
+
+def get_encode_jobs() -> int:
+    """config.VIDEO_ENCODE_JOBS 해석 (0=코어 수). 1 이하면 타임라인 전체를 한 번에 인코딩."""
+    n = int(getattr(config, "VIDEO_ENCODE_JOBS", 1) or 0)
+    if n <= 0:
+        n = os.cpu_count() or 1
+    return n
+
+
+def _rawvideo_input_args(w: int, h: int, fps: int, source: str = "-") -> list[str]:
+    return ["-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}", "-r", str(fps), "-i", source]
+
+
+def _video_codec_args(threads: int, preset: str | None = None) -> list[str]:
+    """H.264 인코딩 파라미터. 구간별 파일을 스트림 복사로 이어 붙이므로 모든 경로에서 같은 값을 써야 함."""
+    preset, _ = get_encode_settings(preset)
+    return ["-c:v", "libx264", "-preset", preset, "-pix_fmt", "yuv420p"] + get_x264_params() + ["-threads", str(threads)]
+
+
+def codec_signature(preset: str | None = None) -> str:
+    """구간 캐시 키용 코덱 설정 (스레드 수 제외). 설정이 다른 구간 파일은 이어 붙일 수 없음."""
+    return " ".join(_video_codec_args(0, preset)[:-2])
+
+
+def _audio_input_args(music: MusicTrack | None) -> list[str]:
+    if not music:
+        return []
+    # -stream_loop -1: 곡이 영상보다 짧으면 처음부터 반복 (출력 길이는 -t로 자름)
+    return ["-stream_loop", "-1", "-i", music["path"]]
+
+
+def _audio_output_args(music: MusicTrack | None, input_index: int = 1) -> list[str]:
+    if not music:
+        return []
+    # -ss 입력 시킹은 -stream_loop와 함께 쓰면 타임스탬프가 깨지므로 atrim으로 시작 위치 자름
+    # (start초부터 곡 끝까지 → 다시 처음부터 루프, 기존 MoviePy 방식과 동일)
+    start = max(0.0, float(music["start"]))
+    filters = f"atrim=start={start:.3f},asetpts=PTS-STARTPTS"
+    delay_ms = int(round(float(music.get("delay") or 0) * 1000))
+    if delay_ms > 0:
+        filters += f",adelay={delay_ms}:all=1"
+    return [
+        "-map", f"{input_index}:a:0",
+        "-af", filters,
+        "-c:a", "aac", "-b:a", "192k",
+    ]
+
+
+def _still_hold_filters(segments: list[Segment], fps: int) -> list[str]:
+    """
+    정지 구간은 프레임을 한 장만 보내고 ffmpeg이 반복하게 하는 필터.
+    format=yuv420p를 먼저 두어 색 변환은 고유 프레임에만 하고, setpts로 정지 프레임 뒤의 시각을 밀어낸 뒤
+    fps 필터가 빈 자리를 복제. 마지막 구간이 정지면 tpad로 끝을 늘림.
+    """
+    terms = []
+    tail = 0
+    unique = 0
+    for i, seg in enumerate(segments):
+        if seg["kind"] != "still":
+            unique += seg["n_frames"]
+            continue
+        extra = seg["n_frames"] - 1
+        if extra > 0:
+            if i == len(segments) - 1:
+                tail = extra
+            else:
+                terms.append(f"{extra}*gte(N,{unique + 1})")
+        unique += 1
+    filters = ["format=yuv420p"]
+    if terms:
+        # setpts는 결과를 버림으로 정수화하므로 round (안 하면 부동소수 오차로 한 프레임 앞 시각과 겹침)
+        filters.append(f"setpts='round((N+{'+'.join(terms)})/FRAME_RATE/TB)'")
+        filters.append(f"fps={fps}")
+    if tail:
+        filters.append(f"tpad=stop_mode=clone:stop={tail}")
+    return filters
+
+
+def _segment_keyframe_args(segments: list[Segment], fps: int) -> list[str]:
+    """
+    구간 시작마다 키프레임 강제 (한 번에 인코딩해도 구간별 인코딩처럼 구간 경계에서 자를 수 있게).
+    시각은 프레임 시각보다 살짝 작게 내림 → 정확히 그 프레임이 키프레임.
+    """
+    times = []
+    n = 0
+    for seg in segments[:-1]:
+        n += seg["n_frames"]
+        times.append(f"{n * 1_000_000 // fps / 1_000_000:.6f}")
+    return ["-force_key_frames", ",".join(times)] if times else []
+
+
+def _iter_unique_frames(segments: list[Segment], fps: int | None = None) -> Iterator[np.ndarray]:
+    """ffmpeg에 실제로 보낼 프레임: 정지 구간은 1장, 애니메이션 구간은 전부."""
+    for seg in segments:
+        if seg["kind"] == "still":
+            yield seg["frame"]
+        else:
+            yield from iter_segment_frames(seg, fps)
+
+
+def encode_ffmpeg(
+    segments: list[Segment],
+    output_path: str,
+    music: MusicTrack | None = None,
+    fps: int | None = None,
+    preset: str | None = None,
+) -> str:
+    """
+    ffmpeg stdin으로 RGB 원시 프레임을 직접 써서 인코딩 + 배경음악 mux (한 프로세스).
+    정지 구간(still_segment)은 한 장만 보내고 ffmpeg 필터가 n_frames만큼 반복.
+    """
+    exe = get_ffmpeg_exe()
+    if not exe:
+        raise RuntimeError("ffmpeg 실행 파일을 찾을 수 없습니다.")
+    fps = fps or config.VIDEO_FPS
+    frames = _iter_unique_frames(segments, fps)
+    first = next(frames)
+    h, w = first.shape[:2]
+    duration = total_frames(segments) / fps
+    _, threads = get_encode_settings()
+
+    cmd = [exe, "-y", "-loglevel", "error"] + _rawvideo_input_args(w, h, fps)
+    cmd += _audio_input_args(music)
+    cmd += ["-map", "0:v:0", "-vf", ",".join(_still_hold_filters(segments, fps))]
+    cmd += _audio_output_args(music)
+    cmd += _video_codec_args(threads, preset) + _segment_keyframe_args(segments, fps)
+    cmd += ["-t", f"{duration:.3f}", "-movflags", "+faststart", str(output_path)]
+    _pipe_frames(cmd, first, frames)
+    return str(output_path)
+
+
+def _pipe_frames(cmd: list[str], first: np.ndarray, frames: Iterator[np.ndarray]) -> None:
+    """ffmpeg을 띄워 stdin으로 프레임을 씀. 실패하면 RuntimeError."""
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        proc.stdin.write(np.ascontiguousarray(first, dtype=np.uint8).data)
+        for frame in frames:
+            proc.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    err = proc.stderr.read().decode("utf-8", errors="replace")
+    if proc.wait() != 0:
+        raise RuntimeError(f"ffmpeg 인코딩 실패: {err.strip()[-500:]}")
+
+
+def is_dedupe_enabled() -> bool:
+    return bool(getattr(config, "VIDEO_DEDUPE_FRAMES", False))
+
+
+_dedupe_stats = {"frames": 0, "encoded": 0}
+_dedupe_lock = threading.Lock()
+
+
+def get_dedupe_stats() -> dict:
+    """중복 프레임 합치기 통계 (frames: 구간 프레임 수, encoded: 실제 인코딩한 프레임 수, saved)"""
+    with _dedupe_lock:
+        return {**_dedupe_stats, "saved": _dedupe_stats["frames"] - _dedupe_stats["encoded"]}
+
+
+def _hold_pts_filter(positions: list[int]) -> str:
+    """보낸 N번째 프레임의 시각을 positions[N](구간 안 프레임 번호)으로 옮기는 setpts 필터"""
+    terms = [
+        f"{gap}*gte(N,{k})"
+        for k, gap in enumerate((b - a - 1 for a, b in zip(positions, positions[1:])), start=1)
+        if gap > 0
+    ]
+    return f"setpts='round((N+{'+'.join(terms)})/FRAME_RATE/TB)'" if terms else "setpts='round(N/FRAME_RATE/TB)'"
+
+
+def _spool_unique_frames(segment: Segment, raw_path: Path, fps: int) -> tuple[list[int], tuple[int, int]]:
+    """
+    구간 프레임을 원시 파일에 쓰되 바로 앞 프레임과 같으면(같은 배열이거나 내용 해시가 같으면) 건너뜀.
+    마지막 프레임이 길게 유지되면 끝 시각에 한 장 더 써서 구간 길이를 맞춤.
+    반환: (쓴 프레임별 구간 안 프레임 번호, (세로, 가로))
+    """
+    positions = []
+    prev = prev_key = None
+    shape = None
+    with open(raw_path, "w+b") as f:
+        for i, frame in enumerate(iter_segment_frames(segment, fps)):
+            if frame is not prev:
+                frame = np.ascontiguousarray(frame, dtype=np.uint8)
+                key = hashlib.blake2b(frame.data, digest_size=16).digest()
+                if key != prev_key:
+                    f.write(frame.data)
+                    positions.append(i)
+                    shape = frame.shape[:2]
+                prev_key = key
+            prev = frame
+        if not positions:
+            raise RuntimeError("구간에 프레임이 없습니다.")
+        last = segment["n_frames"] - 1
+        if positions[-1] != last:
+            # prev는 병렬 렌더러의 공유 메모리 뷰일 수 있음 (구간이 끝나면 슬롯이 반납돼 다른 프레임으로 덮임)
+            # → 이미 파일에 쓴 마지막 프레임 바이트를 다시 읽어 씀
+            frame_bytes = shape[0] * shape[1] * 3
+            f.seek(-frame_bytes, os.SEEK_END)
+            tail = f.read(frame_bytes)
+            f.seek(0, os.SEEK_END)
+            f.write(tail)
+            positions.append(last)
+    return positions, shape
+
+
+def _encode_part_dedupe(exe: str, segment: Segment, path: Path, fps: int, threads: int, preset: str | None) -> Path:
+    """중복 프레임을 합쳐 가변 프레임 레이트로 구간 인코딩 (프레임 시각은 1/fps 격자 그대로)."""
+    n = segment["n_frames"]
+    if segment["kind"] == "still":
+        positions = [0, n - 1] if n > 1 else [0]
+        h, w = segment["frame"].shape[:2]
+        source = "-"
+    else:
+        source = str(path.with_suffix(".rgb"))
+        positions, (h, w) = _spool_unique_frames(segment, Path(source), fps)
+    cmd = [exe, "-y", "-loglevel", "error"] + _rawvideo_input_args(w, h, fps, source)
+    cmd += ["-vf", f"format=yuv420p,{_hold_pts_filter(positions)}", "-fps_mode", "vfr"]
+    cmd += _video_codec_args(threads, preset)
+    cmd += ["-an", str(path)]
+    try:
+        if source == "-":
+            frame = segment["frame"]
+            _pipe_frames(cmd, frame, iter([frame] * (len(positions) - 1)))
+        else:
+            _run_ffmpeg(cmd, "구간 인코딩")
+    finally:
+        if source != "-":
+            Path(source).unlink(missing_ok=True)
+    with _dedupe_lock:
+        _dedupe_stats["frames"] += n
+        _dedupe_stats["encoded"] += len(positions)
+    return path
+
+
+def _encode_part(exe: str, segment: Segment, path: Path, fps: int, threads: int, preset: str | None = None) -> Path:
+    """
+    구간 하나를 음성 없는 파일로 인코딩. 파일마다 첫 프레임이 키프레임(IDR).
+    VIDEO_DEDUPE_FRAMES면 연속 중복 프레임은 한 장만 인코딩 (_encode_part_dedupe).
+    """
+    if is_dedupe_enabled():
+        return _encode_part_dedupe(exe, segment, path, fps, threads, preset)
+    frames = _iter_unique_frames([segment], fps)
+    first = next(frames)
+    h, w = first.shape[:2]
+    cmd = [exe, "-y", "-loglevel", "error"] + _rawvideo_input_args(w, h, fps)
+    cmd += ["-vf", ",".join(_still_hold_filters([segment], fps))]
+    cmd += _video_codec_args(threads, preset)
+    cmd += ["-an", str(path)]
+    _pipe_frames(cmd, first, frames)
+    return path
+
+
+def encode_ffmpeg_segments(
+    segments: list[Segment],
+    output_path: str,
+    music: MusicTrack | None = None,
+    fps: int | None = None,
+    jobs: int | None = None,
+    preset: str | None = None,
+) -> str:
+    """
+    구간마다 별도 ffmpeg으로 동시에 인코딩(jobs개씩) → concat demuxer로 스트림 복사 연결 + 배경음악 mux.
+    코덱 파라미터가 모두 같고 구간 시작마다 키프레임이므로 재인코딩 없이 이어 붙일 수 있음.
+    file 구간(구간 캐시)은 인코딩 없이 그 파일을 그대로 잇고, cache_key가 있는 구간은 인코딩 후 캐시에 저장.
+    """
+    exe = get_ffmpeg_exe()
+    if not exe:
+        raise RuntimeError("ffmpeg 실행 파일을 찾을 수 없습니다.")
+    fps = fps or config.VIDEO_FPS
+    jobs = jobs or get_encode_jobs()
+    _, threads = get_encode_settings()
+    # 스레드 수 자동(0)이면 프로세스마다 코어를 다 쓰지 않도록 나눠 줌
+    threads = threads or max(1, (os.cpu_count() or 1) // jobs)
+    duration = total_frames(segments) / fps
+
+    out_dir = Path(output_path).resolve().parent
+    work_dir = Path(tempfile.mkdtemp(prefix="parts_", dir=out_dir))
+    try:
+        paths = [
+            Path(seg["path"]) if seg["kind"] == "file" else work_dir / f"part_{i:03d}.mp4"
+            for i, seg in enumerate(segments)
+        ]
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_encode_part, exe, seg, path, fps, threads, preset)
+                for seg, path in zip(segments, paths)
+                if seg["kind"] != "file"
+            ]
+            for fut in futures:
+                fut.result()
+        for seg, path in zip(segments, paths):
+            if seg.get("cache_key"):
+                segment_cache.store(seg["cache_key"], path)
+
+        list_path = work_dir / "parts.txt"
+        # 구간 길이를 적어 줌 (가변 프레임 레이트 구간은 마지막 패킷 길이가 없어 다음 구간이 한 프레임 당겨짐)
+        list_path.write_text(
+            "".join(
+                f"file '{_concat_entry(p, work_dir)}'\nduration {seg['n_frames'] / fps:.6f}\n"
+                for seg, p in zip(segments, paths)
+            ),
+            encoding="utf-8",
+        )
+        cmd = [exe, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(list_path)]
+        cmd += _audio_input_args(music)
+        cmd += ["-map", "0:v:0", "-c:v", "copy"]
+        cmd += _audio_output_args(music)
+        cmd += ["-t", f"{duration:.3f}", "-movflags", "+faststart", str(output_path)]
+        _run_ffmpeg(cmd, "구간 연결")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    if any(seg.get("cache_key") for seg in segments):
+        segment_cache.evict()
+    return str(output_path)
+
+
+def _run_ffmpeg(cmd: list[str], what: str) -> subprocess.CompletedProcess:
+    proc = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True)
+    if proc.returncode != 0:
+        err = proc.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"ffmpeg {what} 실패: {err.strip()[-500:]}")
+    return proc
+
+
+def _packet_times(exe: str, path: str | Path) -> list[float]:
+    """영상 스트림 패킷별 표시 시각(초). 디코딩 없이 스트림 복사 → framecrc 한 줄에 패킷 하나."""
+    proc = _run_ffmpeg(
+        [exe, "-loglevel", "error", "-i", str(path), "-map", "0:v:0", "-c", "copy", "-f", "framecrc", "-"],
+        "프레임 확인",
+    )
+    tb = 1.0
+    times = []
+    for line in proc.stdout.decode("utf-8", errors="replace").splitlines():
+        if line.startswith("#tb"):
+            num, den = line.split(":", 1)[1].strip().split("/")
+            tb = int(num) / int(den)
+        elif line and not line.startswith("#"):
+            times.append(int(line.split(",")[2]) * tb)
+    return times
+
+
+def splice_head_segment(
+    segment: Segment,
+    source_path: str,
+    source_n_frames: int,
+    output_path: str,
+    fps: int | None = None,
+    preset: str | None = None,
+) -> str:
+    """
+    이미 인코딩된 영상의 첫 구간만 segment로 바꿔 새 파일로 저장 (나머지 구간·음성은 스트림 복사, 재인코딩 없음).
+    segment는 원래 첫 구간과 프레임 수가 같아야 하고, 원본은 두 번째 구간 시작이 키프레임이어야 함
+    (구간별 인코딩·encode_ffmpeg 출력). 자를 수 없으면 RuntimeError.
+    """
+    exe = get_ffmpeg_exe()
+    if not exe:
+        raise RuntimeError("ffmpeg 실행 파일을 찾을 수 없습니다.")
+    fps = fps or config.VIDEO_FPS
+    _, threads = get_encode_settings()
+    n_head = segment["n_frames"]
+    duration = source_n_frames / fps
+
+    out_dir = Path(output_path).resolve().parent
+    work_dir = Path(tempfile.mkdtemp(prefix="splice_", dir=out_dir))
+    try:
+        head = _encode_part(exe, segment, work_dir / "head.mp4", fps, threads, preset)
+        # 경계 프레임 시각 + 반 프레임으로 입력 시킹 → 스트림 복사는 그 앞 키프레임(= 경계)부터 시작.
+        # 키프레임 시각이 시킹 지점보다 앞(음수)이므로 0부터 시작하게 맞춤 (안 하면 concat에서 한 프레임 당겨짐)
+        tail = work_dir / "tail.mp4"
+        seek = (n_head + 0.5) / fps
+        _run_ffmpeg(
+            [exe, "-y", "-loglevel", "error", "-ss", f"{seek:.6f}", "-i", str(source_path),
+             "-map", "0:v:0", "-c", "copy", "-an", "-avoid_negative_ts", "make_zero", str(tail)],
+            "뒷부분 추출",
+        )
+        # 가변 프레임 레이트일 수 있으므로 프레임 수 대신 원본의 경계 뒤 패킷 수와 비교
+        need = sum(1 for t in _packet_times(exe, source_path) if t >= (n_head - 0.5) / fps)
+        got = len(_packet_times(exe, tail))
+        if got != need:
+            raise RuntimeError(f"구간 경계가 키프레임이 아님 (뒷부분 {got}프레임, 필요 {need})")
+
+        list_path = work_dir / "parts.txt"
+        list_path.write_text(f"file '{head.name}'\nduration {n_head / fps:.6f}\nfile '{tail.name}'\n", encoding="utf-8")
+        cmd = [exe, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(list_path)]
+        cmd += ["-i", str(source_path), "-map", "0:v:0", "-map", "1:a:0?", "-c", "copy"]
+        cmd += ["-t", f"{duration:.3f}", "-movflags", "+faststart", str(output_path)]
+        _run_ffmpeg(cmd, "구간 교체")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return str(output_path)
+
+
+def _stream_headers(exe: str, path: str | Path) -> dict[str, str]:
+    """framecrc 머리글 ("extradata 0", "dimensions 0", "media_type 1" 등 → 값). 패킷은 거의 읽지 않음."""
+    proc = _run_ffmpeg(
+        [exe, "-loglevel", "error", "-t", "0.05", "-i", str(path), "-map", "0", "-c", "copy", "-f", "framecrc", "-"],
+        "스트림 확인",
+    )
+    headers = {}
+    for line in proc.stdout.decode("utf-8", errors="replace").splitlines():
+        if line.startswith("#") and ":" in line:
+            key, value = line[1:].split(":", 1)
+            headers[key.strip()] = value.strip()
+    return headers
+
+
+def prepend_segment(
+    segment: Segment,
+    source_path: str,
+    output_path: str,
+    fps: int | None = None,
+    preset: str | None = None,
+) -> str:
+    """
+    이미 인코딩된 영상 앞에 구간 하나(썸네일 인트로 등)를 붙여 새 파일로 저장.
+    앞 구간만 원본과 같은 코덱 설정으로 인코딩하고 원본 영상은 스트림 복사 (재인코딩 없음),
+    음성은 앞 구간 길이만큼 늦춰 다시 인코딩. 코덱 머리글(SPS/PPS)이 원본과 다르면 RuntimeError.
+    """
+    exe = get_ffmpeg_exe()
+    if not exe:
+        raise RuntimeError("ffmpeg 실행 파일을 찾을 수 없습니다.")
+    fps = fps or config.VIDEO_FPS
+    _, threads = get_encode_settings()
+    delay = segment["n_frames"] / fps
+
+    out_dir = Path(output_path).resolve().parent
+    work_dir = Path(tempfile.mkdtemp(prefix="prepend_", dir=out_dir))
+    try:
+        head = _encode_part(exe, segment, work_dir / "head.mp4", fps, threads, preset)
+        source = _stream_headers(exe, source_path)
+        head_headers = _stream_headers(exe, head)
+        for key in ("extradata 0", "dimensions 0"):
+            if head_headers.get(key) != source.get(key):
+                raise RuntimeError(f"코덱 설정이 원본과 달라 이어 붙일 수 없음 ({key}: {head_headers.get(key)} ≠ {source.get(key)})")
+        # concat은 첫 파일의 스트림 구성을 따르므로 원본도 영상만 떼어 냄 (스트림 복사)
+        main = work_dir / "main.mp4"
+        _run_ffmpeg(
+            [exe, "-y", "-loglevel", "error", "-i", str(source_path), "-map", "0:v:0", "-c", "copy", str(main)],
+            "영상 추출",
+        )
+
+        list_path = work_dir / "parts.txt"
+        list_path.write_text(f"file '{head.name}'\nduration {delay:.6f}\nfile '{main.name}'\n", encoding="utf-8")
+        cmd = [exe, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(list_path)]
+        cmd += ["-i", str(source_path), "-map", "0:v:0", "-c:v", "copy"]
+        if any(v == "audio" for k, v in source.items() if k.startswith("media_type")):
+            delay_ms = int(round(delay * 1000))
+            cmd += ["-map", "1:a:0", "-af", f"adelay={delay_ms}:all=1", "-c:a", "aac", "-b:a", "192k"]
+        cmd += ["-movflags", "+faststart", str(output_path)]
+        _run_ffmpeg(cmd, "앞 구간 연결")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return str(output_path)
+
+
+def _concat_entry(path: Path, work_dir: Path) -> str:
+    """concat 목록 항목: 작업 폴더 안이면 파일 이름, 밖(구간 캐시)이면 절대 경로 (작은따옴표 이스케이프)"""
+    if path.parent == work_dir:
+        return path.name
+    return path.resolve().as_posix().replace("'", "'\\''")
+
+
+def _stream_clip(make_frames, n_frames: int, fps: int):
+    """
+    프레임 제너레이터를 인코더가 요청할 때 한 장씩 꺼내는 클립 (프레임 리스트를 메모리에 쌓지 않음).
+    make_frames: 호출 시 새 프레임 이터레이터를 반환하는 함수 (뒤로 되감을 때 다시 호출).
+    """
+    from moviepy.video.VideoClip import VideoClip
+
+    state = {"it": None, "idx": -1, "frame": None}
+
+    def make_frame(t):
+        fi = min(n_frames - 1, max(0, int(round(t * fps))))
+        if state["it"] is None or fi < state["idx"]:
+            state["it"] = iter(make_frames())
+            state["idx"] = -1
+        while state["idx"] < fi:
+            state["frame"] = next(state["it"])
+            state["idx"] += 1
+        return state["frame"]
+
+    clip = VideoClip(make_frame, duration=n_frames / fps)
+    # VideoClip 생성 시 크기 확인용으로 0번 프레임을 만들므로, 인코딩 전까지 제너레이터를 놓아 줌
+    state.update(it=None, idx=-1, frame=None)
+    return clip
+
+
+def _moviepy_audio(music: MusicTrack, need_dur: float):
+    """start초부터 need_dur만큼. 곡이 짧으면 남은 구간 + 처음부터 루프로 채움."""
+    from moviepy.audio.io.AudioFileClip import AudioFileClip
+
+    audio_src = AudioFileClip(music["path"])
+    start_offset = music["start"]
+    if start_offset >= audio_src.duration:
+        start_offset = 0
+    end_time = start_offset + need_dur
+    if end_time <= audio_src.duration:
+        return audio_src.subclip(start_offset, end_time)
+    # 남은 구간 + 앞부분 루프로 채움
+    from moviepy.audio.AudioClip import concatenate_audioclips
+    remaining = audio_src.duration - start_offset
+    n = int((need_dur - remaining) / audio_src.duration) + 1
+    parts = [audio_src.subclip(start_offset, audio_src.duration)]
+    parts.extend([audio_src] * n)
+    return concatenate_audioclips(parts).subclip(0, need_dur)
+
+
+def encode_moviepy(
+    segments: list[Segment],
+    output_path: str,
+    music: MusicTrack | None = None,
+    fps: int | None = None,
+    preset: str | None = None,
+) -> str:
+    """MoviePy 1.0.3 concatenate_videoclips + write_videofile (기존 방식)."""
+    from moviepy.video.VideoClip import ImageClip
+    from moviepy.video.compositing.concatenate import concatenate_videoclips
+
+    fps = fps or config.VIDEO_FPS
+    clips = []
+    for seg in segments:
+        if seg["kind"] == "still":
+            clips.append(ImageClip(seg["frame"]).set_duration(seg["n_frames"] / fps))
+        elif seg["kind"] == "file":
+            clips.append(_stream_clip(lambda seg=seg: iter_segment_frames(seg, fps), seg["n_frames"], fps))
+        else:
+            clips.append(_stream_clip(seg["make_frames"], seg["n_frames"], fps))
+    final = concatenate_videoclips(clips)
+    if music:
+        try:
+            delay = float(music.get("delay") or 0)
+            audio = _moviepy_audio(music, final.duration - delay)
+            if delay > 0:
+                from moviepy.audio.AudioClip import CompositeAudioClip
+
+                audio = CompositeAudioClip([audio.set_start(delay)]).set_duration(final.duration)
+            final = final.set_audio(audio)
+        except Exception as e:
+            print(f"⚠️ 배경음악 로드 실패, 무음으로 진행: {e}")
+    preset, threads = get_encode_settings(preset)
+    final.write_videofile(
+        str(output_path),
+        fps=fps,
+        codec="libx264",
+        audio_codec="aac",
+        preset=preset,
+        threads=threads or None,  # None이면 -threads를 빼서 ffmpeg 자동
+        ffmpeg_params=get_x264_params() or None,
+        logger=None,
+    )
+    final.close()
+    return str(output_path)
+
+
+def encode_segments(
+    segments: list[Segment],
+    output_path: str,
+    music: MusicTrack | None = None,
+    fps: int | None = None,
+    preset: str | None = None,
+) -> str:
+    """
+    config.VIDEO_ENCODER에 따라 인코딩. 구간별 병렬 → 한 번에 ffmpeg → MoviePy 순으로 폴백.
+    구간 캐시를 쓰는 구간(file 구간, cache_key)이 있으면 jobs=1이어도 구간별 인코딩 경로 사용.
+    preset: x264 프리셋 (없으면 인코더 프로필 → config.VIDEO_ENCODE_PRESET, 초안은 ultrafast)
+    """
+    backend = getattr(config, "VIDEO_ENCODER", "ffmpeg")
+    if backend == "ffmpeg":
+        if get_ffmpeg_exe():
+            jobs = get_encode_jobs()
+            # 구간 캐시·중복 프레임 합치기는 구간별 인코딩 경로에서만
+            uses_cache = any(seg["kind"] == "file" or seg.get("cache_key") for seg in segments)
+            if (jobs > 1 or uses_cache or is_dedupe_enabled()) and len(segments) > 1:
+                try:
+                    return encode_ffmpeg_segments(segments, output_path, music=music, fps=fps, jobs=jobs, preset=preset)
+                except Exception as e:
+                    print(f"⚠️ 구간별 병렬 인코딩 실패, 한 번에 인코딩으로 재시도: {e}")
+            try:
+                return encode_ffmpeg(segments, output_path, music=music, fps=fps, preset=preset)
+            except Exception as e:
+                print(f"⚠️ ffmpeg 직접 인코딩 실패, MoviePy로 재시도: {e}")
+        else:
+            print("⚠️ ffmpeg를 찾을 수 없어 MoviePy로 인코딩합니다.")
+    return encode_moviepy(segments, output_path, music=music, fps=fps, preset=preset)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+인코더 자동 조정 - 기준 숏츠를 x264 설정 격자(프리셋 × CRF × 스레드 수 × -tune stillimage)로 다시 인코딩해
+시간·크기·화질(SSIM)을 재고, 화질 하한을 넘는 설정 중 이 컴퓨터에 가장 좋은 것을 config.ENCODER_PROFILE_PATH에 저장.
+이후 영상 생성·썸네일 붙이기는 저장된 프로필을 자동으로 사용. 컴퓨터를 바꾸면 다시 실행.
+사용: python scripts/autotune_encoder.py [기준영상.mp4]   (없으면 고정 내용의 기준 숏츠를 한 번 만들어 재사용)
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config
+from modules.encoder_profile import autotune_encoder
+
+
+def _reference_video() -> str:
+    ref = Path(config.OUTPUT_DIR) / "autotune" / "reference.mp4"
+    if ref.exists():
+        print(f"📼 기준 영상 재사용: {ref}")
+        return str(ref)
+    from modules.tarot_video_generator import render_reference_video
+
+    ref.parent.mkdir(parents=True, exist_ok=True)
+    print("📼 기준 숏츠 생성 중 (고정 카드·배경·문구, GPT 없음)...")
+    render_reference_video(str(ref))
+    return str(ref)
+
+
+def main():
+    reference = sys.argv[1] if len(sys.argv) > 1 else _reference_video()
+    autotune_encoder(reference)
+
+
+if __name__ == "__main__":
+    main()
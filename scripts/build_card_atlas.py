@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+덱별 카드 아틀라스 생성 (렌더 프로필별). 영상 생성은 아틀라스를 만들지 않음 (없으면 카드를 직접 디코딩).
+덱을 내려받거나 바꾼 뒤 한 번 실행해 두면 영상마다 카드 디코딩 없이 시작. 용량은 CARD_ATLAS_MAX_MB까지.
+사용: python scripts/build_card_atlas.py [프로필 ...]   (기본: config.RENDER_PROFILE + 초안 프로필)
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config
+from modules import card_atlas
+from modules.layout import get_layout, get_profile_size
+from modules.tarot_deck import get_available_decks
+from modules.tarot_video_generator import _atlas_card_sizes
+
+
+def main():
+    profiles = sys.argv[1:] or [config.RENDER_PROFILE, getattr(config, "DRAFT_RENDER_PROFILE", "540p")]
+    decks = get_available_decks()
+    if not decks:
+        print("덱이 없습니다. '타로덱_다운로드.bat'을 먼저 실행하세요.")
+        return
+    for profile in dict.fromkeys(profiles):
+        sizes = _atlas_card_sizes(get_layout(*get_profile_size(profile)))
+        for deck_id in decks:
+            deck_path = config.TAROT_DIR / deck_id
+            if card_atlas.open_card_atlas(deck_path, sizes) is None:
+                card_atlas.build_card_atlas(deck_path, sizes)
+            else:
+                print(f"✓ {deck_id} ({profile}) 이미 있음")
+
+
+if __name__ == "__main__":
+    main()